@@ -0,0 +1,47 @@
+"""
+=============================================================================
+                    BM25 NUMBA KERNEL MODULE
+=============================================================================
+BM25 ka per-term accumulation loop Numba se machine code mein compile hota hai.
+searcher.bm25_scores_vectorized isko use karta hai jab numba installed ho -
+numpy expression ke temporaries (f, norm_factors[doc_ids], division result)
+aur kernel dispatch ka overhead hat jata hai.
+
+numba optional hai (requirements mein nahi) - na ho toh NUMBA_AVAILABLE False
+aur searcher numpy/pure-Python path pe rehta hai.
+
+Kernel nogil hai, isliye threads se call ho toh GIL nahi pakadta.
+
+Note: fastmath jaan-boojh kar off hai - woh FP reassociation allow karta hai,
+jisse scores Python loop se bit-for-bit match nahi karte aur tie-breaking
+(ranking order) badal sakta hai.
+=============================================================================
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _bm25_accumulate_kernel(scores, doc_ids, freqs, norm_factors, idf, k1_plus_1):
+    """
+    Ek term ki posting list ko dense score vector mein add karta hai:
+        scores[doc] += idf * (f * (k1 + 1)) / (f + norm_factors[doc])
+
+    Ek term ke andar doc IDs unique hain, isliye prange ke iterations
+    alag-alag slots likhte hain - koi race nahi.
+    """
+    for i in prange(len(doc_ids)):
+        doc = doc_ids[i]
+        f = float(freqs[i])
+        scores[doc] += idf * ((f * k1_plus_1) / (f + norm_factors[doc]))
+
+
+if NUMBA_AVAILABLE:
+    bm25_accumulate_kernel = njit(parallel=True, nogil=True, cache=True)(_bm25_accumulate_kernel)
+else:
+    bm25_accumulate_kernel = None
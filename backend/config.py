@@ -12,11 +12,21 @@ module easily access kar sake bina hardcoding ke.
 """
 
 import os
+import re
+import logging
+import multiprocessing
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Dict, Set
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, cached_property
+from typing import List, Dict, FrozenSet, Optional
 import json
 
+# google-re2 optional hai - install ho toh pure-ASCII text RE2 ke DFA engine se tokenize hota hai
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 @dataclass
 class CrawlerConfig:
@@ -25,7 +35,7 @@ class CrawlerConfig:
     Yeh decide karta hai ki kaunse documents crawl karne hain aur kaise.
     """
     # Kaunse file extensions support karein (text files hi lete hain)
-    SUPPORTED_EXTENSIONS: Set[str] = field(default_factory=lambda: {'.txt', '.md', '.json'})
+    SUPPORTED_EXTENSIONS: FrozenSet[str] = field(default_factory=lambda: frozenset({'.txt', '.md', '.json'}))
     
     # Maximum file size in bytes (10 MB se zyada ke files skip karenge)
     MAX_FILE_SIZE: int = 10 * 1024 * 1024
@@ -37,6 +47,36 @@ class CrawlerConfig:
     IGNORE_PATTERNS: List[str] = field(default_factory=lambda: [
         '__pycache__', '.git', 'node_modules', '.env', 'venv'
     ])
+    
+    # Parallel file reading ke liye thread pool ka size
+    # (file I/O GIL release karta hai, isliye threads kaafi hain)
+    MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+    
+    # Duplicate detection ka Bloom pre-filter (rbloom install ho tab) kitne
+    # documents ke liye size karein aur kitna false positive rate chalega.
+    # Isse zyada hashes aaye toh filter double size pe rebuild hota hai
+    DEDUP_EXPECTED_ITEMS: int = 1_000_000
+    DEDUP_FALSE_POSITIVE_RATE: float = 1e-6
+    
+    # Exact dedup store mein zyada se zyada itne hashes rakhenge.
+    # Isse upar purane hashes nikal diye jaate hain - long-running crawls mein
+    # memory bounded rehti hai, par bahut purani file ka duplicate pakda nahi jaayega.
+    MAX_DEDUP_ENTRIES: int = 1_000_000
+    
+    def __post_init__(self):
+        # Extensions pehle se lowercase frozenset mein - per-file check sirf ek hash lookup
+        self.SUPPORTED_EXTENSIONS = frozenset(ext.lower() for ext in self.SUPPORTED_EXTENSIONS)
+        
+        # Saare ignore patterns ek compiled regex alternation mein -
+        # per-file M substring checks ki jagah ek C-level scan
+        self._ignore_re = (
+            re.compile('|'.join(map(re.escape, self.IGNORE_PATTERNS)))
+            if self.IGNORE_PATTERNS else None
+        )
+    
+    def is_ignored(self, path: str) -> bool:
+        """Check karta hai ki path mein koi ignore pattern aata hai ya nahi."""
+        return self._ignore_re is not None and self._ignore_re.search(path) is not None
 
 
 @dataclass
@@ -55,16 +95,65 @@ class IndexerConfig:
     CASE_SENSITIVE: bool = False
     
     # Stop words list - yeh common words index mein nahi jayenge
-    STOP_WORDS: Set[str] = field(default_factory=lambda: {
-        'hai', 'hain', 'tha', 'the', 'ho', 'hu', 'hoga', 'hogi',  # Hindi common
+    # (frozenset: fast membership check, aur galti se mutate bhi nahi hota)
+    STOP_WORDS: FrozenSet[str] = field(default_factory=lambda: frozenset({
+        'hai', 'hain', 'tha', 'the', 'ho', 'hu', 'hoga', 'hogi',  # Hindi common ('the' English bhi)
         'is', 'are', 'was', 'were', 'be', 'been', 'being',        # English common
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+        'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
         'to', 'for', 'of', 'with', 'by', 'from', 'as', 'it', 'this',
         'that', 'these', 'those', 'i', 'you', 'he', 'she', 'we', 'they'
-    })
+    }))
     
     # TF-IDF ka smoothing parameter (divide by zero se bachne ke liye)
     SMOOTHING_FACTOR: float = 1.0
+    
+    # Postings mein word positions bhi store karein? Abhi ranking sirf frequency
+    # use karti hai - phrase/proximity search aaye tab True karna
+    STORE_POSITIONS: bool = False
+    
+    # Itne ya zyada documents ke batch mein tokenization worker processes mein hoti hai
+    # (chhote batches pe process startup + IPC ka cost faayde se zyada hai)
+    PARALLEL_MIN_DOCS: int = 500
+    INDEX_WORKERS: int = os.cpu_count() or 1
+    
+    # Har indexed document ki [INDEXED] line print karein? Bade corpus pe
+    # per-doc print khud indexing ka bada hissa kha jaata hai (progress har
+    # 100 docs pe waise bhi dikhta hai)
+    VERBOSE: bool = False
+    
+    def __post_init__(self):
+        self.STOP_WORDS = frozenset(self.STOP_WORDS)
+    
+    @cached_property
+    def token_re(self) -> re.Pattern:
+        """
+        Tokenizer ka compiled regex jisme word length limits bhi shamil hain -
+        MIN/MAX_WORD_LENGTH se bahar ke words regex hi reject kar deta hai,
+        Python mein har token ka len() check nahi karna padta.
+        
+        Pehli access pe compile hota hai; uske baad MIN/MAX badle toh
+        `del config.token_re` karke dobara compile karwana hoga.
+        """
+        return re.compile(
+            rf'\b[a-zA-Z0-9\u0900-\u097F]{{{self.MIN_WORD_LENGTH},{self.MAX_WORD_LENGTH}}}\b'
+        )
+    
+    @cached_property
+    def ascii_token_re(self):
+        """
+        Pure-ASCII text (zyada tar corpus) ke liye token_re ka version - Devanagari
+        range wahan kabhi match nahi hoti, aur ASCII mode mein \b / character class
+        Unicode tables nahi dekhte. RE2 install ho toh wahi (linear-time DFA);
+        RE2 ka \b waise bhi sirf ASCII samajhta hai, isliye Unicode text pe
+        hamesha token_re hi chalta hai. Dono engines ka result same hai.
+        
+        token_re ki tarah ek hi baar compile hota hai (har TextPreprocessor /
+        worker process mein dobara nahi).
+        """
+        pattern = rf'\b[a-zA-Z0-9]{{{self.MIN_WORD_LENGTH},{self.MAX_WORD_LENGTH}}}\b'
+        if re2 is not None:
+            return re2.compile(pattern)
+        return re.compile(pattern, re.ASCII)
 
 
 @dataclass
@@ -88,6 +177,63 @@ class SearcherConfig:
     
     # Fuzzy matching ka threshold (0.8 = 80% match chahiye)
     FUZZY_MATCH_THRESHOLD: float = 0.8
+    
+    # Results mein tf_score / idf_score (debugging breakdown) bharna hai ya nahi -
+    # off ho toh har result pe yeh extra lookups nahi hote aur fields 0.0 rehti hain
+    DEBUG_SCORES: bool = False
+    
+    # Badi queries ka numpy BM25 scoring kitne threads mein doc-ID ranges baant
+    # ke chale (1 = single-threaded). Pool process-wide shared hai, toh kitni bhi
+    # concurrent searches hon itne hi threads chalte hain. Server default mein ek
+    # hi worker process hai; cap 4 isliye ki scoring jaldi memory bandwidth pe
+    # ruk jaati hai aur baaki cores background indexing job ke processes ke liye
+    # bache rehte hain. WORKERS > 1 chalao toh har process ka apna pool banta hai -
+    # tab ise cores / WORKERS tak ghata lena
+    SCORING_THREADS: int = min(4, os.cpu_count() or 1)
+
+
+def _public_fields(sub_config) -> Dict:
+    """Sub-config ke declared settings return karta hai (compiled caches jaise _ignore_re, token_re chhod ke)."""
+    return {f.name: getattr(sub_config, f.name) for f in fields(sub_config)}
+
+
+@lru_cache(maxsize=1)
+def _paths_as_strings(paths: 'Paths') -> Dict[str, str]:
+    """
+    Paths ka string dict (to_dict ke liye). Paths frozen hai aur hashable bhi,
+    isliye yeh safely cache ho sakta hai - CONFIG.paths badla toh key hi badal jaayegi.
+    """
+    return {k: str(v) for k, v in paths.as_dict().items()}
+
+
+@dataclass(frozen=True, slots=True)
+class Paths:
+    """
+    Project ke saare important directory paths.
+    Plain attributes hain (dict nahi), toh `paths.STORAGE_DIR` seedha slot read hai.
+    
+    Directories yahan create nahi hoti - jise likhna hai woh khud ensure kare
+    (jaise SearchEngineConfig.get_storage_path).
+    """
+    BACKEND_DIR: Path
+    STORAGE_DIR: Path
+    DATA_DIR: Path
+    DOCUMENTS_DIR: Path
+    FRONTEND_DIR: Path
+    
+    def __getitem__(self, name: str) -> Path:
+        """
+        Purane `paths['STORAGE_DIR']` style ke liye backward compat.
+        Naya code attribute access use kare.
+        """
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+    
+    def as_dict(self) -> Dict[str, Path]:
+        """Saare paths ko {name: Path} dictionary mein return karta hai."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class SearchEngineConfig:
@@ -105,9 +251,16 @@ class SearchEngineConfig:
         # Yeh file backend/config.py mein hai, toh 2 level up jayenge
         self.ROOT_DIR: Path = Path(__file__).parent.parent.absolute()
         
+        # ROOT_DIR ka string prefix (trailing separator ke saath) - doc IDs
+        # banane ke liye simple startswith/slice, har file pe relative_to nahi
+        self.ROOT_PREFIX: str = os.path.join(str(self.ROOT_DIR), '')
+        
         # Saare important paths define kar rahe hain
         self.paths = self._setup_paths()
         
+        # Storage directory pehli baar get_storage_path() pe create hogi
+        self._storage_ready: bool = False
+        
         # Sub-configurations initialize kar rahe hain
         self.crawler = CrawlerConfig()
         self.indexer = IndexerConfig()
@@ -117,26 +270,19 @@ class SearchEngineConfig:
         self.DEBUG: bool = os.getenv('DEBUG', 'false').lower() == 'true'
         self.LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
         
-    def _setup_paths(self) -> Dict[str, Path]:
+    def _setup_paths(self) -> Paths:
         """
         Saare directory paths setup karta hai.
-        Agar koi directory exist nahi karti toh create bhi kar deta hai.
-        """
-        paths = {
-            'BACKEND_DIR': self.ROOT_DIR / 'backend',
-            'STORAGE_DIR': self.ROOT_DIR / 'backend' / 'storage',
-            'DATA_DIR': self.ROOT_DIR / 'data',
-            'DOCUMENTS_DIR': self.ROOT_DIR / 'data' / 'documents',
-            'FRONTEND_DIR': self.ROOT_DIR / 'frontend',
-        }
-        
-        # Ensure all directories exist
-        for path_name, path_obj in paths.items():
-            if not path_obj.exists():
-                path_obj.mkdir(parents=True, exist_ok=True)
-                print(f"[INFO] Directory create ki gayi: {path_obj}")
-                
-        return paths
+        Import/startup pe koi mkdir nahi hota - storage directory pehli baar
+        get_storage_path() call hone pe create hoti hai.
+        """
+        return Paths(
+            BACKEND_DIR=self.ROOT_DIR / 'backend',
+            STORAGE_DIR=self.ROOT_DIR / 'backend' / 'storage',
+            DATA_DIR=self.ROOT_DIR / 'data',
+            DOCUMENTS_DIR=self.ROOT_DIR / 'data' / 'documents',
+            FRONTEND_DIR=self.ROOT_DIR / 'frontend',
+        )
     
     def get_storage_path(self, filename: str) -> Path:
         """
@@ -148,28 +294,80 @@ class SearchEngineConfig:
         Returns:
             Path object with full path
         """
-        return self.paths['STORAGE_DIR'] / filename
+        storage_dir = self.paths.STORAGE_DIR
+        
+        if not self._storage_ready:
+            if not storage_dir.exists():
+                storage_dir.mkdir(parents=True, exist_ok=True)
+                print(f"[INFO] Directory create ki gayi: {storage_dir}")
+            self._storage_ready = True
+        
+        return storage_dir / filename
+    
+    def process_context(self):
+        """
+        Worker processes (indexing pools) ke liye multiprocessing context.
+        
+        Server threads (event loop, httpx, thread pools) ke beech fork karna
+        safe nahi - child mein kisi aur thread ka pakda hua lock hamesha ke liye
+        locked reh sakta hai. Isliye forkserver (Linux) ya spawn: workers saaf
+        process se shuru hote hain.
+        """
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context('forkserver')
+        return multiprocessing.get_context('spawn')
+    
+    def setup_logging(self):
+        """
+        LOG_LEVEL ke hisaab se root logger configure karta hai.
+        Entry points (main.py, module __main__ blocks) isse ek baar call karte hain.
+        """
+        logging.basicConfig(
+            level=getattr(logging, self.LOG_LEVEL.upper(), logging.INFO),
+            format='[%(levelname)s] %(name)s: %(message)s'
+        )
     
     def to_dict(self) -> Dict:
         """
         Poori configuration ko dictionary mein convert karta hai.
         Useful hai debugging ke liye ya config export karne ke liye.
+        
+        Paths immutable hain isliye unka dict cached hai; sub-configs runtime pe
+        badal sakte hain (jaise crawl_documents RECURSIVE_CRAWLING toggle karta hai),
+        isliye woh har call pe fresh padhe jaate hain.
         """
         return {
-            'paths': {k: str(v) for k, v in self.paths.items()},
-            'crawler': self.crawler.__dict__,
-            'indexer': self.indexer.__dict__,
-            'searcher': self.searcher.__dict__,
+            'paths': dict(_paths_as_strings(self.paths)),
+            'crawler': _public_fields(self.crawler),
+            'indexer': _public_fields(self.indexer),
+            'searcher': _public_fields(self.searcher),
             'debug': self.DEBUG,
             'log_level': self.LOG_LEVEL
         }
 
 
-# Global config instance - isse poori application mein import karke use karenge
-# Singleton pattern follow ho raha hai yahan
-CONFIG = SearchEngineConfig()
+# Global config instance - isse poori application mein import karke use karenge.
+# Singleton pattern follow ho raha hai yahan, lekin instance lazily banta hai:
+# `from config import CONFIG` ya `config.CONFIG` pehli baar access hone pe hi
+# SearchEngineConfig() construct hota hai (PEP 562 module __getattr__).
+_config: Optional[SearchEngineConfig] = None
+
+
+def get_config() -> SearchEngineConfig:
+    """Singleton config instance return karta hai (pehli call pe create hota hai)."""
+    global _config
+    if _config is None:
+        _config = SearchEngineConfig()
+    return _config
+
+
+def __getattr__(name: str):
+    if name == 'CONFIG':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Agar is file ko directly run karein toh config print hogi (testing ke liye)
 if __name__ == "__main__":
     print("🔧 Search Engine Configuration:")
-    print(json.dumps(CONFIG.to_dict(), indent=2, default=str))
\ No newline at end of file
+    print(json.dumps(get_config().to_dict(), indent=2, default=str))
\ No newline at end of file
@@ -19,30 +19,207 @@ Architecture:
 
 import os
 import json
+import logging
+import stat
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Iterator, Optional, Callable
+from typing import List, Dict, Iterator, Optional, Callable, Tuple
 from datetime import datetime
+from functools import lru_cache
 import mimetypes
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+
+# orjson optional hai - install ho toh JSON parsing/dumping uske C/SIMD path se hogi
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# charset-normalizer optional hai - non-UTF-8 text files ka encoding detect karne ke liye
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+# rbloom optional hai - install ho toh duplicate detection Bloom filter se hogi
+try:
+    import rbloom
+except ImportError:
+    rbloom = None
 
 # Local imports
-from models import Document, DocumentType
+from models import Document, DocumentType, content_hasher
 from config import CONFIG
 
+logger = logging.getLogger(__name__)
+
+
+# File ek baar mein itne bytes padhte hain (hashing bhi isi chunk pe hoti hai)
+READ_CHUNK_SIZE = 64 * 1024
+
+def _read_and_hash(file_path: Path, file_size: Optional[int] = None) -> Tuple[bytes, str]:
+    """
+    File ko binary mode mein padhta hai aur saath hi hash karta hai.
+    Isse content ko hashing ke liye dobara scan nahi karna padta.
+    
+    Walk ke stat se mila size pass karo toh fstat nahi hota - raw fd pe
+    file (badi ho toh bhi) ek hi os.read mein aa jaati hai (open + read +
+    close, bas) aur bytes ki sirf ek copy banti hai.
+    
+    Args:
+        file_path: File ka path
+        file_size: Pehle se pata size (None ho toh fstat karenge)
+        
+    Returns:
+        (raw bytes, hex digest) tuple
+    """
+    hasher = content_hasher()
+    fd = os.open(file_path, os.O_RDONLY)
+    
+    try:
+        if file_size is None:
+            file_size = os.fstat(fd).st_size
+        
+        # Size + 1 maangte hain: theek size jitne bytes aaye matlab EOF aa gaya,
+        # toh aam case mein ek hi read syscall lagta hai. File beech mein badli
+        # ho ya read chhota lauta (bahut badi files pe kernel ek read ~2 GB tak
+        # hi deta hai) toh baaki EOF tak chunks mein padh lete hain.
+        data = os.read(fd, file_size + 1)
+        hasher.update(data)
+        if len(data) == file_size:
+            return data, hasher.hexdigest()
+        
+        chunks = [data]
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            hasher.update(chunk)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    
+    return b''.join(chunks), hasher.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _timestamp_to_datetime(timestamp: float) -> datetime:
+    """
+    datetime.fromtimestamp ka cached version (local timezone lookup har baar nahi).
+    Key exact timestamp hai, isliye value bilkul same rehti hai - bulk copy/untar
+    ke baad bahut si files ka mtime same hota hai, wahan cache hit milta hai.
+    datetime immutable hai, toh same object share karna safe hai.
+    """
+    return datetime.fromtimestamp(timestamp)
+
+
+class SeenHashes:
+    """
+    Crawl ke dauraan dekhe gaye content hashes ka record (duplicate detection).
+    
+    Asli record exact store hai (OrderedDict) jo max_entries pe capped hai -
+    naye hash ke liye sabse purana nikalta hai. Trade-off: nikle hue hash ka
+    duplicate dobara aaye toh index ho jaayega.
+    
+    rbloom available ho toh Bloom filter aage pre-filter ki tarah lagta hai -
+    Bloom miss pakka naya hash hai, exact store tak jaana hi nahi padta. Bloom
+    hit akela duplicate nahi maana jaata (false positive ho sakta hai), exact
+    store mein mile tabhi - isliye koi naya document galti se skip nahi hota.
+    expected_items se zyada hashes aa jaayein toh Bloom bada karke exact store
+    se dobara bhara jaata hai, warna uska false positive rate badhta jaata.
+    """
+    
+    def __init__(self, expected_items: int, false_positive_rate: float, max_entries: int):
+        self.expected_items = expected_items
+        self.false_positive_rate = false_positive_rate
+        self.max_entries = max_entries
+        self._count = 0
+        self._items = OrderedDict()
+        self._bloom = self._new_bloom()
+    
+    def _new_bloom(self):
+        if rbloom is None:
+            return None
+        return rbloom.Bloom(self.expected_items, self.false_positive_rate)
+    
+    def __contains__(self, content_hash: str) -> bool:
+        if self._bloom is not None and content_hash not in self._bloom:
+            return False
+        return content_hash in self._items
+    
+    def add(self, content_hash: str):
+        # Dobara aaya hash sabse naya ban jaata hai (LRU order)
+        if content_hash in self._items:
+            self._items.move_to_end(content_hash)
+            return
+        
+        self._items[content_hash] = True
+        if len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+        self._count += 1
+        
+        if self._bloom is not None:
+            self._bloom.add(content_hash)
+            if self._count > self.expected_items:
+                self._grow_bloom()
+    
+    def _grow_bloom(self):
+        """Bloom ko double capacity ke saath exact store ke hashes se dobara banata hai."""
+        logger.warning(
+            "Dedup Bloom filter capacity (%d) exceed ho gayi, %d ke liye rebuild kar rahe hain",
+            self.expected_items, self.expected_items * 2
+        )
+        self.expected_items *= 2
+        self._bloom = self._new_bloom()
+        for content_hash in self._items:
+            self._bloom.add(content_hash)
+        self._count = len(self._items)
+    
+    def clear(self):
+        self._items = OrderedDict()
+        self._bloom = self._new_bloom()
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 class FileHandler:
     """
     Base class for different file type handlers.
     Har file type ke liye alag handler hoga iska subclass banake.
+    
+    Subclass EXTENSIONS mein apne lowercase extensions declare kare -
+    crawler unse extension -> handler lookup table banata hai.
+    Subclass ko decode_content ya decode_with_encoding mein se kam se kam
+    ek override karna hai (dono ek dusre ke default hain).
     """
+    EXTENSIONS: Tuple[str, ...] = ()
     
     def can_handle(self, file_path: Path) -> bool:
         """Check karta hai ki yeh handler iss file type ko handle kar sakta hai."""
-        raise NotImplementedError
+        return file_path.suffix.lower() in self.EXTENSIONS
     
     def extract_content(self, file_path: Path) -> str:
         """File se text content extract karta hai."""
-        raise NotImplementedError
+        with open(file_path, 'rb') as f:
+            return self.decode_content(f.read())
+    
+    def decode_content(self, raw: bytes) -> str:
+        """
+        Pehle se padhe hue raw bytes ko text content mein convert karta hai.
+        Crawler file khud padhta hai (hashing ke saath), phir yeh call karta hai.
+        """
+        return self.decode_with_encoding(raw)[0]
+    
+    def decode_with_encoding(self, raw: bytes) -> Tuple[str, str]:
+        """
+        decode_content jaisa hi, lekin saath mein use hua encoding bhi batata hai.
+        Default: content UTF-8 maana jaata hai.
+        
+        Returns:
+            (text content, encoding name) tuple
+        """
+        return self.decode_content(raw), 'utf-8'
     
     def get_doc_type(self) -> DocumentType:
         """Document type return karta hai."""
@@ -54,28 +231,26 @@ class TextFileHandler(FileHandler):
     Plain text files (.txt) handle karta hai.
     Encoding detection ke saath - UTF-8 prefer karte hain.
     """
+    EXTENSIONS = ('.txt',)
     
-    def can_handle(self, file_path: Path) -> bool:
-        return file_path.suffix.lower() == '.txt'
-    
-    def extract_content(self, file_path: Path) -> str:
+    def decode_with_encoding(self, raw: bytes) -> Tuple[str, str]:
         """
-        Text file read karta hai with encoding fallback.
-        Pehle UTF-8 try karte hain, fail ho toh latin-1.
+        Text bytes decode karta hai with encoding fallback.
+        Pehle strict UTF-8 try karte hain (zyada tar files yahin nipat jaati hain).
+        Fail ho toh charset-normalizer (agar installed hai) se ek hi baar mein
+        encoding detect karte hain, warna latin-1 - jo kabhi fail nahi hota.
         """
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+        try:
+            return raw.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            pass
         
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
+        if charset_normalizer is not None:
+            best = charset_normalizer.from_bytes(raw).best()
+            if best is not None:
+                return str(best), best.encoding
         
-        # Agar sab fail ho gaye toh binary read karke decode karenge
-        # errors='ignore' se problematic characters skip ho jayenge
-        with open(file_path, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
+        return raw.decode('latin-1'), 'latin-1'
     
     def get_doc_type(self) -> DocumentType:
         return DocumentType.TEXT
@@ -86,14 +261,11 @@ class MarkdownFileHandler(FileHandler):
     Markdown files (.md) handle karta hai.
     Future mein YAML frontmatter bhi parse kar sakte hain.
     """
+    EXTENSIONS = ('.md',)
     
-    def can_handle(self, file_path: Path) -> bool:
-        return file_path.suffix.lower() == '.md'
-    
-    def extract_content(self, file_path: Path) -> str:
+    def decode_content(self, raw: bytes) -> str:
         # Same as text file for now, but can add markdown-specific processing
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return raw.decode('utf-8')
     
     def get_doc_type(self) -> DocumentType:
         return DocumentType.MARKDOWN
@@ -104,18 +276,15 @@ class JSONFileHandler(FileHandler):
     JSON files handle karta hai.
     Nested JSON se text fields extract kar sakta hai.
     """
+    EXTENSIONS = ('.json',)
     
-    def can_handle(self, file_path: Path) -> bool:
-        return file_path.suffix.lower() == '.json'
-    
-    def extract_content(self, file_path: Path) -> str:
+    def decode_content(self, raw: bytes) -> str:
         """
-        JSON file se text content extract karta hai.
+        JSON bytes se text content extract karta hai.
         Agar 'content' ya 'text' field hai toh woh lete hain,
         warna poora JSON stringify kar dete hain.
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self._loads(raw)
         
         # Agar string hai toh directly return
         if isinstance(data, str):
@@ -126,12 +295,36 @@ class JSONFileHandler(FileHandler):
             for key in ['content', 'text', 'body', 'description', 'data']:
                 if key in data and isinstance(data[key], str):
                     return data[key]
-            
-            # Koi specific field nahi mila toh poora JSON as text
-            return json.dumps(data, indent=2)
         
-        # List ya koi aur type hai toh JSON stringify
-        return json.dumps(data, indent=2)
+        # Koi specific field nahi mila / list ya koi aur type hai toh JSON stringify
+        return self._dumps(data)
+    
+    @staticmethod
+    def _loads(raw: bytes):
+        """JSON parse karta hai - orjson ho toh usse, warna stdlib json se."""
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson NaN/Infinity aur 64-bit se bade ints reject karta hai,
+                # stdlib json unhe accept karta hai - ek baar woh bhi try karte hain
+                pass
+        return json.loads(raw)
+    
+    @staticmethod
+    def _dumps(data) -> str:
+        """
+        Parsed JSON ko indented text mein wapas likhta hai (indexing ke liye).
+        Non-ASCII characters escape nahi hote taaki tokenizer unhe words ki
+        tarah pakad sake.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+            except TypeError:
+                # Jo values orjson serialize nahi kar pata (e.g. bade ints)
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False)
     
     def get_doc_type(self) -> DocumentType:
         return DocumentType.JSON
@@ -157,6 +350,11 @@ class DocumentCrawler:
             JSONFileHandler(),
         ]
         
+        # Extension -> handler lookup table (har file pe handlers ka loop nahi chalega)
+        self._handlers_by_ext: Dict[str, FileHandler] = {
+            ext: handler for handler in self.handlers for ext in handler.EXTENSIONS
+        }
+        
         # Statistics tracking
         self.stats = {
             'files_processed': 0,
@@ -166,7 +364,14 @@ class DocumentCrawler:
         }
         
         # Duplicate detection ke liye
-        self.seen_hashes: set = set()
+        self.seen_hashes = SeenHashes(
+            CONFIG.crawler.DEDUP_EXPECTED_ITEMS,
+            CONFIG.crawler.DEDUP_FALSE_POSITIVE_RATE,
+            CONFIG.crawler.MAX_DEDUP_ENTRIES
+        )
+        
+        # Worker threads se stats update karne ke liye lock
+        self._stats_lock = threading.Lock()
         
         # Callback for progress updates (optional)
         self.progress_callback: Optional[Callable] = None
@@ -186,7 +391,7 @@ class DocumentCrawler:
             try:
                 self.progress_callback(message, current, total)
             except Exception as e:
-                print(f"[WARNING] Progress callback error: {e}")
+                logger.warning("Progress callback error: %s", e)
     
     def _get_handler(self, file_path: Path) -> Optional[FileHandler]:
         """
@@ -198,53 +403,82 @@ class DocumentCrawler:
         Returns:
             Suitable FileHandler ya None agar koi handler nahi mila
         """
+        handler = self._handlers_by_ext.get(file_path.suffix.lower())
+        if handler is not None:
+            return handler
+        
+        # Table mein nahi mila - shayad baad mein self.handlers mein koi
+        # custom handler add hua ho, toh purana can_handle loop try karte hain
         for handler in self.handlers:
             if handler.can_handle(file_path):
                 return handler
         return None
     
-    def _should_process_file(self, file_path: Path) -> bool:
+    def _should_process_file(
+        self,
+        file_path: Path,
+        file_size: Optional[int] = None,
+        suffix: Optional[str] = None
+    ) -> bool:
         """
         Check karta hai ki file process karni hai ya nahi.
         Size, extension, aur ignore patterns check karta hai.
         
         Args:
             file_path: Check karne ke liye file path
+            file_size: Walk ke stat se mila size (na ho toh yahan stat hoga)
+            suffix: Pehle se lowercase kiya hua extension
             
         Returns:
             True agar process karni hai, False otherwise
         """
-        # Check karein ki file exist karti hai aur readable hai
-        if not file_path.exists() or not file_path.is_file():
-            return False
+        # Check karein ki file exist karti hai aur regular file hai
+        # (walker sirf regular files deta hai, isliye size mila toh check ho chuka)
+        if file_size is None:
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                return False
+            
+            if not stat.S_ISREG(file_stat.st_mode):
+                return False
+            file_size = file_stat.st_size
         
         # Extension check
-        if file_path.suffix.lower() not in CONFIG.crawler.SUPPORTED_EXTENSIONS:
+        if suffix is None:
+            suffix = file_path.suffix.lower()
+        if suffix not in CONFIG.crawler.SUPPORTED_EXTENSIONS:
             self.stats['files_skipped'] += 1
             return False
         
         # File size check
-        file_size = file_path.stat().st_size
         if file_size > CONFIG.crawler.MAX_FILE_SIZE:
-            print(f"[SKIP] File bohot badi hai: {file_path} ({file_size} bytes)")
+            logger.debug("Skip (file bohot badi hai): %s size=%d", file_path, file_size)
             self.stats['files_skipped'] += 1
             return False
         
         # Ignore patterns check
-        path_str = str(file_path)
-        for pattern in CONFIG.crawler.IGNORE_PATTERNS:
-            if pattern in path_str:
-                self.stats['files_skipped'] += 1
-                return False
+        if CONFIG.crawler.is_ignored(str(file_path)):
+            self.stats['files_skipped'] += 1
+            return False
         
         return True
     
-    def _create_document(self, file_path: Path) -> Optional[Document]:
+    def _build_document(
+        self,
+        file_path: Path,
+        file_size: Optional[int] = None,
+        mtime: Optional[float] = None,
+        ctime: Optional[float] = None
+    ) -> Optional[Document]:
         """
-        File se Document object create karta hai.
+        File read karke Document object banata hai (duplicate check ke bina).
+        Yeh method thread-safe hai - crawl_directory isse worker threads mein chalata hai.
         
         Args:
             file_path: Document file ka path
+            file_size, mtime, ctime: Walk ke dauraan liye stat ke fields
+                (teeno mile toh dobara stat nahi hoga)
             
         Returns:
             Document object ya None agar error aaya
@@ -254,58 +488,116 @@ class DocumentCrawler:
             return None
         
         try:
-            # Content extract karte hain
-            content = handler.extract_content(file_path)
+            # File ek hi pass mein padhte aur hash karte hain
+            raw, content_hash = _read_and_hash(file_path, file_size)
+            
+            # Pehle accept ho chuke document ka duplicate hai toh decode hi nahi karenge.
+            # seen_hashes sirf consumer thread likhta hai, file order mein - isliye
+            # yahan jo hash mila woh hamesha kisi pehle wali file ka hai.
+            if content_hash in self.seen_hashes:
+                logger.debug("Skip (duplicate): %s", file_path)
+                return None
+            
+            # Content decode karte hain
+            content, encoding = handler.decode_with_encoding(raw)
             
             # Agar content empty hai toh skip karenge
             if not content or not content.strip():
-                print(f"[SKIP] Empty file: {file_path}")
+                logger.debug("Skip (empty): %s", file_path)
                 return None
             
-            # File stats lete hain
-            file_stat = file_path.stat()
+            # File stats lete hain (agar walker ne nahi diye)
+            if file_size is None or mtime is None or ctime is None:
+                file_stat = file_path.stat()
+                file_size = file_stat.st_size
+                mtime = file_stat.st_mtime
+                ctime = file_stat.st_ctime
             
-            # Document ID generate karte hain (relative path use karte hain)
-            try:
-                doc_id = str(file_path.relative_to(CONFIG.ROOT_DIR))
-            except ValueError:
-                # Agar relative path nahi ban sakta toh absolute use karenge
-                doc_id = str(file_path)
+            # Document ID generate karte hain (ROOT_DIR ke relative path use karte hain).
+            # ROOT_DIR ke bahar ki file ho toh path jaisa hai waisa hi.
+            path_str = str(file_path)
+            root_prefix = CONFIG.ROOT_PREFIX
+            if path_str.startswith(root_prefix):
+                doc_id = path_str[len(root_prefix):]
+            else:
+                doc_id = path_str
             
-            # Document object create karte hain
-            doc = Document(
+            # Document object create karte hain. Saari values yahin bani hain aur sahi
+            # types mein hain, isliye model_construct - har file pe Pydantic validation nahi
+            doc = Document.model_construct(
                 doc_id=doc_id,
                 file_path=str(file_path.absolute()),
                 doc_type=handler.get_doc_type(),
                 content=content,
-                file_size=file_stat.st_size,
-                modified_at=datetime.fromtimestamp(file_stat.st_mtime),
-                created_at=datetime.fromtimestamp(file_stat.st_ctime)
+                content_hash=content_hash,
+                encoding=encoding,
+                file_size=file_size,
+                modified_at=_timestamp_to_datetime(mtime),
+                created_at=_timestamp_to_datetime(ctime)
             )
             
-            # Content hash calculate karte hain (duplicate detection ke liye)
-            content_hash = doc.compute_hash()
-            
-            # Duplicate check
-            if content_hash in self.seen_hashes:
-                print(f"[SKIP] Duplicate file: {file_path}")
-                return None
-            
-            self.seen_hashes.add(content_hash)
-            
             # Title extract karte hain
             doc.extract_title()
             
-            self.stats['files_processed'] += 1
-            self.stats['total_size'] += file_stat.st_size
-            
             return doc
             
         except Exception as e:
-            print(f"[ERROR] File process karne mein error: {file_path} - {str(e)}")
-            self.stats['errors'] += 1
+            logger.error("File process karne mein error: %s - %s", file_path, e)
+            with self._stats_lock:
+                self.stats['errors'] += 1
             return None
     
+    def _accept_document(self, doc: Optional[Document]) -> Optional[Document]:
+        """
+        Duplicate check karke document ko accept karta hai aur stats update karta hai.
+        Hamesha ek hi thread se call hota hai taaki file order ke hisaab se
+        pehla document hi rakha jaaye.
+        
+        Args:
+            doc: _build_document ka result
+            
+        Returns:
+            Document object ya None agar duplicate hai
+        """
+        if doc is None:
+            return None
+        
+        # Duplicate check
+        if doc.content_hash in self.seen_hashes:
+            logger.debug("Skip (duplicate): %s", doc.file_path)
+            return None
+        
+        self.seen_hashes.add(doc.content_hash)
+        
+        with self._stats_lock:
+            self.stats['files_processed'] += 1
+            self.stats['total_size'] += doc.file_size
+        
+        return doc
+    
+    def _create_document(
+        self,
+        file_path: Path,
+        file_stat: Optional[os.stat_result] = None
+    ) -> Optional[Document]:
+        """
+        File se Document object create karta hai.
+        
+        Args:
+            file_path: Document file ka path
+            file_stat: Pehle se liya hua stat result (optional)
+            
+        Returns:
+            Document object ya None agar error aaya
+        """
+        if file_stat is None:
+            doc = self._build_document(file_path)
+        else:
+            doc = self._build_document(
+                file_path, file_stat.st_size, file_stat.st_mtime, file_stat.st_ctime
+            )
+        return self._accept_document(doc)
+    
     def crawl_file(self, file_path: str) -> Optional[Document]:
         """
         Single file crawl karta hai.
@@ -318,20 +610,66 @@ class DocumentCrawler:
         """
         path = Path(file_path)
         
-        if not self._should_process_file(path):
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return None
+        
+        if not stat.S_ISREG(file_stat.st_mode):
             return None
         
-        return self._create_document(path)
+        if not self._should_process_file(path, file_stat.st_size):
+            return None
+        
+        return self._create_document(path, file_stat)
     
-    def crawl_directory(self, directory_path: str) -> Iterator[Document]:
+    def _walk_files(self, root_path: Path) -> Iterator[Tuple[str, os.stat_result]]:
         """
-        Directory recursively crawl karta hai aur documents yield karta hai.
+        os.scandir se directory tree walk karta hai (explicit stack, recursion nahi).
+        DirEntry ka type info directory listing se hi aa jata hai, isliye
+        rglob ki tarah har entry pe Path object aur extra stat() nahi lagta.
+        Ignore patterns wali directories mein andar jaate hi nahi.
         
         Args:
-            directory_path: Root directory ka path
+            root_path: Root directory
             
         Yields:
-            Document objects one by one (memory efficient)
+            (file path string, stat result) tuples - sirf regular files ke liye
+        """
+        recursive = CONFIG.crawler.RECURSIVE_CRAWLING
+        stack = [str(root_path)]
+        
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive and not CONFIG.crawler.is_ignored(entry.path):
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                yield entry.path, entry.stat()
+                        except OSError:
+                            # Broken symlink ya permission issue - skip
+                            continue
+            except OSError as e:
+                logger.warning("Directory read nahi ho payi: %s - %s", current_dir, e)
+    
+    def _collect_files(
+        self,
+        directory_path: str
+    ) -> Tuple[List[Path], array, array, array]:
+        """
+        Directory walk karke process hone wali files aur unke stat fields
+        columns mein return karta hai (crawl_directory aur
+        crawl_directory_parallel dono isi ko use karte hain).
+        
+        Args:
+            directory_path: Root directory ka path
+            
+        Returns:
+            (paths, sizes, mtimes, ctimes) - sab same order mein
         """
         root_path = Path(directory_path)
         
@@ -343,39 +681,142 @@ class DocumentCrawler:
         
         print(f"\n🕷️  Crawling shuru: {root_path}")
         
-        # Saari files collect karte hain pehle taaki progress track kar sakein
-        all_files = []
-        
-        if CONFIG.crawler.RECURSIVE_CRAWLING:
-            # Recursive walk
-            for file_path in root_path.rglob('*'):
-                if file_path.is_file():
-                    all_files.append(file_path)
-        else:
-            # Sirf top level
-            for file_path in root_path.iterdir():
-                if file_path.is_file():
-                    all_files.append(file_path)
-        
-        total_files = len(all_files)
+        # Saari files collect karte hain pehle taaki progress track kar sakein.
+        # Har file ka stat yahin ek baar lete hain, lekin stat_result objects
+        # rakhte nahi - sirf zaroori fields compact arrays (columns) mein jaate hain.
+        all_paths: List[str] = []
+        sizes = array('q')
+        mtimes = array('d')
+        ctimes = array('d')
+        for path_str, st in self._walk_files(root_path):
+            all_paths.append(path_str)
+            sizes.append(st.st_size)
+            mtimes.append(st.st_mtime)
+            ctimes.append(st.st_ctime)
+        
+        total_files = len(all_paths)
         print(f"📁 Total files mil gayi: {total_files}")
         
-        # Ab har file process karte hain
-        for idx, file_path in enumerate(all_files, 1):
-            self._report_progress(f"Processing {file_path.name}", idx, total_files)
-            
-            if not self._should_process_file(file_path):
-                continue
+        # Filtering cheap hai, isliye main thread mein hi kar lete hain.
+        # Path objects sirf un files ke bante hain jo process hongi.
+        paths: List[Path] = []
+        keep: List[int] = []
+        for idx, path_str in enumerate(all_paths):
+            file_path = Path(path_str)
+            if self._should_process_file(file_path, sizes[idx], file_path.suffix.lower()):
+                paths.append(file_path)
+                keep.append(idx)
+        
+        sizes = array('q', [sizes[i] for i in keep])
+        mtimes = array('d', [mtimes[i] for i in keep])
+        ctimes = array('d', [ctimes[i] for i in keep])
+        
+        return paths, sizes, mtimes, ctimes
+    
+    def _accept_in_order(
+        self,
+        paths: List[Path],
+        built_docs: Iterator[Optional[Document]]
+    ) -> Iterator[Document]:
+        """
+        Workers ke results file order mein accept karta hai (dedup + progress).
+        built_docs ka order paths jaisa hi hona chahiye - tabhi duplicate
+        detection deterministic rehta hai aur hamesha pehli file rakhi jaati hai.
+        """
+        for idx, (file_path, doc) in enumerate(zip(paths, built_docs), 1):
+            # Callback na ho toh har file pe message format hi nahi karte
+            if self.progress_callback:
+                self._report_progress(f"Processing {file_path.name}", idx, len(paths))
             
-            doc = self._create_document(file_path)
+            doc = self._accept_document(doc)
             if doc:
                 yield doc
+    
+    def _print_summary(self):
+        """Crawl ke end mein stats ka summary print karta hai."""
+        print(
+            f"\n✅ Crawling complete!\n"
+            f"   Processed: {self.stats['files_processed']}\n"
+            f"   Skipped: {self.stats['files_skipped']}\n"
+            f"   Errors: {self.stats['errors']}\n"
+            f"   Total size: {self.stats['total_size'] / 1024:.2f} KB"
+        )
+    
+    def crawl_directory(self, directory_path: str) -> Iterator[Document]:
+        """
+        Directory recursively crawl karta hai aur documents yield karta hai.
+        
+        Args:
+            directory_path: Root directory ka path
+            
+        Yields:
+            Document objects one by one (memory efficient)
+        """
+        paths, sizes, mtimes, ctimes = self._collect_files(directory_path)
+        
+        # File reading thread pool mein hoti hai (I/O ke dauraan GIL release hota hai).
+        # _bounded_map input order preserve karta hai aur sirf 2 * workers files
+        # aage padhta hai - consumer dheere khaaye toh bhi poora corpus memory mein nahi
+        workers = CONFIG.crawler.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            built_docs = _bounded_map(
+                executor, self._build_document, 2 * workers, paths, sizes, mtimes, ctimes
+            )
+            yield from self._accept_in_order(paths, built_docs)
+        
+        self._print_summary()
+    
+    def crawl_directory_parallel(
+        self,
+        directory_path: str,
+        workers: Optional[int] = None
+    ) -> Iterator[Document]:
+        """
+        crawl_directory jaisa hi, lekin files worker processes mein build hoti hain.
+        JSON parse/re-serialize, encoding detection aur hashing CPU-bound hain -
+        threads mein GIL inhe serialize kar deta hai, processes mein nahi.
+        Badi ya JSON-heavy corpora ke liye useful; chhoti corpora pe process
+        startup aur IPC ka cost zyada padega, wahan crawl_directory hi theek hai.
+        
+        Dedup main process mein hi hota hai (file order mein), isliye result
+        crawl_directory jaisa hi rehta hai.
         
-        print(f"\n✅ Crawling complete!")
-        print(f"   Processed: {self.stats['files_processed']}")
-        print(f"   Skipped: {self.stats['files_skipped']}")
-        print(f"   Errors: {self.stats['errors']}")
-        print(f"   Total size: {self.stats['total_size'] / 1024:.2f} KB")
+        Args:
+            directory_path: Root directory ka path
+            workers: Worker processes (default: CPU count)
+            
+        Yields:
+            Document objects one by one
+        """
+        paths, sizes, mtimes, ctimes = self._collect_files(directory_path)
+        
+        workers = workers or os.cpu_count() or 1
+        n = PROCESS_CHUNK_SIZE
+        # Har IPC round-trip mein PROCESS_CHUNK_SIZE files jaati hain, aur ek
+        # waqt mein sirf 2 * workers chunks in flight (crawl_directory jaisa bound)
+        chunks = (
+            (paths[i:i + n], sizes[i:i + n], mtimes[i:i + n], ctimes[i:i + n])
+            for i in range(0, len(paths), n)
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=CONFIG.process_context()
+        ) as executor:
+            built_chunks = _bounded_map(executor, _build_chunk_in_process, 2 * workers, chunks)
+            results = (item for chunk in built_chunks for item in chunk)
+            yield from self._accept_in_order(paths, self._merge_worker_errors(results))
+        
+        self._print_summary()
+    
+    def _merge_worker_errors(
+        self,
+        results: Iterator[Tuple[Optional[Document], int]]
+    ) -> Iterator[Optional[Document]]:
+        """Worker processes ke error counts main stats mein jodta hai."""
+        for doc, errors in results:
+            if errors:
+                with self._stats_lock:
+                    self.stats['errors'] += errors
+            yield doc
     
     def get_statistics(self) -> dict:
         """Crawling statistics return karta hai."""
@@ -392,6 +833,60 @@ class DocumentCrawler:
         self.seen_hashes.clear()
 
 
+def _bounded_map(executor, fn: Callable, window: int, *iterables) -> Iterator:
+    """
+    executor.map jaisa (results input order mein), lekin ek waqt mein max
+    window futures in flight - agla kaam tabhi submit hota hai jab consumer
+    ek result le leta hai. executor.map saara input turant queue kar deta hai.
+    Generator beech mein band ho toh bache pending futures cancel.
+    """
+    pending = deque()
+    try:
+        for args in zip(*iterables):
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# crawl_directory_parallel ke har worker process ka apna crawler (pehli file pe banta hai)
+_worker_crawler: Optional[DocumentCrawler] = None
+
+# Process pool mein ek IPC message mein itni files bhejte hain
+PROCESS_CHUNK_SIZE = 32
+
+
+def _build_document_in_process(
+    file_path: Path,
+    file_size: int,
+    mtime: float,
+    ctime: float
+) -> Tuple[Optional[Document], int]:
+    """
+    Worker process mein ek file ka Document banata hai.
+    Stats process ke saath share nahi hote, isliye error count bhi saath lautate hain.
+    """
+    global _worker_crawler
+    if _worker_crawler is None:
+        _worker_crawler = DocumentCrawler()
+    
+    errors_before = _worker_crawler.stats['errors']
+    doc = _worker_crawler._build_document(file_path, file_size, mtime, ctime)
+    return doc, _worker_crawler.stats['errors'] - errors_before
+
+
+def _build_chunk_in_process(chunk: tuple) -> List[Tuple[Optional[Document], int]]:
+    """Ek IPC chunk (paths, sizes, mtimes, ctimes) ki files, file order mein."""
+    return [
+        _build_document_in_process(file_path, file_size, mtime, ctime)
+        for file_path, file_size, mtime, ctime in zip(*chunk)
+    ]
+
+
 # Convenience function for quick crawling
 def crawl_documents(path: str, recursive: bool = True) -> List[Document]:
     """
@@ -423,7 +918,7 @@ def crawl_documents(path: str, recursive: bool = True) -> List[Document]:
             return list(crawler.crawl_directory(path))
         
         else:
-            print(f"[ERROR] Invalid path: {path}")
+            logger.error("Invalid path: %s", path)
             return []
     
     finally:
@@ -435,8 +930,10 @@ def crawl_documents(path: str, recursive: bool = True) -> List[Document]:
 if __name__ == "__main__":
     import sys
     
+    CONFIG.setup_logging()
+    
     # Test directory
-    test_dir = CONFIG.paths['DOCUMENTS_DIR']
+    test_dir = CONFIG.paths.DOCUMENTS_DIR
     
     if len(sys.argv) > 1:
         test_dir = sys.argv[1]
@@ -19,17 +19,27 @@ Performance Optimizations:
 =============================================================================
 """
 import os 
-import re
+import mmap
 import json
 import math
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Iterator
+from typing import Any, Dict, List, Set, Tuple, Optional, Iterator, Union
 from collections import defaultdict, Counter
+from itertools import filterfalse
 from datetime import datetime
 import pickle
+import warnings
+import bisect
+from array import array
+
+# orjson optional hai - install ho toh JSON export/import uske C path se hota hai
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Local imports
-from models import Document, IndexEntry, IndexMetadata
+from models import Document, IndexEntry, IndexMetadata, INDEX_FORMAT_VERSION
 from config import CONFIG
 
 
@@ -42,12 +52,16 @@ class TextPreprocessor:
     """
     
     def __init__(self):
-        # Compile regex patterns for efficiency
-        # Word boundary ke saath alphanumeric sequences match karenge
-        self.token_pattern = re.compile(r'\b[a-zA-Z0-9\u0900-\u097F]+\b')
+        # Compiled regex config se lete hain - word boundary ke saath alphanumeric
+        # sequences, MIN/MAX_WORD_LENGTH ke bounds regex mein hi hain
+        self.token_pattern = CONFIG.indexer.token_re
+        
+        # Pure-ASCII text ke liye ASCII-mode (ya RE2) pattern - config dekho
+        self.ascii_token_pattern = CONFIG.indexer.ascii_token_re
         
-        # Stop words load karte hain config se
-        self.stop_words = CONFIG.indexer.STOP_WORDS
+        # Stop words load karte hain config se (frozenset - O(1) membership,
+        # chahe config mein koi list/set hi kyun na daal de)
+        self.stop_words = frozenset(CONFIG.indexer.STOP_WORDS)
         
         # Case sensitivity flag
         self.case_sensitive = CONFIG.indexer.CASE_SENSITIVE
@@ -57,9 +71,9 @@ class TextPreprocessor:
         Text ko tokens mein todta hai.
         
         Process:
-        1. Regex se words extract karte hain
-        2. Case normalize karte hain (agar case insensitive mode hai)
-        3. Length filter lagate hain
+        1. Case normalize karte hain (agar case insensitive mode hai)
+        2. Regex se words extract karte hain - length filter regex mein hi hai,
+           isliye rejected words ke liye string ya len() check nahi banta
         
         Args:
             text: Raw text string
@@ -71,19 +85,10 @@ class TextPreprocessor:
         if not self.case_sensitive:
             text = text.lower()
         
-        # Token extraction using regex
-        tokens = self.token_pattern.findall(text)
-        
-        # Length filtering
-        min_len = CONFIG.indexer.MIN_WORD_LENGTH
-        max_len = CONFIG.indexer.MAX_WORD_LENGTH
-        
-        filtered_tokens = [
-            token for token in tokens 
-            if min_len <= len(token) <= max_len
-        ]
-        
-        return filtered_tokens
+        # Token extraction using regex (length filter included)
+        if text.isascii():
+            return self.ascii_token_pattern.findall(text)
+        return self.token_pattern.findall(text)
     
     def remove_stopwords(self, tokens: List[str]) -> List[str]:
         """
@@ -95,7 +100,8 @@ class TextPreprocessor:
         Returns:
             Filtered list without stop words
         """
-        return [token for token in tokens if token not in self.stop_words]
+        # filterfalse + frozenset.__contains__ - poora loop C mein, per-token Python frame nahi
+        return list(filterfalse(self.stop_words.__contains__, tokens))
     
     def preprocess(self, text: str, remove_stops: bool = True) -> List[str]:
         """
@@ -110,10 +116,73 @@ class TextPreprocessor:
         """
         tokens = self.tokenize(text)
         
-        if remove_stops:
-            tokens = self.remove_stopwords(tokens)
+        if not remove_stops:
+            return tokens
+        
+        # Stop word filter yahin inline - remove_stopwords ka extra call nahi
+        return list(filterfalse(self.stop_words.__contains__, tokens))
+    
+    def preprocess_to_counts(self, text: str) -> Counter:
+        """
+        Text ko seedha term -> frequency Counter mein badalta hai.
+        Stop word filter iterator hai, isliye beech mein filtered list nahi banti.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Counter of term frequencies
+        """
+        return Counter(filterfalse(self.stop_words.__contains__, self.tokenize(text)))
+    
+    def preprocess_to_positions(self, text: str) -> Dict[str, List[int]]:
+        """
+        Text ko term -> positions map mein badalta hai (positions stop words
+        hatane ke baad ke token index hain, jaise preprocess() ki list mein).
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Dict of term -> positions
+        """
+        return self.analyze(text, store_positions=True)[2]
+    
+    def analyze(
+        self,
+        text: str,
+        store_positions: bool = False
+    ) -> Tuple[List[str], Dict[str, int], Optional[Dict[str, List[int]]]]:
+        """
+        Indexing ke liye ek hi pass mein (tokens, term_freqs, term_positions) banata hai.
+        term_positions sirf store_positions True ho tab banta hai, warna None.
+        
+        Args:
+            text: Raw text
+            store_positions: Term positions bhi chahiye?
+            
+        Returns:
+            (stop words ke bina tokens, term -> frequency, term -> positions ya None)
+        """
+        if not store_positions:
+            # Positions ki zarurat nahi - filter aur Counter dono C mein chalte hain,
+            # per-token append aur per-term list nahi banti
+            tokens = list(filterfalse(self.stop_words.__contains__, self.tokenize(text)))
+            return tokens, dict(Counter(tokens)), None
+        
+        # Stop word filter, token list aur positions - teeno ek hi loop mein
+        stop_words = self.stop_words
+        tokens: List[str] = []
+        append_token = tokens.append
+        term_positions: Dict[str, List[int]] = defaultdict(list)
+        for token in self.tokenize(text):
+            if token in stop_words:
+                continue
+            term_positions[token].append(len(tokens))
+            append_token(token)
         
-        return tokens
+        term_freqs = {term: len(positions) for term, positions in term_positions.items()}
+        return tokens, term_freqs, term_positions
     
     def extract_ngrams(self, tokens: List[str], n: int = 2) -> List[str]:
         """
@@ -138,6 +207,184 @@ class TextPreprocessor:
         return ngrams
 
 
+def _dump_json_line(obj: Any) -> bytes:
+    """
+    Ek record ko newline ke saath JSON bytes mein badalta hai (NDJSON save ke liye).
+    orjson ho toh usse (C mein, int keys bhi), warna stdlib json se.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson ko koi type samajh nahi aaya - stdlib json default=str se sambhal lega
+            pass
+    return (json.dumps(obj, default=str) + '\n').encode('utf-8')
+
+
+def _load_json_line(line: bytes) -> Any:
+    """NDJSON ki ek line parse karta hai - orjson ho toh usse, warna stdlib json se."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def bm25_idf(total_docs: int, doc_frequency: int) -> float:
+    """BM25 IDF: log(1 + (N - n + 0.5) / (n + 0.5)) - N total docs, n docs with term."""
+    return math.log(1 + (total_docs - doc_frequency + 0.5) / (doc_frequency + 0.5))
+
+
+def _postings_path(filepath: str) -> str:
+    """Binary index file (index.pkl) ki companion postings file ka path."""
+    return os.path.splitext(filepath)[0] + '.postings.bin'
+
+
+# IndexEntry ke posting arrays - postings file mein inke raw bytes hi likhe jaate hain
+_POSTING_SLOTS = ('doc_ids', 'freqs', 'pos_offsets', 'positions')
+_POSTING_ITEMSIZE = array('I').itemsize
+
+
+class _MappedIndexEntry(IndexEntry):
+    """
+    load_binary wala IndexEntry jiski postings abhi postings file (mmap) mein hi hain.
+    
+    Pehli baar koi posting array access hone pe file ke slice pe read-only
+    memoryview('I') banta hai - koi copy ya parsing nahi, pages OS zarurat pe
+    padhta hai aur ek hi file map karne wale processes (uvicorn workers) unhe
+    share karte hain. Jin terms ko koi query chhoota hi nahi, unki postings kabhi
+    memory mein nahi aati. Entry mein naya posting add hone se pehle views ki
+    jagah apne arrays ban jaate hain (_materialize) - tab se yeh normal
+    IndexEntry hai aur _source None.
+    """
+    __slots__ = ('_source', '_offset', '_length')
+    
+    def __init__(self, word: str, doc_frequency: int, idf_score: float, max_frequency: int,
+                 source: mmap.mmap, offset: int, length: int):
+        # Posting slots jaan-bujh kar khaali - pehli access pe __getattr__ bharta hai
+        self.word = word
+        self.doc_frequency = doc_frequency
+        self.idf_score = idf_score
+        self.max_frequency = max_frequency
+        self.bm25_idf = 0.0  # _rebuild_vocab bharta hai
+        self._source = source
+        self._offset = offset
+        self._length = length
+    
+    def __getattr__(self, name):
+        # Sirf khaali slots pe call hota hai, normal attribute access pe nahi
+        if name not in _POSTING_SLOTS or self._source is None:
+            raise AttributeError(name)
+        self.doc_ids, self.freqs, self.pos_offsets, self.positions = _decode_postings(
+            self._blob(), self.doc_frequency, copy=False
+        )
+        return getattr(self, name)
+    
+    def __reduce__(self):
+        # mmap views pickle nahi hote - plain IndexEntry ki tarah jaata hai
+        return IndexEntry.from_dict, (self.to_dict(),)
+    
+    def _blob(self) -> memoryview:
+        return memoryview(self._source)[self._offset:self._offset + self._length]
+    
+    def _slot(self, doc_id: int) -> int:
+        # Har mutation _slot se shuru hoti hai - file wale views read-only hain
+        self._materialize()
+        return super()._slot(doc_id)
+    
+    def _materialize(self):
+        """Postings ko file se apne (writable) arrays mein copy karta hai."""
+        if self._source is None:
+            return
+        self.doc_ids, self.freqs, self.pos_offsets, self.positions = _decode_postings(
+            self._blob(), self.doc_frequency
+        )
+        self._source = None
+    
+    def _remap(self, source: Optional[mmap.mmap], offset: int):
+        """
+        Nayi postings file pe point karta hai (save_binary ke baad) - purane map ke
+        views chhod deta hai, agli access pe naye map se bante hain.
+        """
+        for name in _POSTING_SLOTS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+        self._source = source
+        self._offset = offset
+
+
+def _encode_postings(entry: IndexEntry) -> bytes:
+    """
+    Postings file ka blob: doc_ids, freqs, aur (positions ho toh) pos_offsets,
+    positions - native 'I' arrays ke raw bytes ek ke baad ek. Jo mapped entry
+    abhi bhi file pe hai (badli nahi), uske bytes seedha purani file se copy hote hain.
+    """
+    if isinstance(entry, _MappedIndexEntry) and entry._source is not None:
+        return entry._source[entry._offset:entry._offset + entry._length]
+    parts = [entry.doc_ids.tobytes(), entry.freqs.tobytes()]
+    if entry.pos_offsets is not None:
+        parts.append(entry.pos_offsets.tobytes())
+        parts.append(entry.positions.tobytes())
+    return b''.join(parts)
+
+
+def _decode_postings(
+    blob: memoryview,
+    doc_frequency: int,
+    copy: bool = True
+) -> Tuple[Any, Any, Optional[Any], Optional[Any]]:
+    """
+    _encode_postings ka ulta - (doc_ids, freqs, pos_offsets, positions).
+    copy=True pe array('I') copies, copy=False pe blob ke upar zero-copy
+    memoryview('I') (read-only).
+    """
+    if copy:
+        def load(part):
+            values = array('I')
+            values.frombytes(part)
+            return values
+    else:
+        def load(part):
+            return part.cast('I')
+    
+    size = doc_frequency * _POSTING_ITEMSIZE
+    doc_ids = load(blob[:size])
+    freqs = load(blob[size:2 * size])
+    if len(blob) == 2 * size:
+        # Positions store nahi hui thi
+        return doc_ids, freqs, None, None
+    
+    offsets_end = 3 * size + _POSTING_ITEMSIZE
+    return doc_ids, freqs, load(blob[2 * size:offsets_end]), load(blob[offsets_end:])
+
+
+def _map_file(path: str) -> Optional[mmap.mmap]:
+    """File ko read-only map karta hai (khaali file ka map nahi banta - None)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Parallel indexing ke har worker process ka apna preprocessor (pehli call pe banta hai)
+_worker_preprocessor: Optional[TextPreprocessor] = None
+
+
+def _analyze_content(
+    args: Tuple[str, bool]
+) -> Tuple[List[str], Dict[str, int], Optional[Dict[str, List[int]]]]:
+    """
+    Worker process mein ek document ka content tokenize aur count karta hai.
+    Side-effect free hai - index ko sirf main process chhuta hai.
+    """
+    global _worker_preprocessor
+    if _worker_preprocessor is None:
+        _worker_preprocessor = TextPreprocessor()
+    
+    content, store_positions = args
+    return _worker_preprocessor.analyze(content, store_positions)
+
+
 class InvertedIndex:
     """
     Inverted Index ka main class.
@@ -145,10 +392,19 @@ class InvertedIndex:
     
     Data Structure:
         {
-            "word1": IndexEntry(postings={doc1: {...}, doc2: {...}}),
+            "word1": IndexEntry(doc_ids=[0, 1], freqs=[...]),
             "word2": IndexEntry(...),
             ...
         }
+    
+    Postings mein doc_id strings ki jagah internal integer IDs hain (add order
+    mein 0, 1, 2, ...) - isi se posting arrays sorted rehte hain aur packed.
+    _docs_by_int[id] se Document milta hai, _doc_id_map[doc_id] se id.
+    
+    Terms ko bhi pehli baar dikhne pe integer term ID milta hai (vocab /
+    vocab_inv) - per-term arrays (jaise IDF) isi ID se index hote hain.
+    self.index string-keyed hi rehta hai: CPython str ka hash object pe cache
+    rahta hai, toh query term se seedha lookup ek hi hash op hai.
     """
     
     def __init__(self):
@@ -164,26 +420,80 @@ class InvertedIndex:
         # Document store: doc_id -> Document (for quick lookup)
         self.documents: Dict[str, Document] = {}
         
+        # Internal integer IDs: doc_id -> int aur int -> Document
+        self._doc_id_map: Dict[str, int] = {}
+        self._docs_by_int: List[Document] = []
+        
+        # Internal ID -> document length (word_count) ek contiguous array mein,
+        # taaki scoring ko Document objects na chhoone padein
+        self.doc_lengths = array('I')
+        
+        # BM25 norm factors ka cache: ((k1, b), avg_doc_length, factors, min factor) -
+        # bm25_norm_factors dekho
+        self._bm25_norms: Optional[Tuple[Tuple[float, float], float, array, float]] = None
+        
+        # Term IDs: term -> int, int -> term aur int -> IndexEntry
+        # (IDs self.index ke insertion order mein hain)
+        self.vocab: Dict[str, int] = {}
+        self.vocab_inv: List[str] = []
+        self._entries_by_id: List[IndexEntry] = []
+        
+        # Prefix lookup (suggestions) ke liye sorted vocabulary - pehli zarurat pe
+        # banti hai, naya term aate hi None (dobara banegi)
+        self._sorted_terms: Optional[List[str]] = None
+        
+        # load_binary ki postings file ka mmap (warna None)
+        self._postings_map: Optional[mmap.mmap] = None
+        
         # Statistics
         self.indexing_stats = {
             'terms_indexed': 0,
             'postings_created': 0,
             'time_taken_ms': 0
         }
+        
+        # Documents add hue hain par IDF scores abhi recalculate nahi hue
+        # (ensure_idf pehli zarurat pe karta hai)
+        self._idf_dirty = False
     
-    def _calculate_tf(self, term: str, tokens: List[str]) -> int:
+    def _calculate_tf(self, term: str, doc: Union[str, int, List[str]]) -> int:
         """
         Term Frequency calculate karta hai.
-        Kitni baar term appear hota hai tokens mein.
+        Kitni baar term appear hota hai document mein.
+        
+        doc_id dene pe indexing ke waqt bani term_freqs se O(1) lookup hota hai.
+        Tokens list pass karna deprecated hai - woh har call pe poori list
+        scan karta hai (tokens.count).
         
         Args:
             term: Word to search
-            tokens: Document tokens
+            doc: External doc_id string / internal integer ID (ya, deprecated, tokens list)
             
         Returns:
             Frequency count
         """
-        return tokens.count(term)
+        if isinstance(doc, list):
+            warnings.warn(
+                "_calculate_tf(term, tokens) deprecated hai - doc_id pass karo",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            return doc.count(term)
+        
+        document = self.get_document(doc)
+        if document is None:
+            return 0
+        return self._term_freqs(document).get(term, 0)
+    
+    @staticmethod
+    def _term_freqs(doc: Document) -> Dict[str, int]:
+        """
+        Document ki term -> frequency map. Indexing ke waqt banti hai; load ke
+        baad (save mein nahi jaati) pehli zarurat pe tokens se ek baar banti hai.
+        """
+        if not doc.term_freqs and doc.tokens:
+            doc.term_freqs = dict(Counter(doc.tokens))
+        return doc.term_freqs
     
     def _calculate_idf(self, term: str) -> float:
         """
@@ -217,84 +527,297 @@ class InvertedIndex:
         """
         Saare terms ke IDF scores recalculate karta hai.
         Naya document add karne ke baad call karna chahiye.
+        
+        IDF sirf df pe depend karta hai aur zyada terms ka df chhota aur same
+        hota hai (df=1, 2, ...), isliye har distinct df ke liye log ek hi baar
+        nikalte hain - formula _calculate_idf wala hi hai.
+        Saath hi har entry ka bm25_idf bhi (same per-df caching).
         """
-        for term, entry in self.index.items():
-            entry.idf_score = self._calculate_idf(term)
+        log = math.log
+        N = self.metadata.total_documents
+        numerator = N + 1
+        idf_by_df: Dict[int, Tuple[float, float]] = {}
+        
+        for entry in self._entries_by_id:
+            df = entry.doc_frequency
+            cached = idf_by_df.get(df)
+            if cached is None:
+                # Smoothed IDF (TF-IDF) aur BM25 IDF
+                cached = idf_by_df[df] = (log(numerator / (df + 0.5)), bm25_idf(N, df))
+            entry.idf_score, entry.bm25_idf = cached
+    
+    def _update_bm25_idfs(self):
+        """
+        Sirf bm25_idf recalculate karta hai (load ke baad - saved idf_score
+        wahi rehte hain, BM25 IDF file mein nahi hota).
+        """
+        N = self.metadata.total_documents
+        idf_by_df: Dict[int, float] = {}
+        for entry in self._entries_by_id:
+            df = entry.doc_frequency
+            idf = idf_by_df.get(df)
+            if idf is None:
+                idf = idf_by_df[df] = bm25_idf(N, df)
+            entry.bm25_idf = idf
     
-    def add_document(self, doc: Document) -> None:
+    def ensure_idf(self):
+        """
+        Index dirty ho toh IDF scores recalculate karta hai, warna kuch nahi.
+        Indexing/commit IDF turant update nahi karte - kai batches aur single
+        add_document calls ka kaam pehli search, vector ya save pe ek hi pass
+        mein hota hai.
+        """
+        if self._idf_dirty:
+            self._update_idf_scores()
+            self._idf_dirty = False
+    
+    def add_document(self, doc: Document, indexed_at: Optional[datetime] = None) -> None:
         """
         Single document ko index mein add karta hai.
         
         Process:
-        1. Document tokenize karta hai
-        2. Har token ke liye posting add karta hai
+        1. Document tokenize karta hai aur terms count karta hai
+        2. Har unique term ke liye posting add karta hai
         3. Document store mein save karta hai
         4. Stats update karta hai
         
         Args:
             doc: Document object jo index karna hai
+            indexed_at: Indexing timestamp (batch mein ek hi baar liya hua; default: abhi)
         """
         # Check karein ki document already indexed toh nahi
         if doc.doc_id in self.documents:
             print(f"[WARNING] Document already indexed: {doc.doc_id}")
             return
         
-        # Preprocessing
-        tokens = self.preprocessor.preprocess(doc.content)
+        tokens, term_freqs, term_positions = self.preprocessor.analyze(
+            doc.content, CONFIG.indexer.STORE_POSITIONS
+        )
+        self._merge_document(doc, tokens, term_freqs, term_positions, indexed_at)
+    
+    def _merge_document(
+        self,
+        doc: Document,
+        tokens: List[str],
+        term_freqs: Dict[str, int],
+        term_positions: Optional[Dict[str, List[int]]],
+        indexed_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Pehle se tokenized/counted document ko index mein merge karta hai.
+        Index ko sirf yahi method likhta hai - parallel indexing mein bhi
+        yeh main process mein, document order mein hi chalta hai.
+        
+        Args:
+            doc: Document object
+            tokens: Preprocessed tokens
+            term_freqs: term -> frequency
+            term_positions: term -> positions (sirf STORE_POSITIONS on ho tab, warna None)
+            indexed_at: Indexing timestamp (default: abhi)
+        """
+        if indexed_at is None:
+            indexed_at = datetime.now()
+        
+        # Stats seedha - term_freqs ki keys hi unique tokens hain, isliye
+        # update_stats wala set(tokens) dobara nahi banana
         doc.tokens = tokens
-        doc.update_stats()
-        doc.indexed_at = datetime.now()
+        doc.word_count = len(tokens)
+        doc.unique_words = len(term_freqs)
+        doc.indexed_at = indexed_at
         
-        # Unique terms aur unki positions track karte hain
-        term_positions: Dict[str, List[int]] = defaultdict(list)
+        # Internal integer ID assign karte hain (postings isi se keyed hain)
+        internal_id = self._register_document(doc)
         
-        for pos, token in enumerate(tokens):
-            term_positions[token].append(pos)
+        # Index mein har unique term ke liye entry add karte hain -
+        # har (term, doc) ki posting ek hi call mein likhi jaati hai. Index aur
+        # uska get loop se pehle locals mein - per term ek hi hash lookup
+        # (naya term ho tab ek aur insert)
+        index = self.index
+        get_entry = index.get
+        if term_positions is not None:
+            for term, positions in term_positions.items():
+                entry = get_entry(term)
+                if entry is None:
+                    entry = index[term] = self._new_entry(term)
+                entry.add_postings(internal_id, positions, len(positions))
+        else:
+            for term, frequency in term_freqs.items():
+                entry = get_entry(term)
+                if entry is None:
+                    entry = index[term] = self._new_entry(term)
+                entry.add_posting_freq(internal_id, frequency)
         
-        # Index mein har unique term ke liye entry add karte hain
-        for term, positions in term_positions.items():
-            if term not in self.index:
-                self.index[term] = IndexEntry(word=term)
-            
-            # Posting add karte hain
-            frequency = len(positions)
-            for pos in positions:
-                self.index[term].add_posting(doc.doc_id, pos, 1)
-            
-            self.indexing_stats['postings_created'] += 1
+        # Per-doc term frequencies (get_document_vector ke liye)
+        doc.term_freqs = term_freqs
         
-        # Document store mein add karte hain
-        self.documents[doc.doc_id] = doc
+        unique_terms = len(term_freqs)
+        stats = self.indexing_stats
+        stats['postings_created'] += unique_terms
         
         # Metadata update
-        self.metadata.add_document(doc)
-        self.indexing_stats['terms_indexed'] += len(term_positions)
+        self.metadata.add_document(doc, indexed_at)
+        stats['terms_indexed'] += unique_terms
+        self._idf_dirty = True
         
-        print(f"[INDEXED] {doc.doc_id} - {len(tokens)} tokens, {len(term_positions)} unique terms")
+        if CONFIG.indexer.VERBOSE:
+            print(f"[INDEXED] {doc.doc_id} - {len(tokens)} tokens, {unique_terms} unique terms")
     
-    def add_documents(self, documents: Iterator[Document]) -> None:
+    def _register_document(self, doc: Document) -> int:
+        """
+        Document ko store mein daalta hai aur uska internal integer ID return karta hai.
+        """
+        internal_id = len(self._docs_by_int)
+        self._docs_by_int.append(doc)
+        self._doc_id_map[doc.doc_id] = internal_id
+        self.doc_lengths.append(doc.word_count)
+        self.documents[doc.doc_id] = doc
+        return internal_id
+    
+    def _rebuild_doc_ids(self, doc_ids: List[str]):
+        """Load ke baad saved order se internal ID tables dobara banata hai."""
+        self._docs_by_int = [self.documents[doc_id] for doc_id in doc_ids]
+        self._doc_id_map = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+        self.doc_lengths = array('I', [doc.word_count for doc in self._docs_by_int])
+        self._bm25_norms = None
+    
+    def _new_entry(self, term: str) -> IndexEntry:
+        """Naye term ka IndexEntry banata hai aur use agla term ID deta hai."""
+        entry = IndexEntry(word=term)
+        self.vocab[term] = len(self.vocab_inv)
+        self.vocab_inv.append(term)
+        self._entries_by_id.append(entry)
+        self._sorted_terms = None
+        return entry
+    
+    def _rebuild_vocab(self):
+        """Load ke baad self.index ke (saved) order se term ID tables dobara banata hai."""
+        self.vocab_inv = list(self.index)
+        self.vocab = {term: i for i, term in enumerate(self.vocab_inv)}
+        self._entries_by_id = list(self.index.values())
+        self._sorted_terms = None
+        self._update_bm25_idfs()
+    
+    def terms_with_prefix(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        prefix se shuru hone wale terms (alphabetical order mein, max limit).
+        Sorted vocabulary pe bisect - O(log V + limit), poori vocab scan nahi.
+        
+        Args:
+            prefix: Term ka shuru ka hissa (normalize nahi hota)
+            limit: Kitne terms chahiye
+            
+        Returns:
+            Matching terms ki list
+        """
+        sorted_terms = self._sorted_terms
+        if sorted_terms is None:
+            sorted_terms = self._sorted_terms = sorted(self.index)
+        
+        matches = []
+        i = bisect.bisect_left(sorted_terms, prefix)
+        while i < len(sorted_terms) and len(matches) < limit:
+            term = sorted_terms[i]
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+            i += 1
+        return matches
+    
+    def bm25_norm_factors(self, k1: float, b: float) -> array:
+        """
+        Har internal doc ID ka BM25 denominator factor: k1 * (1 - b + b * (dl / avgdl)).
+        Yeh sirf doc length, corpus avgdl aur constants pe depend karta hai, isliye
+        har (query, doc) pe dobara nikalne ki jagah ek baar array mein banta hai -
+        scoring mein per posting bas f + factor[doc]. Batch indexing ke end mein
+        config wale k1/b ke liye ban jaata hai; naye documents se avgdl badle (ya
+        k1/b badle) tab hi dobara banta hai.
+        
+        Args:
+            k1: BM25 term frequency saturation parameter
+            b: BM25 length normalization parameter
+            
+        Returns:
+            array('d') internal doc ID se indexed
+        """
+        return self._bm25_norm_table(k1, b)[2]
+    
+    def bm25_min_norm_factor(self, k1: float, b: float) -> float:
+        """Sabse chhota BM25 norm factor (score upper bounds ke liye; khaali index pe k1)."""
+        return self._bm25_norm_table(k1, b)[3]
+    
+    def _bm25_norm_table(self, k1: float, b: float) -> Tuple[Tuple[float, float], float, array, float]:
+        """bm25_norm_factors ka cache - avgdl, k1/b ya doc count badle tab dobara banta hai."""
+        avgdl = self.metadata.avg_doc_length or 1.0   # Guard against zero avg
+        params = (k1, b)
+        cached = self._bm25_norms
+        if cached is not None and cached[0] == params and cached[1] == avgdl and len(cached[2]) == len(self.doc_lengths):
+            return cached
+        
+        one_minus_b = 1 - b
+        factors = array('d', [
+            k1 * (one_minus_b + b * ((dl or 1) / avgdl))   # Guard against zero length
+            for dl in self.doc_lengths
+        ])
+        self._bm25_norms = (params, avgdl, factors, min(factors, default=k1))
+        return self._bm25_norms
+    
+    def internal_id(self, doc_id: str) -> Optional[int]:
+        """External doc_id string ka internal integer ID (na mile toh None)."""
+        return self._doc_id_map.get(doc_id)
+    
+    def add_documents(
+        self,
+        documents: Iterator[Document],
+        analyzed: Optional[Iterator[Tuple[List[str], Dict[str, int], Optional[Dict[str, List[int]]]]]] = None
+    ) -> None:
         """
         Multiple documents ko batch mein index karta hai.
         
+        Bade batches (PARALLEL_MIN_DOCS ya zyada) mein tokenization aur counting
+        worker processes mein hoti hai - yeh pure CPU kaam hai jise GIL threads
+        mein serialize kar deta. Index mein merge main process hi karta hai,
+        input order mein (pool.imap), isliye internal IDs deterministic rehte hain.
+        
         Args:
             documents: Iterator of Document objects
+            analyzed: Har document ka TextPreprocessor.analyze result, documents ke
+                order mein - kisi aur process mein pehle hi analysis ho chuka ho
+                (jaise API ke indexing jobs) toh yahan sirf merge hota hai
         """
         start_time = datetime.now()
         doc_count = 0
         
         print(f"\n🚀 Batch indexing shuru...")
         
-        for doc in documents:
-            self.add_document(doc)
-            doc_count += 1
-            
-            # Har 100 documents ke baad progress dikhate hain
-            if doc_count % 100 == 0:
-                print(f"   Progress: {doc_count} documents indexed...")
+        # Batch ke saare documents ka indexed_at yahi start_time hai (per-doc
+        # datetime.now() nahi). Documents index mein store hote hi hain, toh
+        # list banana sasta hai
+        documents = list(documents)
+        workers = CONFIG.indexer.INDEX_WORKERS
+        
+        if analyzed is not None:
+            doc_count = self._merge_analyzed(documents, analyzed, start_time)
+        elif workers > 1 and len(documents) >= CONFIG.indexer.PARALLEL_MIN_DOCS:
+            store_positions = CONFIG.indexer.STORE_POSITIONS
+            with CONFIG.process_context().Pool(workers) as pool:
+                analyzed = pool.imap(
+                    _analyze_content,
+                    ((doc.content, store_positions) for doc in documents),
+                    chunksize=32
+                )
+                doc_count = self._merge_analyzed(documents, analyzed, start_time)
+        else:
+            for doc in documents:
+                self.add_document(doc, start_time)
+                doc_count += 1
+                
+                # Har 100 documents ke baad progress dikhate hain
+                if doc_count % 100 == 0:
+                    print(f"   Progress: {doc_count} documents indexed...")
         
-        # IDF scores update karte hain sab documents ke baad
-        print("   Updating IDF scores...")
-        self._update_idf_scores()
+        # IDF scores yahan nahi - ensure_idf pehli search/save pe karega.
+        # BM25 norm factors (naye avgdl ke saath) abhi bana lete hain
+        self.bm25_norm_factors(CONFIG.searcher.BM25_K1, CONFIG.searcher.BM25_B)
         
         # Time calculate karte hain
         end_time = datetime.now()
@@ -303,6 +826,23 @@ class InvertedIndex:
         
         print(f"✅ Indexing complete! {doc_count} documents in {time_taken:.2f}ms")
     
+    def _merge_analyzed(self, documents: List[Document], analyzed, indexed_at: datetime) -> int:
+        """
+        add_documents ka merge loop - analyze results documents ke order mein
+        merge hote hain. Returns: kitne documents process hue.
+        """
+        doc_count = 0
+        for doc, (tokens, term_freqs, term_positions) in zip(documents, analyzed):
+            if doc.doc_id in self.documents:
+                print(f"[WARNING] Document already indexed: {doc.doc_id}")
+            else:
+                self._merge_document(doc, tokens, term_freqs, term_positions, indexed_at)
+            
+            doc_count += 1
+            if doc_count % 100 == 0:
+                print(f"   Progress: {doc_count} documents indexed...")
+        return doc_count
+    
     def get_term_postings(self, term: str) -> Optional[IndexEntry]:
         """
         Kisi term ka index entry return karta hai.
@@ -317,36 +857,66 @@ class InvertedIndex:
         if not self.preprocessor.case_sensitive:
             term = term.lower()
         
+        if self._idf_dirty:
+            self.ensure_idf()
         return self.index.get(term)
     
-    def get_document(self, doc_id: str) -> Optional[Document]:
+    def get_document(self, doc_id: Union[str, int]) -> Optional[Document]:
         """
         Document ID se Document object return karta hai.
         
         Args:
-            doc_id: Document identifier
+            doc_id: External doc_id string ya internal integer ID
             
         Returns:
             Document object ya None
         """
+        if isinstance(doc_id, int):
+            if 0 <= doc_id < len(self._docs_by_int):
+                return self._docs_by_int[doc_id]
+            return None
         return self.documents.get(doc_id)
     
-    def get_term_frequency(self, term: str, doc_id: str) -> int:
+    def get_documents(self, doc_ids: List[Union[str, int]]) -> Dict[Union[str, int], Document]:
+        """
+        Kai documents ek saath (jaise search ka final page) - get_document ka
+        batch version. Abhi documents memory mein hain, par callers isi se
+        maangte hain taaki koi disk/DB backend ek hi multi-get mein padh sake.
+        
+        Args:
+            doc_ids: External doc_id strings ya internal integer IDs
+            
+        Returns:
+            doc_id -> Document (jo nahi mile woh dict mein nahi hote)
+        """
+        found = {}
+        for doc_id in doc_ids:
+            doc = self.get_document(doc_id)
+            if doc is not None:
+                found[doc_id] = doc
+        return found
+    
+    def get_term_frequency(self, term: str, doc_id: Union[str, int]) -> int:
         """
         Kisi specific document mein term ki frequency return karta hai.
         
         Args:
             term: Word
-            doc_id: Document ID
+            doc_id: External doc_id string ya internal integer ID
             
         Returns:
             Frequency count (0 agar nahi mila)
         """
+        if isinstance(doc_id, str):
+            doc_id = self._doc_id_map.get(doc_id)
+            if doc_id is None:
+                return 0
+        
         entry = self.get_term_postings(term)
-        if not entry or doc_id not in entry.postings:
+        if not entry:
             return 0
         
-        return entry.postings[doc_id]['frequency']
+        return entry.frequency(doc_id)
     
     def get_document_vector(self, doc_id: str) -> Dict[str, float]:
         """
@@ -362,12 +932,15 @@ class InvertedIndex:
         if doc_id not in self.documents:
             return {}
         
+        # Indexing ke waqt bani term frequencies (load ke baad pehli baar tokens se)
+        term_freqs = self._term_freqs(self.documents[doc_id])
+        
+        self.ensure_idf()
         vector = {}
-        doc = self.documents[doc_id]
+        index = self.index
         
-        for term in set(doc.tokens):
-            tf = self.get_term_frequency(term, doc_id)
-            entry = self.index.get(term)
+        for term, tf in term_freqs.items():
+            entry = index.get(term)
             idf = entry.idf_score if entry else 0.0
             
             # TF-IDF calculation (raw count * IDF)
@@ -375,9 +948,19 @@ class InvertedIndex:
         
         return vector
     
+    def _sync_metadata(self):
+        """Save se pehle metadata ko current index/documents ke saath sync karta hai."""
+        self.metadata.total_documents = len(self.documents)
+        self.metadata.total_terms = len(self.index)
+        self.metadata.document_ids = list(self.documents.keys())  # Set nahi, List use karo
+        self.metadata.last_updated = datetime.now()
+        self.metadata.version = INDEX_FORMAT_VERSION
+    
     def save(self, filepath: Optional[str] = None) -> bool:
         """
-        Index ko disk pe save karta hai JSON format mein.
+        Index ko disk pe save karta hai JSON format mein (line-delimited: har
+        term aur document ek alag JSON line). Yeh readable export hai - app khud
+        save_binary use karta hai.
         
         Args:
             filepath: Kahan save karna hai (default: config se)
@@ -392,28 +975,23 @@ class InvertedIndex:
             # Directory ensure karo
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
-            # Metadata update
-            self.metadata.total_documents = len(self.documents)
-            self.metadata.total_terms = len(self.index)
-            self.metadata.total_terms = len(self.index)
-            self.metadata.document_ids = list(self.documents.keys())  # Set nahi, List use karo
-            self.metadata.last_updated = datetime.now()
+            self._sync_metadata()
+            self.ensure_idf()
             
-            # Serialize karte hain
-            data = {
-                'metadata': self.metadata.model_dump(),
-                'index': {
-                    term: entry.model_dump() for term, entry in self.index.items()
-                },
-                'documents': {
-                    doc_id: doc.model_dump() for doc_id, doc in self.documents.items()
-                },
-                'stats': self.indexing_stats
-            }
-            
-            # JSON mein save karte hain
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            # NDJSON mein likhte hain: pehli line metadata/doc_ids/stats, phir har term
+            # aur har document ki ek line. Poore index ka ek bada dict memory mein
+            # nahi banta - har record likhte hi chhoot jaata hai
+            with open(filepath, 'wb') as f:
+                f.write(_dump_json_line({
+                    'metadata': self.metadata.model_dump(),
+                    # Internal integer ID order (postings isi order ke IDs use karte hain)
+                    'doc_ids': [doc.doc_id for doc in self._docs_by_int],
+                    'stats': self.indexing_stats
+                }))
+                for entry in self.index.values():
+                    f.write(_dump_json_line({'e': entry.to_dict()}))
+                for doc in self.documents.values():
+                    f.write(_dump_json_line({'d': doc.model_dump()}))
             
             print(f"💾 Index saved: {filepath}")
             print(f"   Terms: {len(self.index)}")
@@ -443,24 +1021,37 @@ class InvertedIndex:
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Metadata load karte hain
-            self.metadata = IndexMetadata(**data['metadata'])
-            
-            # Index load karte hain
-            self.index = {}
-            for term, entry_data in data['index'].items():
-                self.index[term] = IndexEntry(**entry_data)
+            with open(filepath, 'rb') as f:
+                header = _load_json_line(f.readline())
+                
+                # Metadata load karte hain
+                metadata = IndexMetadata(**header['metadata'])
+                if not self._check_version(metadata, filepath):
+                    return False
+                
+                # Baaki lines ek ek karke - term entries aur documents
+                index: Dict[str, IndexEntry] = {}
+                documents: Dict[str, Document] = {}
+                for line in f:
+                    record = _load_json_line(line)
+                    entry_data = record.get('e')
+                    if entry_data is not None:
+                        entry = IndexEntry.from_dict(entry_data)
+                        index[entry.word] = entry
+                    else:
+                        doc = Document(**record['d'])
+                        documents[doc.doc_id] = doc
             
-            # Documents load karte hain
-            self.documents = {}
-            for doc_id, doc_data in data['documents'].items():
-                self.documents[doc_id] = Document(**doc_data)
+            self.metadata = metadata
+            self.index = index
+            self._postings_map = None
+            self.documents = documents
+            self._rebuild_doc_ids(header['doc_ids'])
+            self._rebuild_vocab()
+            self._idf_dirty = False
             
             # Stats load karte hain
-            self.indexing_stats = data.get('stats', {})
+            self.indexing_stats = header.get('stats', {})
             
             print(f"📂 Index loaded: {filepath}")
             print(f"   Terms: {len(self.index)}")
@@ -471,10 +1062,177 @@ class InvertedIndex:
             print(f"[ERROR] Index load karne mein error: {e}")
             return False
     
+    def save_binary(self, filepath: Optional[str] = None) -> bool:
+        """
+        Index ko pickle (binary) format mein save karta hai.
+        JSON ki tarah har entry/document ka dict conversion aur string escaping nahi
+        hota, isliye save/load kaafi tez hai aur file bhi chhoti.
+        
+        Do files bante hain: filepath (metadata, documents, aur har term ka
+        word/df/idf/max frequency + postings offset) aur uske saath <naam>.postings.bin jisme
+        har term ke packed posting arrays ek ke baad ek hain. load_binary postings
+        file ko mmap karta hai, isliye startup pe sirf vocabulary banti hai.
+        
+        Note: pickle file sirf apni storage directory se hi load karni chahiye -
+        untrusted pickle load karna safe nahi hai.
+        
+        Args:
+            filepath: Kahan save karna hai (default: storage/index.pkl)
+        
+        Returns:
+            True agar successful, False otherwise
+        """
+        try:
+            if filepath is None:
+                filepath = str(CONFIG.get_storage_path('index.pkl'))
+            
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            
+            self._sync_metadata()
+            self.ensure_idf()
+            
+            # Postings pehle temp file mein - load_binary wala purana map isi path
+            # ki file padh raha ho sakta hai, use beech mein truncate nahi karna
+            postings_path = _postings_path(filepath)
+            tmp_path = postings_path + '.tmp'
+            terms = []
+            offset = 0
+            with open(tmp_path, 'wb') as f:
+                for entry in self._entries_by_id:
+                    blob = _encode_postings(entry)
+                    f.write(blob)
+                    terms.append((
+                        entry.word, entry.doc_frequency, entry.idf_score,
+                        entry.max_frequency, offset, len(blob)
+                    ))
+                    offset += len(blob)
+            
+            # Jo entries abhi bhi purani file pe hain unke views chhod ke purana map
+            # band karte hain (Windows mapped file replace nahi karne deta), nayi file
+            # lagate hain aur un entries ko naye map pe point karte hain - offsets
+            # wahi hain jo abhi likhe
+            remapped = [
+                (entry, entry_offset)
+                for entry, (_, _, _, _, entry_offset, _) in zip(self._entries_by_id, terms)
+                if isinstance(entry, _MappedIndexEntry) and entry._source is not None
+            ]
+            for entry, _ in remapped:
+                entry._remap(None, 0)
+            if self._postings_map is not None:
+                try:
+                    self._postings_map.close()
+                except BufferError:
+                    # Koi chalti query abhi bhi purane views pakde hai - map
+                    # unke saath hi garbage collect hoga
+                    pass
+                self._postings_map = None
+            os.replace(tmp_path, postings_path)
+            self._postings_map = _map_file(postings_path)
+            for entry, entry_offset in remapped:
+                entry._remap(self._postings_map, entry_offset)
+            
+            data = {
+                'metadata': self.metadata,
+                'terms': terms,
+                'postings_size': offset,
+                'documents': self.documents,
+                'doc_ids': [doc.doc_id for doc in self._docs_by_int],
+                'stats': self.indexing_stats
+            }
+            
+            with open(filepath, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            
+            print(f"💾 Index saved (binary): {filepath}")
+            print(f"   Terms: {len(self.index)}")
+            print(f"   Documents: {len(self.documents)}")
+            return True
+            
+        except Exception as e:
+            print(f"[ERROR] Binary index save karne mein error: {e}")
+            return False
+    
+    def load_binary(self, filepath: Optional[str] = None) -> bool:
+        """
+        save_binary se likhi pickle file load karta hai.
+        Postings file mmap hoti hai - har term ki postings pehli access pe hi
+        memory mein aati hai (_MappedIndexEntry).
+        
+        Args:
+            filepath: Kahan se load karna hai (default: storage/index.pkl)
+            
+        Returns:
+            True agar successful, False otherwise
+        """
+        if filepath is None:
+            filepath = str(CONFIG.get_storage_path('index.pkl'))
+        
+        if not os.path.exists(filepath):
+            print(f"[WARNING] Binary index file nahi mili: {filepath}")
+            return False
+        
+        try:
+            with open(filepath, 'rb') as f:
+                data = pickle.load(f)
+            
+            if not self._check_version(data['metadata'], filepath):
+                return False
+            
+            # Postings file isi save ki honi chahiye (size se check)
+            postings_path = _postings_path(filepath)
+            if not os.path.exists(postings_path) or os.path.getsize(postings_path) != data['postings_size']:
+                print(f"[WARNING] Postings file missing ya mismatch - rebuild karna padega: {postings_path}")
+                return False
+            postings_map = _map_file(postings_path)
+            
+            index: Dict[str, IndexEntry] = {}
+            for word, doc_frequency, idf_score, max_frequency, offset, length in data['terms']:
+                index[word] = _MappedIndexEntry(
+                    word, doc_frequency, idf_score, max_frequency, postings_map, offset, length
+                )
+            
+            self.metadata = data['metadata']
+            self.index = index
+            self._postings_map = postings_map
+            self.documents = data['documents']
+            self._rebuild_doc_ids(data['doc_ids'])
+            self._rebuild_vocab()
+            self._idf_dirty = False
+            self.indexing_stats = data.get('stats', {})
+            
+            print(f"📂 Index loaded (binary): {filepath}")
+            print(f"   Terms: {len(self.index)}")
+            print(f"   Documents: {len(self.documents)}")
+            return True
+            
+        except Exception as e:
+            print(f"[ERROR] Binary index load karne mein error: {e}")
+            return False
+    
+    def _check_version(self, metadata: IndexMetadata, filepath: str) -> bool:
+        """Saved index ka format current code se match karta hai ya nahi."""
+        if metadata.version != INDEX_FORMAT_VERSION:
+            print(
+                f"[WARNING] Index format purana hai ({metadata.version}, chahiye "
+                f"{INDEX_FORMAT_VERSION}) - rebuild karna padega: {filepath}"
+            )
+            return False
+        return True
+    
     def clear(self):
         """Poora index clear karta hai."""
         self.index.clear()
         self.documents.clear()
+        self._doc_id_map.clear()
+        self._docs_by_int.clear()
+        self.doc_lengths = array('I')
+        self._bm25_norms = None
+        self.vocab.clear()
+        self.vocab_inv.clear()
+        self._entries_by_id.clear()
+        self._sorted_terms = None
+        self._postings_map = None
+        self._idf_dirty = False
         self.metadata = IndexMetadata()
         self.indexing_stats = {
             'terms_indexed': 0,
@@ -520,7 +1278,7 @@ class IncrementalIndexer:
         for doc in self.pending_documents:
             self.index.add_document(doc)
         
-        self.index._update_idf_scores()
+        # IDF recalculation lazy hai (InvertedIndex.ensure_idf)
         count = len(self.pending_documents)
         self.pending_documents.clear()
         
@@ -541,7 +1299,7 @@ if __name__ == "__main__":
     index = InvertedIndex()
     
     # Test documents crawl karte hain
-    docs_dir = CONFIG.paths['DOCUMENTS_DIR']
+    docs_dir = CONFIG.paths.DOCUMENTS_DIR
     
     if docs_dir.exists():
         documents = crawl_documents(str(docs_dir))
@@ -551,7 +1309,7 @@ if __name__ == "__main__":
             index.add_documents(iter(documents))
             
             # Save karte hain
-            index.save()
+            index.save_binary()
             
             # Test search
             print("\n🔍 Testing index lookup:")
@@ -563,7 +1321,7 @@ if __name__ == "__main__":
                     print(f"\nTerm: '{term}'")
                     print(f"  Document Frequency: {entry.doc_frequency}")
                     print(f"  IDF Score: {entry.idf_score:.4f}")
-                    print(f"  Documents: {list(entry.postings.keys())[:3]}...")  # Pehle 3
+                    print(f"  Documents: {entry.doc_ids[:3].tolist()}...")  # Pehle 3
                 else:
                     print(f"\nTerm: '{term}' - Not found in index")
             
@@ -10,6 +10,7 @@ API Endpoints:
     - GET  /api/documents/{id} : Specific document get karna
     - GET  /api/stats          : Index statistics
     - POST /api/index          : Documents index karna (admin)
+    - GET  /api/index/status/{job_id} : Background indexing job ka status
     - GET  /health             : Health check
 
 Architecture:
@@ -28,18 +29,38 @@ Production Ready Features:
 
 import os
 import sys
+import time
+import uuid
+import asyncio
 import requests
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 # FastAPI imports
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
-from web_search import search_wikipedia, search_duckduckgo
+from web_search import prewarm, search_all
+
+# httpx optional hai - install ho toh suggest ke upstream calls ek shared async
+# client se jaate hain, warna requests worker threads mein chalta hai
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson optional hai - ho toh API responses usi se render hote hain
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Ensure backend modules import ho sakein
 backend_dir = Path(__file__).parent
@@ -47,12 +68,14 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 # Local imports
-from models import SearchQuery, SearchResponse, Document
+from models import SearchQuery, SearchResponse, Document, content_digest
 from searcher import SearchEngine
-from indexer import InvertedIndex
+from indexer import InvertedIndex, TextPreprocessor
 from crawler import crawl_documents
 from config import CONFIG
 
+CONFIG.setup_logging()
+
 
 # =============================================================================
 # GLOBAL STATE MANAGEMENT
@@ -67,6 +90,20 @@ class AppState:
         self.search_engine: Optional[SearchEngine] = None
         self.is_ready: bool = False
         self.startup_time: Optional[str] = None
+        self.http_client = None  # httpx.AsyncClient (httpx installed ho tab)
+        
+        # Background indexing: crawl + tokenization alag processes mein, taaki
+        # API worker ka GIL free rahe. job_id -> status dict
+        self.index_pool: Optional[ProcessPoolExecutor] = None
+        self.index_jobs: Dict[str, dict] = {}
+        self._job_tasks: set = set()  # Running job tasks ke strong references
+        
+        # Index ko mutate karne wala kaam (merge + save_binary worker thread mein)
+        # aur index padhne wale endpoints isi lock ke andar - save ke beech
+        # postings remap ho rahi hoti hain, us waqt search chale toh toot jaati.
+        # asyncio.Lock hai, toh merge ke dauraan requests wait karti hain par
+        # event loop block nahi hota
+        self.index_lock = asyncio.Lock()
     
     def initialize(self):
         """Search engine initialize karta hai."""
@@ -80,17 +117,16 @@ class AppState:
         if not index_loaded:
             print("⚠️  Existing index nahi mili. Naya index banega documents se.")
             # Auto-indexing enabled hai toh documents se bana lenge
-            docs_dir = CONFIG.paths['DOCUMENTS_DIR']
+            docs_dir = CONFIG.paths.DOCUMENTS_DIR
             if docs_dir.exists() and any(docs_dir.iterdir()):
                 print(f"   Auto-indexing shuru: {docs_dir}")
                 documents = crawl_documents(str(docs_dir))
                 if documents:
                     self.search_engine.build_index(documents)
-                    self.search_engine.index.save()
+                    self.search_engine.index.save_binary()
                     print("   Auto-indexing complete!")
         
         self.is_ready = True
-        from datetime import datetime
         self.startup_time = datetime.now().isoformat()
         
         print("✅ Application ready!")
@@ -99,11 +135,44 @@ class AppState:
         """Cleanup resources."""
         print("🛑 Application shutdown ho rahi hai...")
         self.is_ready = False
+        if self.index_pool is not None:
+            self.index_pool.shutdown(wait=False, cancel_futures=True)
+            self.index_pool = None
 
 
 # Global state instance
 app_state = AppState()
 
+# /api/index: isse zyada files hon toh indexing background job mein hoti hai
+INLINE_INDEX_LIMIT = 10
+
+# Background indexing jobs ke worker processes (ek core API ke liye chhod ke)
+INDEX_JOB_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Itne finished jobs ka status yaad rakhte hain - purane hat jaate hain
+INDEX_JOB_HISTORY = 100
+
+# /api/suggest ke upstream providers (seconds)
+SUGGEST_TIMEOUT = 3
+DUCK_SUGGEST_URL = "https://duckduckgo.com/ac/"
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+
+# Upstream suggestions ka in-memory cache (har keystroke pe request aati hai)
+SUGGEST_CACHE_SIZE = 10_000
+SUGGEST_CACHE_TTL = 300  # seconds
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default response class - body orjson se render hoti hai (C mein, stdlib json
+    se kaafi tez, bade SearchResponse pe fark dikhta hai). orjson na ho toh
+    normal JSONResponse jaisa hi.
+    """
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 
 # =============================================================================
@@ -118,8 +187,18 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     app_state.initialize()
+    app_state.index_pool = ProcessPoolExecutor(
+        max_workers=INDEX_JOB_WORKERS, mp_context=CONFIG.process_context()
+    )
+    if httpx is not None:
+        app_state.http_client = httpx.AsyncClient(timeout=SUGGEST_TIMEOUT)
+    # Web search ke upstream connections background mein pehle se khol lo
+    prewarm()
     yield
     # Shutdown
+    if app_state.http_client is not None:
+        await app_state.http_client.aclose()
+        app_state.http_client = None
     app_state.cleanup()
 
 
@@ -142,7 +221,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware - frontend ko allow karne ke liye
@@ -215,6 +295,24 @@ class ErrorResponse(BaseModel):
 # API ENDPOINTS
 # =============================================================================
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Client ke If-None-Match mein yeh ETag (ya "*") hai? Weak comparison -
+    W/ prefix ignore hota hai (RFC 9110).
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _cache_headers(etag: str) -> dict:
+    # no-cache = browser rakh sakta hai, bas har baar ETag se revalidate kare
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -230,20 +328,8 @@ async def root():
 
 @app.get("/api/web-search", tags=["Search"])
 async def web_search(q: str = Query(..., min_length=1)):
-    results = {
-        'wikipedia': None,
-        'web_results': []
-    }
-    
-    wiki = search_wikipedia(q)
-    if wiki:
-        results['wikipedia'] = wiki
-    
-    web = search_duckduckgo(q)
-    if web:
-        results['web_results'] = web
-    
-    return results
+    # Wikipedia + DuckDuckGo ek saath, worker threads mein - event loop block nahi hota
+    return await search_all(q)
 
 
 @app.get("/health", response_model=HealthResponse, tags=["System"])
@@ -260,7 +346,8 @@ async def health_check():
             detail="Service abhi initialize ho raha hai..."
         )
     
-    stats = app_state.search_engine.get_index_stats()
+    async with app_state.index_lock:
+        stats = app_state.search_engine.get_index_stats()
     
     return HealthResponse(
         status="healthy",
@@ -309,8 +396,9 @@ async def search_documents(request: SearchRequest):
             per_page=request.per_page
         )
         
-        # Search execute karte hain
-        response = app_state.search_engine.search(search_query)
+        # Search execute karte hain (background merge chal raha ho toh uske baad)
+        async with app_state.index_lock:
+            response = app_state.search_engine.search(search_query)
         
         return response
         
@@ -329,10 +417,14 @@ async def search_documents(request: SearchRequest):
         404: {"description": "Document not found"}
     }
 )
-async def get_document(doc_id: str):
+async def get_document(doc_id: str, request: Request):
     """
     Specific document ID se full document retrieve karta hai.
     
+    Body ek hi baar render hoti hai aur usi ke hash se ETag banta hai (stats
+    jaisa) - content ke saath metadata (indexed_at, title, tokens) badle toh
+    ETag bhi badalta hai. Client If-None-Match bheje aur body same ho toh 304.
+    
     Args:
         doc_id: URL-encoded document ID (usually file path)
         
@@ -349,7 +441,8 @@ async def get_document(doc_id: str):
     import urllib.parse
     decoded_id = urllib.parse.unquote(doc_id)
     
-    document = app_state.search_engine.get_document_by_id(decoded_id)
+    async with app_state.index_lock:
+        document = app_state.search_engine.get_document_by_id(decoded_id)
     
     if not document:
         raise HTTPException(
@@ -357,14 +450,23 @@ async def get_document(doc_id: str):
             detail=f"Document nahi mila: {decoded_id}"
         )
     
-    return document
+    body = FastJSONResponse(jsonable_encoder(document))
+    etag = f'"{content_digest(body.body)}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+    
+    body.headers.update(_cache_headers(etag))
+    return body
 
 
 @app.get("/api/stats", tags=["System"])
-async def get_statistics():
+async def get_statistics(request: Request):
     """
     Index ki detailed statistics return karta hai.
     
+    Body ek hi baar render hoti hai aur usi ke hash se ETag banta hai -
+    client ke paas same stats hon toh 304 (body nahi bhejte).
+    
     Returns:
         Statistics about documents, terms, aur index size
     """
@@ -374,7 +476,14 @@ async def get_statistics():
             detail="Service not ready"
         )
     
-    return app_state.search_engine.get_index_stats()
+    async with app_state.index_lock:
+        stats = FastJSONResponse(jsonable_encoder(app_state.search_engine.get_index_stats()))
+    etag = f'"{content_digest(stats.body)}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+    
+    stats.headers.update(_cache_headers(etag))
+    return stats
 
 
 @app.post(
@@ -386,15 +495,13 @@ async def get_statistics():
         400: {"description": "Invalid path"}
     }
 )
-async def index_documents(
-    request: IndexRequest,
-    background_tasks: BackgroundTasks
-):
+async def index_documents(request: IndexRequest):
     """
     **Admin Endpoint** - Documents ko index karta hai.
     
     Naya ya updated documents ko index mein add karta hai.
-    Agar documents zyada hain toh background mein process hota hai.
+    Agar documents zyada hain toh background job banti hai - crawl aur
+    tokenization worker process mein, progress /api/index/status/{job_id} pe.
     
     Args:
         request: IndexRequest with path and options
@@ -416,26 +523,22 @@ async def index_documents(
             detail=f"Path exist nahi karti: {request.path}"
         )
     
-    # Check karte hain ki kitni files hain
+    # Check karte hain ki kitni files hain (threshold paar hote hi ginti band)
     if path.is_file():
         doc_count = 1
     else:
-        # Estimate count
-        doc_count = len(list(path.glob('**/*.txt'))) + \
-                   len(list(path.glob('**/*.md')))
-    
-    # Agar zyada documents hain toh background mein karenge
-    if doc_count > 10:
-        background_tasks.add_task(
-            _background_indexing,
-            str(path),
-            request.recursive
-        )
+        doc_count = _count_or_threshold(str(path), ('.txt', '.md'), INLINE_INDEX_LIMIT)
+    
+    # Agar zyada documents hain toh background job mein karenge
+    if doc_count > INLINE_INDEX_LIMIT:
+        job_id = _start_index_job(str(path), request.recursive)
         
         return {
             "status": "indexing_started",
-            "message": f"Background indexing shuru ho gayi hai ({doc_count} estimated files)",
-            "path": str(path)
+            "message": f"Background indexing shuru ho gayi hai ({INLINE_INDEX_LIMIT}+ estimated files)",
+            "path": str(path),
+            "job_id": job_id,
+            "status_url": f"/api/index/status/{job_id}"
         }
     else:
         # Direct indexing
@@ -443,12 +546,11 @@ async def index_documents(
             documents = crawl_documents(str(path), request.recursive)
             
             if documents:
-                # Existing index mein add karte hain
-                for doc in documents:
-                    app_state.search_engine.index.add_document(doc)
-                
-                # Save karte hain
-                app_state.search_engine.index.save()
+                async with app_state.index_lock:
+                    # Existing index mein ek batch mein add + save, worker thread
+                    # mein (bade batches ki tokenization worker processes mein
+                    # hoti hai) - event loop merge ke dauraan block nahi hota
+                    await asyncio.to_thread(_merge_index_job, documents, None)
                 
                 return {
                     "status": "indexing_complete",
@@ -468,72 +570,258 @@ async def index_documents(
             )
 
 
-def _background_indexing(path: str, recursive: bool):
+def _count_or_threshold(path: str, exts: tuple, threshold: int) -> int:
     """
-    Background task jo heavy indexing handle karta hai.
+    Directory tree mein exts wali files ginta hai, lekin count threshold se
+    upar jaate hi ruk jaata hai - poora tree walk/list nahi hota.
     
     Args:
-        path: Directory ya file path
-        recursive: Subdirectories include karni hain?
+        path: Directory path
+        exts: File extensions (jaise ('.txt', '.md'))
+        threshold: Isse zyada files milte hi return
+        
+    Returns:
+        File count (threshold + 1 pe capped)
+    """
+    count = 0
+    pending = [path]
+    
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(exts):
+                        count += 1
+                        if count > threshold:
+                            return count
+        except OSError:
+            # Permission denied wagairah - woh directory skip
+            continue
+    
+    return count
+
+
+def _crawl_and_analyze(path: str, recursive: bool, store_positions: bool):
+    """
+    Index job ka CPU wala hissa - worker process mein chalta hai.
+    Files padhna/decode/hash (crawl) aur har document ka tokenize + count
+    yahin hota hai; main process ko sirf merge karna padta hai.
+    
+    Returns:
+        (documents, har document ka TextPreprocessor.analyze result)
+    """
+    documents = crawl_documents(path, recursive)
+    preprocessor = TextPreprocessor()
+    analyzed = [preprocessor.analyze(doc.content, store_positions) for doc in documents]
+    return documents, analyzed
+
+
+def _merge_index_job(documents: List[Document], analyzed: Optional[list]):
+    """
+    Documents ko live index mein merge karke save karta hai (thread mein).
+    analyzed worker process ka tokenization result hai; None ho toh
+    add_documents khud tokenize karta hai (inline /api/index path).
+    Caller app_state.index_lock pakad ke rakhta hai.
+    """
+    index = app_state.search_engine.index
+    index.add_documents(documents, analyzed)
+    index.save_binary()
+    # Naye documents aane ke baad cached search responses purane ho gaye
+    app_state.search_engine.invalidate_cache()
+
+
+def _start_index_job(path: str, recursive: bool) -> str:
+    """Background indexing job shuru karta hai aur uska job_id return karta hai."""
+    job_id = uuid.uuid4().hex
+    app_state.index_jobs[job_id] = {
+        "job_id": job_id,
+        "status": "running",
+        "path": path,
+        "started_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "documents_indexed": None,
+        "error": None
+    }
+    task = asyncio.create_task(_run_index_job(job_id, path, recursive))
+    app_state._job_tasks.add(task)
+    task.add_done_callback(app_state._job_tasks.discard)
+    return job_id
+
+
+async def _run_index_job(job_id: str, path: str, recursive: bool):
     """
-    print(f"[BACKGROUND] Indexing shuru: {path}")
+    Job ko worker process mein chalata hai, phir merge + save ek thread mein -
+    event loop poore waqt free rehta hai.
+    """
+    job = app_state.index_jobs[job_id]
+    print(f"[BACKGROUND] Indexing shuru: {path} (job {job_id})")
     
     try:
-        documents = crawl_documents(path, recursive)
-        
-        for doc in documents:
-            app_state.search_engine.index.add_document(doc)
+        loop = asyncio.get_running_loop()
+        documents, analyzed = await loop.run_in_executor(
+            app_state.index_pool,
+            _crawl_and_analyze,
+            path,
+            recursive,
+            CONFIG.indexer.STORE_POSITIONS
+        )
         
-        app_state.search_engine.index.save()
+        job["status"] = "merging"
+        async with app_state.index_lock:
+            await asyncio.to_thread(_merge_index_job, documents, analyzed)
         
+        job["status"] = "complete"
+        job["documents_indexed"] = len(documents)
         print(f"[BACKGROUND] Indexing complete: {len(documents)} documents")
         
     except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
         print(f"[BACKGROUND ERROR] {e}")
+    
+    finally:
+        job["finished_at"] = datetime.now().isoformat()
+        _prune_index_jobs()
+
+
+def _prune_index_jobs():
+    """Sabse purane finished jobs hatata hai - INDEX_JOB_HISTORY se zyada nahi rehte."""
+    finished = [
+        job_id for job_id, job in app_state.index_jobs.items()
+        if job["finished_at"] is not None
+    ]
+    for job_id in finished[:max(0, len(finished) - INDEX_JOB_HISTORY)]:
+        del app_state.index_jobs[job_id]
+
+
+@app.get("/api/index/status/{job_id}", tags=["Admin"])
+async def get_index_status(job_id: str):
+    """
+    **Admin Endpoint** - Background indexing job ka status.
+    
+    Status: running (crawl + tokenization) -> merging -> complete / failed.
+    
+    Args:
+        job_id: /api/index ka diya hua job_id
+    """
+    job = app_state.index_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Indexing job nahi mili: {job_id}"
+        )
+    return job
+
+
+async def _get_json(url: str, params: dict, headers: Optional[dict] = None):
+    """
+    Upstream API se JSON GET karta hai. Non-200 (jaise 429/503) pe error raise
+    hota hai, taaki caller use failure gine - "koi suggestion nahi" maan ke
+    cache na kare.
+    httpx ho toh shared AsyncClient, warna requests.get ek worker thread mein -
+    dono surat mein event loop free rehta hai.
+    """
+    client = app_state.http_client
+    if client is not None:
+        response = await client.get(url, params=params, headers=headers)
+    else:
+        response = await asyncio.to_thread(
+            requests.get, url, params=params, headers=headers, timeout=SUGGEST_TIMEOUT
+        )
+    
+    if response.status_code != 200:
+        raise RuntimeError(f"Upstream ne HTTP {response.status_code} diya: {url}")
+    return response.json()
+
+
+async def _duck_suggestions(q: str) -> List[str]:
+    """DuckDuckGo autocomplete se top 4 suggestions."""
+    data = await _get_json(
+        DUCK_SUGGEST_URL,
+        {'q': q, 'type': 'list'},
+        headers={'User-Agent': 'Mozilla/5.0'}
+    )
+    if data and len(data) > 1 and isinstance(data[1], list):
+        return data[1][:4]
+    return []
+
+
+async def _wiki_suggestions(q: str) -> List[str]:
+    """Wikipedia opensearch se top 3 suggestions."""
+    data = await _get_json(
+        WIKI_API_URL,
+        {'action': 'opensearch', 'search': q, 'limit': 3, 'format': 'json'}
+    )
+    if data and len(data) > 1 and isinstance(data[1], list):
+        return data[1][:3]
+    return []
+
+
+# q.strip().lower() -> (expiry time, upstream suggestions); LRU order mein
+_suggest_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+async def _remote_suggestions(q: str) -> List[str]:
+    """
+    DuckDuckGo + Wikipedia suggestions (us order mein), SUGGEST_CACHE_TTL tak
+    cached. Sirf cache miss pe network calls hoti hain - dono ek saath
+    (concurrently), toh latency dono ka sum nahi, max hoti hai. Koi provider
+    fail ho toh result cache nahi hota, agli baar dobara try hoga.
+    """
+    key = q.strip().lower()
+    now = time.monotonic()
+    cached = _suggest_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _suggest_cache.move_to_end(key)
+            return cached[1]
+        del _suggest_cache[key]
+    
+    duck_result, wiki_result = await asyncio.gather(
+        _duck_suggestions(q),
+        _wiki_suggestions(q),
+        return_exceptions=True
+    )
+    
+    suggestions = []
+    failed = False
+    if isinstance(duck_result, Exception):
+        print(f"DuckDuckGo suggest error: {duck_result}")
+        failed = True
+    else:
+        suggestions.extend(duck_result)
+    
+    if isinstance(wiki_result, Exception):
+        print(f"Wikipedia suggest error: {wiki_result}")
+        failed = True
+    else:
+        suggestions.extend(wiki_result)
+    
+    if not failed:
+        _suggest_cache[key] = (now + SUGGEST_CACHE_TTL, suggestions)
+        if len(_suggest_cache) > SUGGEST_CACHE_SIZE:
+            _suggest_cache.popitem(last=False)
+    return suggestions
 
 
 @app.get("/api/suggest", tags=["Search"])
 async def get_suggestions(q: str = Query(..., min_length=1)):
     suggestions = []
     
-    # 1. Local index se - sahi tarike se access karo
+    # 1. Local index se - sorted vocabulary pe prefix lookup (poori vocab scan nahi)
     try:
         if app_state.is_ready and app_state.search_engine:
-            local_terms = [
-                term for term in app_state.search_engine.index.index.keys() 
-                if term.startswith(q.lower())
-            ][:2]
+            async with app_state.index_lock:
+                local_terms = app_state.search_engine.index.terms_with_prefix(q.lower(), limit=2)
             suggestions.extend(local_terms)
     except Exception as e:
         print(f"Local suggest error: {e}")
     
-    # 2. DuckDuckGo Suggest API
-    try:
-        duck_url = f"https://duckduckgo.com/ac/?q={q}&type=list"
-        response = requests.get(
-            duck_url, 
-            timeout=3, 
-            headers={'User-Agent': 'Mozilla/5.0'}
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if len(data) > 1 and isinstance(data[1], list):
-                duck_suggestions = data[1][:4]
-                suggestions.extend(duck_suggestions)
-    except Exception as e:
-        print(f"DuckDuckGo suggest error: {e}")
-    
-    # 3. Wikipedia search suggestions
-    try:
-        wiki_url = f"https://en.wikipedia.org/w/api.php?action=opensearch&search={q}&limit=3&format=json"
-        response = requests.get(wiki_url, timeout=3)
-        if response.status_code == 200:
-            data = response.json()
-            if len(data) > 1 and isinstance(data[1], list):
-                wiki_suggestions = data[1][:3]
-                suggestions.extend(wiki_suggestions)
-    except Exception as e:
-        print(f"Wikipedia suggest error: {e}")
+    # 2 + 3. DuckDuckGo aur Wikipedia suggestions (cache se, ya ek saath fetch).
+    # Local terms cache nahi hote - indexing ke saath badalte hain
+    suggestions.extend(await _remote_suggestions(q))
     
     # Remove duplicates
     seen = set()
@@ -594,7 +882,25 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     reload = os.getenv("RELOAD", "false").lower() == "true"
     
-    print(f"🌐 Server start ho raha hai: http://{host}:{port}")
+    # Default ek hi worker - index, index_jobs aur save files process-local
+    # hain. WORKERS > 1 sirf read-only serving ke liye hai: har worker ka apna
+    # index hota hai, toh /api/index se update sirf ek worker ko dikhega, job
+    # status doosre worker pe 404 dega aur saves ek hi files pe race karenge.
+    # Reload mode sirf ek worker ke saath chalta hai
+    workers = 1 if reload else max(1, int(os.getenv("WORKERS", 1)))
+    
+    if workers > 1:
+        # Saved index na ho toh workers startup pe ek saath auto-index karke same
+        # files likhte - isliye index yahin ek baar ban ke save ho jaata hai. Workers
+        # use load_binary se load karte hain: postings file mmap hoti hai, toh
+        # postings ki ek hi physical copy (OS page cache) saare workers share karte
+        # hain.
+        print("⚠️ WORKERS > 1: /api/index updates workers ke beech share nahi hote - read-only serving ke liye hi use karein")
+        app_state.initialize()
+        app_state.cleanup()
+        app_state.search_engine = None
+    
+    print(f"🌐 Server start ho raha hai: http://{host}:{port} ({workers} workers)")
     print(f"📚 API Documentation: http://{host}:{port}/docs")
     print("=" * 60)
     
@@ -604,5 +910,6 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
         log_level="info"
     )
\ No newline at end of file
@@ -14,10 +14,50 @@ Design Philosophy:
 
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Set
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from enum import Enum
 import hashlib
+import re
 import json
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate
+
+# xxhash optional hai - install ho toh uska xxh3 use karte hain (SIMD, bohot fast),
+# warna stdlib ka blake2b (8 byte digest) jo MD5 se fast hai
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Saved index ka format version - postings ka layout badle toh isse badhana hai,
+# taaki purani index files load hone ki jagah rebuild ho jaayein
+INDEX_FORMAT_VERSION = "2.5.0"
+
+# SearchQuery.get_terms ka simple tokenizer
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+
+def content_hasher():
+    """
+    Streaming hasher return karta hai (update() / hexdigest() interface).
+    content_digest ke saath same result deta hai, bas chunks mein feed kar sakte hain.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+def content_digest(data: bytes) -> str:
+    """
+    Content ka non-cryptographic 64-bit hash hex string mein return karta hai.
+    Duplicate/change detection ke liye kaafi hai, security ke liye nahi.
+    """
+    hasher = content_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
 
 
 class DocumentType(str, Enum):
@@ -32,54 +72,253 @@ class DocumentType(str, Enum):
     PDF = "pdf"  # Future ke liye placeholder
 
 
-class IndexEntry(BaseModel):
+class IndexEntry:
     """
     Inverted Index ka ek entry represent karta hai.
     Har word ke liye kaunse documents mein hai aur kitni baar hai.
     
+    Postings internal integer doc IDs ki hain (InvertedIndex assign karta hai);
+    external doc_id string sirf document store mein rehta hai.
+    
+    Postings dict-of-dicts nahi, packed arrays mein hain (CSR layout):
+        doc_ids     - sorted internal doc IDs, array('I')
+        freqs       - har doc mein term frequency (doc_ids ke parallel)
+        pos_offsets - doc i ki positions = positions[pos_offsets[i]:pos_offsets[i + 1]]
+        positions   - saari positions ek flat array mein
+    Har posting 8 bytes (+ positions ke 4 bytes each) - na per-doc dict, na int
+    objects. positions/pos_offsets sirf IndexerConfig.STORE_POSITIONS on ho tab
+    bante hain, warna None. Doc IDs badhte order mein aate hain, isliye add
+    hamesha array ke end pe append hai; lookup bisect se.
+    
+    Yeh Pydantic model nahi hai - har term ke liye ek object banta hai aur indexing
+    mein lakhon baar touch hota hai, isliye plain __slots__ class rakhi hai
+    (na per-instance __dict__, na validation). Pickle state ek tuple hai aur JSON
+    export ke liye to_dict / from_dict hain.
+    
     Example:
         word: "python"
-        postings: {
-            "doc1.txt": {"frequency": 5, "positions": [10, 25, 30, 45, 60]},
-            "doc2.txt": {"frequency": 2, "positions": [5, 15]}
-        }
+        doc_ids: [0, 3], freqs: [5, 2]
+        pos_offsets: [0, 5, 7], positions: [10, 25, 30, 45, 60, 5, 15]
     """
-    word: str = Field(..., description="Index kiya gaya word")
-    
-    # Postings list: {doc_id: {frequency: int, positions: List[int]}}
-    postings: Dict[str, Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Kaunse documents mein hai aur metadata"
+    __slots__ = (
+        'word', 'doc_ids', 'freqs', 'pos_offsets', 'positions',
+        'doc_frequency', 'idf_score', 'max_frequency', 'bm25_idf'
     )
     
-    # Document frequency: kitne unique docs mein ye word hai
-    doc_frequency: int = Field(default=0, description="Document frequency")
-    
-    # Inverse document frequency (TF-IDF ke liye)
-    idf_score: float = Field(default=0.0, description="IDF score")
+    def __init__(
+        self,
+        word: str,
+        doc_ids: Optional[array] = None,
+        freqs: Optional[array] = None,
+        pos_offsets: Optional[array] = None,
+        positions: Optional[array] = None,
+        idf_score: float = 0.0,
+        max_frequency: Optional[int] = None,
+        bm25_idf: float = 0.0
+    ):
+        # Index kiya gaya word
+        self.word = word
+        
+        # Postings (packed, doc_ids sorted)
+        self.doc_ids = array('I') if doc_ids is None else doc_ids
+        self.freqs = array('I') if freqs is None else freqs
+        self.pos_offsets = pos_offsets
+        self.positions = positions
+        
+        # Document frequency: kitne unique docs mein ye word hai
+        self.doc_frequency = len(self.doc_ids)
+        
+        # Inverse document frequency (TF-IDF ke liye)
+        self.idf_score = idf_score
+        
+        # Kisi ek document mein sabse zyada frequency (BM25 upper bound / pruning ke liye)
+        if max_frequency is None:
+            max_frequency = max(self.freqs, default=0)
+        self.max_frequency = max_frequency
+        
+        # BM25 IDF - InvertedIndex IDF update ke saath bharta hai, taaki scoring
+        # har query pe log dobara na nikale
+        self.bm25_idf = bm25_idf
+    
+    def __getstate__(self):
+        return (
+            self.word, self.doc_ids, self.freqs, self.pos_offsets, self.positions,
+            self.doc_frequency, self.idf_score, self.max_frequency, self.bm25_idf
+        )
+    
+    def __setstate__(self, state):
+        (self.word, self.doc_ids, self.freqs, self.pos_offsets, self.positions,
+         self.doc_frequency, self.idf_score, self.max_frequency, self.bm25_idf) = state
+    
+    def __repr__(self) -> str:
+        return (
+            f"IndexEntry(word={self.word!r}, doc_frequency={self.doc_frequency}, "
+            f"idf_score={self.idf_score})"
+        )
+    
+    def _slot(self, doc_id: int) -> int:
+        """
+        doc_id ki posting ka index. Posting nahi hai toh sorted jagah pe
+        frequency 0 (aur khaali positions) wali posting banti hai - normal case
+        mein yeh end pe append hi hai.
+        """
+        doc_ids = self.doc_ids
+        n = len(doc_ids)
+        if n and doc_ids[-1] >= doc_id:
+            if doc_ids[-1] == doc_id:
+                return n - 1
+            i = bisect_left(doc_ids, doc_id)
+            if doc_ids[i] == doc_id:
+                return i
+        else:
+            i = n
+        
+        doc_ids.insert(i, doc_id)
+        self.freqs.insert(i, 0)
+        if self.pos_offsets is not None:
+            self.pos_offsets.insert(i + 1, self.pos_offsets[i])
+        self.doc_frequency = n + 1
+        return i
+    
+    def _add_frequency(self, i: int, frequency: int):
+        freqs = self.freqs
+        freqs[i] += frequency
+        if freqs[i] > self.max_frequency:
+            self.max_frequency = freqs[i]
+    
+    def _add_positions(self, i: int, positions):
+        """Posting i ki positions ke end mein positions jodta hai."""
+        pos_offsets = self.pos_offsets
+        if pos_offsets is None:
+            # Ab tak sirf frequency wali postings thi - unki positions khaali
+            pos_offsets = self.pos_offsets = array('I', [0]) * (len(self.doc_ids) + 1)
+            self.positions = array('I')
+        
+        if i == len(pos_offsets) - 2:
+            self.positions.extend(positions)
+            pos_offsets[-1] = len(self.positions)
+            return
+        
+        end = pos_offsets[i + 1]
+        self.positions[end:end] = array('I', positions)
+        count = len(positions)
+        for j in range(i + 1, len(pos_offsets)):
+            pos_offsets[j] += count
     
-    def add_posting(self, doc_id: str, position: int, frequency: int = 1):
+    def add_posting(self, doc_id: int, position: int, frequency: int = 1):
         """
         Naya posting add karta hai ya existing ko update karta hai.
         
         Args:
-            doc_id: Document ka unique identifier (filename)
+            doc_id: Document ka internal integer ID
             position: Word ka position document mein (0-indexed)
             frequency: Kitni baar word aaya hai
         """
-        if doc_id not in self.postings:
-            self.postings[doc_id] = {
-                'frequency': 0,
-                'positions': []
-            }
+        i = self._slot(doc_id)
+        self._add_frequency(i, frequency)
+        self._add_positions(i, (position,))
+    
+    def add_postings(self, doc_id: int, positions: List[int], frequency: Optional[int] = None):
+        """
+        Ek document mein term ki saari positions ek saath add karta hai.
+        Indexing mein har occurrence pe add_posting call karne se sasta hai -
+        posting per (term, doc) sirf ek baar likhi jaati hai.
         
-        self.postings[doc_id]['frequency'] += frequency
-        self.postings[doc_id]['positions'].append(position)
-        self.doc_frequency = len(self.postings)
+        Args:
+            doc_id: Document ka internal integer ID
+            positions: Term ki saari positions
+            frequency: Kitni baar term aaya hai (default: len(positions))
+        """
+        if frequency is None:
+            frequency = len(positions)
+        
+        i = self._slot(doc_id)
+        self._add_frequency(i, frequency)
+        self._add_positions(i, positions)
     
-    model_config = {
-        "extra": "forbid"
-    }
+    def add_posting_freq(self, doc_id: int, frequency: int):
+        """
+        Sirf frequency wali posting add karta hai (positions store nahi hoti -
+        IndexerConfig.STORE_POSITIONS off ho tab indexer yahi use karta hai).
+        
+        Args:
+            doc_id: Document ka internal integer ID
+            frequency: Kitni baar term aaya hai
+        """
+        self._add_frequency(self._slot(doc_id), frequency)
+    
+    def frequency(self, doc_id: int) -> int:
+        """Document mein term ki frequency (posting na ho toh 0) - bisect lookup."""
+        doc_ids = self.doc_ids
+        i = bisect_left(doc_ids, doc_id)
+        if i < len(doc_ids) and doc_ids[i] == doc_id:
+            return self.freqs[i]
+        return 0
+    
+    def get_positions(self, doc_id: int) -> Optional[array]:
+        """Document mein term ki positions (positions store nahi hui ya posting nahi - None)."""
+        if self.pos_offsets is None:
+            return None
+        doc_ids = self.doc_ids
+        i = bisect_left(doc_ids, doc_id)
+        if i < len(doc_ids) and doc_ids[i] == doc_id:
+            return self.positions[self.pos_offsets[i]:self.pos_offsets[i + 1]]
+        return None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-friendly dict return karta hai (arrays plain lists mein).
+        """
+        return {
+            'word': self.word,
+            'doc_ids': self.doc_ids.tolist(),
+            'freqs': self.freqs.tolist(),
+            'pos_offsets': None if self.pos_offsets is None else self.pos_offsets.tolist(),
+            'positions': None if self.positions is None else self.positions.tolist(),
+            'idf_score': self.idf_score,
+            'max_frequency': self.max_frequency,
+            'bm25_idf': self.bm25_idf
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexEntry":
+        """
+        to_dict (ya JSON file) wale dict se IndexEntry banata hai.
+        """
+        pos_offsets = data.get('pos_offsets')
+        positions = data.get('positions')
+        return cls(
+            word=data['word'],
+            doc_ids=array('I', data.get('doc_ids', ())),
+            freqs=array('I', data.get('freqs', ())),
+            pos_offsets=None if pos_offsets is None else array('I', pos_offsets),
+            positions=None if positions is None else array('I', positions),
+            idf_score=data.get('idf_score', 0.0),
+            max_frequency=data.get('max_frequency'),
+            bm25_idf=data.get('bm25_idf', 0.0)
+        )
+
+
+_NON_SPACE_RE = re.compile(r'\S')
+
+
+def _first_line(text: str) -> str:
+    """
+    text.strip().split('\n')[0] jaisa hi result deta hai, lekin poora
+    content split/copy nahi karta - sirf shuru ki line tak scan hota hai.
+    """
+    match = _NON_SPACE_RE.search(text)
+    if match is None:
+        return ''
+    
+    start = match.start()
+    end = text.find('\n', start)
+    
+    # Newline ke baad kuch bhi non-whitespace nahi hai toh strip() ne
+    # woh newline hata di hoti - tab poora (right-stripped) text hi first line hai
+    if end == -1 or _NON_SPACE_RE.search(text, end) is None:
+        return text[start:].rstrip()
+    return text[start:end]
 
 
 class Document(BaseModel):
@@ -102,6 +341,14 @@ class Document(BaseModel):
     # Preprocessed content (tokenized, cleaned)
     tokens: List[str] = Field(default_factory=list, description="Tokenized words")
     
+    # Term -> frequency map (indexing ke waqt banta hai; save/API dump mein nahi jaata,
+    # load ke baad zarurat pade toh tokens se dobara ban jaata hai)
+    term_freqs: Dict[str, int] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Per-term frequency in this document"
+    )
+    
     # Document ka size bytes mein
     file_size: int = Field(default=0, description="File size in bytes")
     
@@ -117,14 +364,37 @@ class Document(BaseModel):
     unique_words: int = Field(default=0, description="Unique words count")
     
     # Content hash for change detection
-    content_hash: Optional[str] = Field(default=None, description="MD5 hash of content")
+    content_hash: Optional[str] = Field(default=None, description="64-bit hash of content (hex)")
+    
+    # File kis encoding mein decode hui (diagnostics ke liye)
+    encoding: Optional[str] = Field(default=None, description="Detected text encoding")
+    
+    # (tokens, lowercased tokens ka frozenset) - har search result pe dobara nahi banta
+    _tokens_lower: Optional[tuple] = PrivateAttr(default=None)
+    
+    @property
+    def tokens_lower_set(self) -> frozenset:
+        """
+        Lowercased tokens ka frozenset - matched terms ka O(1) membership check.
+        Pehli baar maangne pe banta hai aur tokens list badle tabhi dobara.
+        """
+        cached = self._tokens_lower
+        if cached is None or cached[0] is not self.tokens:
+            cached = self._tokens_lower = (
+                self.tokens, frozenset(t.lower() for t in self.tokens if t)
+            )
+        return cached[1]
     
     def compute_hash(self) -> str:
         """
-        Content ka MD5 hash calculate karta hai.
+        Content ka 64-bit hash return karta hai (content_digest dekho).
         Isse pata chalta hai ki document change hua hai ya nahi.
+        
+        Crawler file padhte waqt hi raw bytes ka hash bana deta hai, us case mein
+        yahan sirf wahi value return hoti hai - content dobara scan nahi hota.
         """
-        self.content_hash = hashlib.md5(self.content.encode('utf-8')).hexdigest()
+        if self.content_hash is None:
+            self.content_hash = content_digest(self.content.encode('utf-8'))
         return self.content_hash
     
     def extract_title(self) -> str:
@@ -132,9 +402,9 @@ class Document(BaseModel):
         Document se title extract karne ki koshish karta hai.
         Pehli line ko title maan sakte hain agar chhoti ho.
         """
-        lines = self.content.strip().split('\n')
-        if lines and len(lines[0]) < 100:  # 100 chars se chhota ho toh title hai
-            self.title = lines[0].strip()
+        first_line = _first_line(self.content)
+        if len(first_line) < 100:  # 100 chars se chhota ho toh title hai
+            self.title = first_line.strip()
         else:
             self.title = self.doc_id  # Fallback to filename
         return self.title
@@ -153,6 +423,54 @@ class Document(BaseModel):
     }
 
 
+def _best_snippet_window(
+    content_lower: str,
+    query_terms: List[str],
+    snippet_length: int,
+    step: int = 10
+) -> int:
+    """
+    Snippet window ka start position (step ke multiples) jisme sabse zyada query
+    terms poore aate hain - pehla aisa window, koi match na ho toh 0.
+    
+    Har window slice karke har term dhoondhne (O(windows * terms * length)) ki
+    jagah har term ke occurrences str.find se ek baar nikalte hain. Har occurrence
+    jin windows mein poora aata hai woh ek continuous range hai, toh un ranges ko
+    difference array mein jod ke prefix sum se har window ka count mil jaata hai.
+    Query mein term do baar ho toh do baar ginta hai (purane scan jaisa).
+    """
+    window_count = (len(content_lower) - snippet_length + step - 1) // step
+    if window_count <= 0:
+        return 0
+    
+    diff = [0] * (window_count + 1)
+    for term, weight in Counter(term.lower() for term in query_terms).items():
+        term_length = len(term)
+        if not term or term_length > snippet_length:
+            continue
+        
+        # Occurrences badhte order mein aate hain, toh ek term ke ranges ka union
+        # (ek window mein term ek hi baar gina jaaye) last_covered se ho jaata hai
+        last_covered = -1
+        pos = content_lower.find(term)
+        while pos != -1:
+            first = max(0, -(-(pos + term_length - snippet_length) // step), last_covered + 1)
+            if first >= window_count:
+                break
+            last = min(window_count - 1, pos // step)
+            if first <= last:
+                diff[first] += weight
+                diff[last + 1] -= weight
+                last_covered = last
+            pos = content_lower.find(term, pos + 1)
+    
+    counts = list(accumulate(diff[:window_count]))
+    max_matches = max(counts)
+    if max_matches <= 0:
+        return 0
+    return counts.index(max_matches) * step
+
+
 class SearchResult(BaseModel):
     """
     Ek search result ko represent karta hai.
@@ -193,40 +511,53 @@ class SearchResult(BaseModel):
     idf_score: float = Field(default=0.0, description="IDF component")
     length_norm: float = Field(default=0.0, description="Length normalization")
     
-    def generate_snippet(self, query_terms: List[str], snippet_length: int = 150):
+    # (content, content.lower()) - generate_snippet dobara call ho toh lower() dobara nahi
+    _content_lower: Optional[tuple] = PrivateAttr(default=None)
+    
+    def generate_snippet(
+        self,
+        query_terms: List[str],
+        snippet_length: int = 150,
+        content: Optional[str] = None
+    ):
         """
         Query terms ke around ek relevant snippet generate karta hai.
         
         Args:
             query_terms: Query mein aaye words
             snippet_length: Kitne characters ka snippet chahiye
+            content: Source text - diya ho toh result mein content rakhe bina
+                     (aur lowercase memo ke bina) usi se snippet banta hai
         """
-        if not self.content:
+        memoize = content is None
+        if memoize:
+            content = self.content
+        
+        if not content:
             self.snippet = "No content available"
             return
         
-        content_lower = self.content.lower()
-        best_pos = 0
-        max_matches = 0
+        if memoize:
+            cached = self._content_lower
+            if cached is None or cached[0] is not content:
+                cached = self._content_lower = (content, content.lower())
+            content_lower = cached[1]
+        else:
+            content_lower = content.lower()
         
         # Sabse zyada matches wala section dhoondh rahe hain
-        for i in range(0, len(content_lower) - snippet_length, 10):
-            window = content_lower[i:i + snippet_length]
-            matches = sum(1 for term in query_terms if term.lower() in window)
-            if matches > max_matches:
-                max_matches = matches
-                best_pos = i
+        best_pos = _best_snippet_window(content_lower, query_terms, snippet_length)
         
         # Snippet extract karte hain
         start = max(0, best_pos - 20)  # Thoda context pehle se
-        end = min(len(self.content), best_pos + snippet_length)
+        end = min(len(content), best_pos + snippet_length)
         
-        snippet = self.content[start:end]
+        snippet = content[start:end]
         
         # Ellipsis add karenge agar start/end mein hai
         if start > 0:
             snippet = "..." + snippet
-        if end < len(self.content):
+        if end < len(content):
             snippet = snippet + "..."
         
         self.snippet = snippet
@@ -262,6 +593,9 @@ class SearchQuery(BaseModel):
     date_from: Optional[datetime] = Field(default=None, description="Start date filter")
     date_to: Optional[datetime] = Field(default=None, description="End date filter")
     
+    # (query, terms) - get_terms har call pe regex dobara na chalaye
+    _terms_cache: Optional[tuple] = PrivateAttr(default=None)
+    
     @field_validator('query')
     def validate_query(cls, v):
         """
@@ -281,9 +615,11 @@ class SearchQuery(BaseModel):
         Query ko individual terms mein todta hai.
         """
         # Simple tokenization - production mein isse advanced hona chahiye
-        import re
-        terms = re.findall(r'\b\w+\b', self.query.lower())
-        return terms
+        cached = self._terms_cache
+        if cached is None or cached[0] != self.query:
+            cached = self._terms_cache = (self.query, _TOKEN_RE.findall(self.query.lower()))
+        # Copy dete hain taaki caller list badle toh cache kharab na ho
+        return list(cached[1])
 
 
 class IndexMetadata(BaseModel):
@@ -292,7 +628,7 @@ class IndexMetadata(BaseModel):
     Indexing statistics aur versioning ke liye useful hai.
     """
     # Index version (future migrations ke liye)
-    version: str = Field(default="1.0.0", description="Index format version")
+    version: str = Field(default=INDEX_FORMAT_VERSION, description="Index format version")
     
     # Statistics
     total_documents: int = Field(default=0, description="Total indexed documents")
@@ -322,9 +658,10 @@ class IndexMetadata(BaseModel):
         self.document_ids = [doc.doc_id for doc in documents]  # List mein convert
         self.last_updated = datetime.now()
     
-    def add_document(self, doc: Document):
+    def add_document(self, doc: Document, updated_at: Optional[datetime] = None):
         """
         Naya document add karte waqt stats update karta hai.
+        updated_at batch indexing apna ek hi timestamp pass karti hai (default: abhi).
         """
         self.total_documents += 1
         self.total_tokens += doc.word_count
@@ -332,7 +669,7 @@ class IndexMetadata(BaseModel):
         
         # Recalculate average
         self.avg_doc_length = self.total_tokens / self.total_documents
-        self.last_updated = datetime.now()
+        self.last_updated = updated_at or datetime.now()
     
     model_config = {
         "json_encoders": {
@@ -371,12 +708,12 @@ class SearchResponse(BaseModel):
 # Utility functions for serialization
 def serialize_index_entry(entry: IndexEntry) -> Dict:
     """IndexEntry ko JSON-serializable dict mein convert karta hai."""
-    return entry.model_dump()
+    return entry.to_dict()
 
 
 def deserialize_index_entry(data: Dict) -> IndexEntry:
     """Dict se IndexEntry object create karta hai."""
-    return IndexEntry(**data)
+    return IndexEntry.from_dict(data)
 
 
 # Testing ke liye
@@ -23,14 +23,47 @@ Performance:
 """
 
 import heapq
+import logging
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 import math
 import time
-import traceback
-from typing import List, Dict, Set, Tuple, Optional
-from collections import defaultdict
+from typing import Any, List, Dict, Set, Tuple, Optional
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# numpy optional hai - install ho toh badi posting lists ka BM25 ek vectorized
+# expression se hota hai (bm25_scores_vectorized), warna pure-Python loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Itni (ya zyada) total postings hon tabhi numpy path - chhoti queries pe
+# array setup ka overhead loop se mehenga padta hai
+VECTORIZE_MIN_POSTINGS = 1024
+
+# Itni postings pe numpy scoring SCORING_THREADS threads mein bantti hai - isse
+# kam pe thread handoff ka overhead kaam se zyada hai
+PARALLEL_MIN_POSTINGS = 1 << 16
+
+# Scoring threads ka pool - pehli badi query pe banta hai (_get_scoring_pool)
+_scoring_pool: Optional[ThreadPoolExecutor] = None
+
+# AND mein driver (chhoti) list agar agli list se itne guna chhoti ho toh uske
+# har doc ko badi sorted list mein bisect karte hain, warna C-level intersection
+GALLOP_RATIO = 8
+
+# pyroaring optional hai - install ho toh BooleanRetriever ke AND/OR/NOT
+# compressed bitmaps pe C mein hote hain, warna Python sets
+try:
+    from pyroaring import BitMap
+except ImportError:
+    BitMap = None
+
 # Local imports
 from models import (
     SearchQuery, SearchResult, SearchResponse, 
@@ -38,6 +71,7 @@ from models import (
 )
 from indexer import InvertedIndex, TextPreprocessor
 from config import CONFIG
+from bm25_numba import bm25_accumulate_kernel
 
 
 @dataclass
@@ -53,6 +87,169 @@ class ScoringFactors:
     freshness_weight: float = 0.1   # Recency bonus (future use)
 
 
+@dataclass
+class PreparedQuery:
+    """
+    BM25Scorer.prepare_query ka result - ek query ke saare per-term aur
+    per-corpus constants, jo scoring loops mein har (term, doc) pe dobara
+    nahi nikalne chahiye.
+    """
+    terms: List[Tuple[IndexEntry, float]]  # (entry, BM25 IDF), query order (duplicates samet)
+    k1: float
+    k1_plus_1: float
+    norm_factors: Any                      # internal doc ID -> k1 * length norm
+    min_norm_factor: float                 # norm_factors ka minimum (score upper bounds)
+
+
+def bm25_term_bound(idf: float, max_frequency: int, k1_plus_1: float, min_norm_factor: float) -> float:
+    """
+    Ek term ka kisi bhi document mein sabse bada possible BM25 contribution -
+    term ki max frequency aur index ke sabse chhote length norm pe. BM25 f mein
+    badhta aur norm mein ghatta hai (float ops bhi monotone hain), isliye asli
+    contribution kabhi isse zyada nahi hota. top_k_scores ki MaxScore pruning isi pe hai.
+    """
+    return idf * ((max_frequency * k1_plus_1) / (max_frequency + min_norm_factor))
+
+
+# Pruning checks mein bounds ka sum asli score se alag order mein judta hai -
+# yeh slack rounding ka farak cover karta hai taaki pruning kabhi galat na ho
+_BOUND_SLACK = 1.0 + 1e-9
+
+
+def bm25_accumulate(
+    scores: Dict[int, float],
+    doc_ids,
+    freqs,
+    idf: float,
+    k1: float,
+    norm_factors
+) -> None:
+    """
+    Ek term ki poori posting list ka BM25 contribution scores mein jodta hai:
+        scores[doc] += idf * (f * (k1 + 1)) / (f + norm_factors[doc])
+    
+    Term-at-a-time inner loop - term ka idf aur constants bahar hi nikal
+    chuke hain, per posting sirf frequency aur precomputed norm factor
+    (k1 * length norm - ek multiply kam).
+    
+    Args:
+        scores: internal doc ID -> ab tak ka score (in-place update)
+        doc_ids: Term ke posting doc IDs (IndexEntry.doc_ids)
+        freqs: doc_ids ke parallel frequencies (IndexEntry.freqs)
+        idf: Term ka BM25 IDF
+        k1: BM25 k1
+        norm_factors: internal doc ID -> k1 * length norm (InvertedIndex.bm25_norm_factors)
+    """
+    k1_plus_1 = k1 + 1
+    get_score = scores.get
+    for doc_id, f in zip(doc_ids, freqs):
+        scores[doc_id] = get_score(doc_id, 0) + idf * ((f * k1_plus_1) / (f + norm_factors[doc_id]))
+
+
+def bm25_accumulate_existing(
+    scores: Dict[int, float],
+    doc_ids,
+    freqs,
+    idf: float,
+    k1: float,
+    norm_factors
+) -> None:
+    """
+    bm25_accumulate jaisa hi, lekin sirf un docs ko update karta hai jo scores
+    mein pehle se hain (MaxScore ka non-essential term phase). Jo list chhoti
+    ho usi pe loop chalta hai - scores chhota ho toh sorted doc_ids mein bisect.
+    """
+    k1_plus_1 = k1 + 1
+    n = len(doc_ids)
+    if len(scores) < n:
+        for doc_id in scores:
+            i = bisect_left(doc_ids, doc_id)
+            if i < n and doc_ids[i] == doc_id:
+                f = freqs[i]
+                scores[doc_id] += idf * ((f * k1_plus_1) / (f + norm_factors[doc_id]))
+    else:
+        for doc_id, f in zip(doc_ids, freqs):
+            if doc_id in scores:
+                scores[doc_id] += idf * ((f * k1_plus_1) / (f + norm_factors[doc_id]))
+
+
+def _get_scoring_pool() -> ThreadPoolExecutor:
+    """Module-level scoring thread pool (lazily banta hai, process mein ek hi)."""
+    global _scoring_pool
+    if _scoring_pool is None:
+        _scoring_pool = ThreadPoolExecutor(
+            max_workers=CONFIG.searcher.SCORING_THREADS,
+            thread_name_prefix='bm25'
+        )
+    return _scoring_pool
+
+
+def _accumulate_doc_range(
+    scores, terms: List[Tuple[IndexEntry, float]], norm_factors, k1_plus_1: float, lo: int, hi: int
+) -> None:
+    """
+    [lo, hi) doc-ID range ke docs ke BM25 scores, saare terms ke liye query
+    order mein. Posting lists sorted hain, isliye range ka slice searchsorted
+    se milta hai. Alag ranges alag score slots likhti hain - threads safe.
+    """
+    for entry, idf in terms:
+        doc_ids = np.frombuffer(entry.doc_ids, dtype=np.uint32)
+        freqs = np.frombuffer(entry.freqs, dtype=np.uint32)
+        if lo or hi < len(scores):
+            start, end = np.searchsorted(doc_ids, (lo, hi))
+            doc_ids = doc_ids[start:end]
+            freqs = freqs[start:end]
+        if bm25_accumulate_kernel is not None:
+            bm25_accumulate_kernel(scores, doc_ids, freqs, norm_factors, idf, k1_plus_1)
+            continue
+        f = freqs.astype(np.float64)
+        scores[doc_ids] += idf * ((f * k1_plus_1) / (f + norm_factors[doc_ids]))
+
+
+def bm25_scores_vectorized(prepared: PreparedQuery, num_docs: int) -> Dict[int, float]:
+    """
+    accumulate_scores ka numpy version - har term ki poori posting list ek
+    vectorized expression mein:
+        scores[doc_ids] += idf * (f * (k1 + 1)) / (f + norm_factors[doc_ids])
+    
+    Posting arrays (array('I') / mmap memoryview) aur norm factor table pe
+    np.frombuffer - zero-copy. float64 mein wahi operations usi order mein hain,
+    isliye scores Python loop ke bit-for-bit barabar hain. Dense score vector
+    (num_docs) use hota hai; ek term ke andar doc IDs unique hain, isliye fancy
+    index += safe hai. BM25 IDF aur f dono positive hain, toh jin docs mein koi
+    term hai unka score hamesha > 0.
+    
+    numba installed ho toh per-term loop bm25_numba ke compiled kernel mein
+    chalta hai - numpy temporaries allocate nahi hote (aur kernel khud parallel
+    hai). Warna PARALLEL_MIN_POSTINGS se badi queries doc-ID ranges mein bant ke
+    scoring thread pool pe chalti hain - numpy ke array operations GIL chhod
+    dete hain. Har doc ka score ek hi thread mein, terms usi order mein, isliye
+    result single-threaded jaisa hi hai.
+    """
+    norm_factors = np.frombuffer(prepared.norm_factors, dtype=np.float64)
+    k1_plus_1 = prepared.k1_plus_1
+    scores = np.zeros(num_docs, dtype=np.float64)
+    
+    threads = CONFIG.searcher.SCORING_THREADS
+    total_postings = sum(entry.doc_frequency for entry, _ in prepared.terms)
+    if bm25_accumulate_kernel is None and threads > 1 and total_postings >= PARALLEL_MIN_POSTINGS:
+        step = -(-num_docs // threads)
+        futures = [
+            _get_scoring_pool().submit(
+                _accumulate_doc_range, scores, prepared.terms, norm_factors, k1_plus_1,
+                lo, min(lo + step, num_docs)
+            )
+            for lo in range(0, num_docs, step)
+        ]
+        for future in futures:
+            future.result()
+    else:
+        _accumulate_doc_range(scores, prepared.terms, norm_factors, k1_plus_1, 0, num_docs)
+    
+    matched = np.flatnonzero(scores)
+    return dict(zip(matched.tolist(), scores[matched].tolist()))
+
+
 class BM25Scorer:
     """
     BM25 (Best Matching 25) scoring algorithm.
@@ -79,68 +276,170 @@ class BM25Scorer:
         
         Formula: log(1 + (N - n + 0.5) / (n + 0.5))
         Where N = total docs, n = docs with term
+        
+        Index IDF update ke waqt har entry pe bm25_idf bhar deta hai - yahan
+        sirf wahi padhna hai (index dirty ho toh pehle update).
         """
-        try:
-            N = index.metadata.total_documents
-            
-            entry = index.get_term_postings(term)
-            if not entry:
-                return 0.0
-            
-            n = entry.doc_frequency
-            
-            # BM25 IDF (slightly different from standard TF-IDF)
-            idf = math.log(1 + (N - n + 0.5) / (n + 0.5))
-            
-            return idf
-        except Exception as e:
-            print(f"[BM25 ERROR] calculate_idf failed for term '{term}': {e}")
+        entry = index.get_term_postings(term)
+        if not entry:
             return 0.0
+        
+        # BM25 IDF (slightly different from standard TF-IDF)
+        index.ensure_idf()
+        return entry.bm25_idf
     
-    def score_term(self, term: str, doc_id: str, index: InvertedIndex) -> float:
+    def score_term(self, term: str, doc_id: int, index: InvertedIndex) -> float:
         """
         Single term ka BM25 score calculate karta hai.
         
         Args:
             term: Query term
-            doc_id: Document ID
+            doc_id: Internal integer document ID
             index: InvertedIndex instance
             
         Returns:
             BM25 score for this term-document pair
         """
-        try:
-            # Get term frequency
+        # Get term frequency
+        entry = index.get_term_postings(term)
+        if not entry:
+            return 0.0
+        
+        f = entry.frequency(doc_id)
+        if not f:
+            return 0.0
+        
+        # BM25 calculation - IDF entry pe precomputed, aur doc length wala
+        # k1 * (1 - b + b * dl / avgdl) index ki precomputed table se
+        # (Document object fetch nahi hota)
+        index.ensure_idf()
+        idf = entry.bm25_idf
+        norm_factor = index.bm25_norm_factors(self.k1, self.b)[doc_id]
+        
+        # Term frequency component
+        tf_component = (f * (self.k1 + 1)) / (f + norm_factor)
+        
+        score = idf * tf_component
+        
+        # Guard against NaN / Inf
+        if math.isnan(score) or math.isinf(score):
+            return 0.0
+        
+        return score
+    
+    def query_idfs(self, query_terms: List[str], index: InvertedIndex) -> List[Tuple[IndexEntry, float]]:
+        """
+        Query ke har term ka (IndexEntry, BM25 IDF), query order mein.
+        
+        IDF hamesha usi term ka hai aur usi term ke contribution pe lagta hai -
+        query ke terms ka summed IDF kabhi saare terms pe nahi lagta. IDF entry
+        ka precomputed bm25_idf hai; duplicate term list mein do baar aata hai
+        (scores mein do baar count). Index mein na mile terms skip.
+        """
+        index.ensure_idf()
+        result = []
+        for term in query_terms:
             entry = index.get_term_postings(term)
-            if not entry or doc_id not in entry.postings:
-                return 0.0
-            
-            f = entry.postings[doc_id]['frequency']
-            
-            # Document length
-            doc = index.get_document(doc_id)
-            if not doc:
-                return 0.0
-            
-            dl = doc.word_count or 1          # Guard against zero length
-            avgdl = index.metadata.avg_doc_length or 1.0   # Guard against zero avg
-            
-            # BM25 calculation
-            idf = self.calculate_idf(term, index)
-            
-            # Term frequency component
-            tf_component = (f * (self.k1 + 1)) / (f + self.k1 * (1 - self.b + self.b * (dl / avgdl)))
+            if not entry:
+                continue
+            result.append((entry, entry.bm25_idf))
+        return result
+    
+    def prepare_query(self, query_terms: List[str], index: InvertedIndex) -> PreparedQuery:
+        """
+        Query ke liye saare BM25 constants ek baar: har term ka entry + IDF
+        (query_idfs), k1 + 1, aur index ki per-doc norm factor table. Scoring
+        loops (accumulate_scores, top_k_scores) sirf isi ko padhte hain.
+        """
+        k1 = self.k1
+        return PreparedQuery(
+            terms=self.query_idfs(query_terms, index),
+            k1=k1,
+            k1_plus_1=k1 + 1,
+            norm_factors=index.bm25_norm_factors(k1, self.b),
+            min_norm_factor=index.bm25_min_norm_factor(k1, self.b)
+        )
+    
+    def accumulate_scores(
+        self,
+        query_terms: List[str],
+        index: InvertedIndex,
+        prepared: Optional[PreparedQuery] = None
+    ) -> Dict[int, float]:
+        """
+        Saare query terms ke BM25 scores term-at-a-time jodta hai.
+        Har term ka IDF ek hi baar nikalta hai aur uski posting list ek hi baar
+        scan hoti hai (bm25_accumulate); result score_term ke sum jaisa hi hai.
+        
+        Args:
+            query_terms: Query terms (duplicate terms do baar count hote hain)
+            index: InvertedIndex instance
+            prepared: Pehle se bani prepare_query (None = yahin banegi)
             
-            score = idf * tf_component
+        Returns:
+            internal doc ID -> BM25 score (sirf jin docs mein koi term hai)
+        """
+        scores: Dict[int, float] = {}
+        if prepared is None:
+            prepared = self.prepare_query(query_terms, index)
+        
+        if np is not None and sum(entry.doc_frequency for entry, _ in prepared.terms) >= VECTORIZE_MIN_POSTINGS:
+            return bm25_scores_vectorized(prepared, len(prepared.norm_factors))
+        
+        for entry, idf in prepared.terms:
+            bm25_accumulate(scores, entry.doc_ids, entry.freqs, idf, prepared.k1, prepared.norm_factors)
+        
+        return scores
+    
+    def top_k_scores(self, query_terms: List[str], index: InvertedIndex, k: int) -> List[Tuple[int, float]]:
+        """
+        Sirf top-k documents ke BM25 scores, MaxScore pruning ke saath.
+        
+        Har term ka upper bound (uski max frequency aur sabse chhote length norm
+        pe score) nikal ke terms ko bound ke descending order mein process karte
+        hain. Jab baaki terms ke bounds ka sum current k-th best score se kam ho
+        jaaye, toh naya document top-k mein aa hi nahi sakta - tab baaki terms
+        sirf already scored documents ko update karte hain. Top-k exact rehta hai
+        (terms ka order badalne se float sum aakhri digit mein alag ho sakta hai).
+        
+        Args:
+            query_terms: Query terms
+            index: InvertedIndex instance
+            k: Kitne top documents chahiye
             
-            # Guard against NaN / Inf
-            if math.isnan(score) or math.isinf(score):
-                return 0.0
+        Returns:
+            (internal doc ID, score) list, score descending (tie pe chhota ID pehle)
+        """
+        if k <= 0:
+            return []
+        
+        prepared = self.prepare_query(query_terms, index)
+        k1 = prepared.k1
+        k1_plus_1 = prepared.k1_plus_1
+        norm_factors = prepared.norm_factors
+        min_factor = prepared.min_norm_factor
+        
+        terms = []
+        for entry, idf in prepared.terms:
+            bound = bm25_term_bound(idf, entry.max_frequency, k1_plus_1, min_factor) * _BOUND_SLACK
+            terms.append((bound, idf, entry.doc_ids, entry.freqs))
+        terms.sort(key=lambda t: t[0], reverse=True)
+        
+        scores: Dict[int, float] = {}
+        essential = True
+        for i, (_, idf, doc_ids, freqs) in enumerate(terms):
+            if essential:
+                bm25_accumulate(scores, doc_ids, freqs, idf, k1, norm_factors)
+            else:
+                bm25_accumulate_existing(scores, doc_ids, freqs, idf, k1, norm_factors)
             
-            return score
-        except Exception as e:
-            print(f"[BM25 ERROR] score_term failed for term '{term}', doc '{doc_id}': {e}")
-            return 0.0
+            # Ab tak ke scores sirf badh sakte hain - k-th best ek pakka lower bound hai
+            if essential and len(scores) >= k:
+                threshold = heapq.nlargest(k, scores.values())[-1]
+                if sum(t[0] for t in terms[i + 1:]) < threshold:
+                    essential = False
+        
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
 
 
 class TFIDFScorer:
@@ -149,60 +448,65 @@ class TFIDFScorer:
     Simple aur effective baseline algorithm.
     """
     
-    def score(self, query_terms: List[str], doc_id: str, index: InvertedIndex) -> float:
+    def score(self, query_terms: List[str], doc_id: int, index: InvertedIndex) -> float:
         """
         Document ka TF-IDF score calculate karta hai query ke against.
         
         Args:
             query_terms: Tokenized query terms
-            doc_id: Document to score
+            doc_id: Internal integer ID of document to score
             index: InvertedIndex instance
             
         Returns:
             Cosine similarity score
         """
-        try:
-            doc = index.get_document(doc_id)
-            if not doc:
-                return 0.0
-            
-            # Agar document mein tokens hi nahi hain to score 0
-            if not doc.tokens:
-                return 0.0
-            
-            # Query vector (simplified - binary weights)
-            query_vector = {term: 1 for term in query_terms}
-            
-            # Document vector (TF-IDF weights)
-            doc_vector = {}
-            for term in set(doc.tokens):
-                tf = index.get_term_frequency(term, doc_id) or 0.0  # guard
-                entry = index.index.get(term)
-                idf = entry.idf_score if entry else 0.0
-                doc_vector[term] = tf * idf
-            
-            # Dot product
-            score = 0.0
-            for term in query_terms:
-                if term in doc_vector:
-                    score += query_vector[term] * doc_vector[term]
-            
-            return score
-        except Exception as e:
-            print(f"[TFIDF ERROR] score failed for doc '{doc_id}': {e}")
+        doc = index.get_document(doc_id)
+        if not doc:
             return 0.0
+        
+        # Agar document mein tokens hi nahi hain to score 0
+        if not doc.tokens:
+            return 0.0
+        
+        # Query vector (simplified - binary weights)
+        query_vector = {term: 1 for term in query_terms}
+        
+        # Document vector (TF-IDF weights)
+        doc_vector = {}
+        for term in set(doc.tokens):
+            tf = index.get_term_frequency(term, doc_id) or 0.0  # guard
+            entry = index.index.get(term)
+            idf = entry.idf_score if entry else 0.0
+            doc_vector[term] = tf * idf
+        
+        # Dot product
+        score = 0.0
+        for term in query_terms:
+            if term in doc_vector:
+                score += query_vector[term] * doc_vector[term]
+        
+        return score
 
 
 class BooleanRetriever:
     """
     Boolean retrieval operations (AND, OR, NOT).
     Precise matching ke liye useful hai.
+    
+    Saare sets internal integer doc IDs ke hain (InvertedIndex postings keys).
+    pyroaring installed ho toh yeh sets Roaring BitMap hote hain - same
+    operators (&, |, -, len, in, iteration), bas bitwise ops C mein.
     """
     
     def __init__(self, index: InvertedIndex):
         self.index = index
     
-    def and_operation(self, terms: List[str]) -> Set[str]:
+    @staticmethod
+    def _empty() -> Set[int]:
+        """Khaali doc set - BitMap ya set, jo bhi active hai."""
+        return BitMap() if BitMap is not None else set()
+    
+    def and_operation(self, terms: List[str]) -> Set[int]:
         """
         AND operation - saare terms hone chahiye document mein.
         
@@ -212,28 +516,58 @@ class BooleanRetriever:
         Returns:
             Set of document IDs matching ALL terms
         """
-        try:
-            if not terms:
-                return set()
-            
-            # Pehle term se shuru karte hain
-            result = self._get_doc_ids(terms[0])
-            
-            # Baaki terms ke saath intersect karte hain
-            for term in terms[1:]:
-                term_docs = self._get_doc_ids(term)
-                result = result.intersection(term_docs)
-                
-                # Agar empty ho gaya toh early return
+        if not terms:
+            return self._empty()
+        
+        # Koi bhi term index mein nahi (ya zero postings) - AND khaali hi
+        # hoga, koi posting list touch karne ki zarurat nahi
+        entries = {}
+        for term in terms:
+            entry = self.index.get_term_postings(term)
+            if not entry or not entry.doc_frequency:
+                return self._empty()
+            entries[entry.word] = entry
+        
+        # Smallest posting list pehle - result shuru se chhota rehta hai aur
+        # early exit jaldi trigger hota hai
+        ordered = sorted(entries.values(), key=lambda entry: entry.doc_frequency)
+        
+        if BitMap is not None:
+            result = BitMap(ordered[0].doc_ids)
+            for entry in ordered[1:]:
+                result &= BitMap(entry.doc_ids)
                 if not result:
-                    return set()
-            
+                    return self._empty()
             return result
-        except Exception as e:
-            print(f"[BOOLEAN ERROR] and_operation failed: {e}")
-            return set()
+        
+        # Sets ke bina: sabse chhoti list hi driver hai (sorted list). Baaki har
+        # list ke liye ya toh driver ke docs uski sorted doc_ids mein bisect
+        # (driver bahut chhota ho), ya driver ke set ke against us list ka
+        # C-level iteration - badi lists ka kabhi set nahi banta
+        result = list(ordered[0].doc_ids)
+        for entry in ordered[1:]:
+            doc_ids = entry.doc_ids
+            if len(result) * GALLOP_RATIO < entry.doc_frequency:
+                matches = []
+                lo = 0
+                n = len(doc_ids)
+                for doc_id in result:
+                    lo = bisect_left(doc_ids, doc_id, lo)
+                    if lo == n:
+                        break
+                    if doc_ids[lo] == doc_id:
+                        matches.append(doc_id)
+                result = matches
+            else:
+                result = sorted(set(result).intersection(doc_ids))
+            
+            # Agar empty ho gaya toh early return
+            if not result:
+                return self._empty()
+        
+        return set(result)
     
-    def or_operation(self, terms: List[str]) -> Set[str]:
+    def or_operation(self, terms: List[str]) -> Set[int]:
         """
         OR operation - koi bhi term chalega.
         
@@ -243,18 +577,18 @@ class BooleanRetriever:
         Returns:
             Set of document IDs matching ANY term
         """
-        try:
-            result = set()
-            
-            for term in terms:
-                result = result.union(self._get_doc_ids(term))
-            
-            return result
-        except Exception as e:
-            print(f"[BOOLEAN ERROR] or_operation failed: {e}")
-            return set()
+        if BitMap is not None:
+            # Saare bitmaps ka ek hi multi-way union
+            return BitMap.union(self._empty(), *(self._get_doc_ids(term) for term in terms))
+        
+        result = set()
+        
+        for term in terms:
+            result = result.union(self._get_doc_ids(term))
+        
+        return result
     
-    def not_operation(self, docs: Set[str], exclude_terms: List[str]) -> Set[str]:
+    def not_operation(self, docs: Set[int], exclude_terms: List[str]) -> Set[int]:
         """
         NOT operation - certain terms nahi hone chahiye.
         
@@ -265,25 +599,24 @@ class BooleanRetriever:
         Returns:
             Filtered document set
         """
-        try:
-            for term in exclude_terms:
-                exclude_docs = self._get_doc_ids(term)
-                docs = docs - exclude_docs
-            return docs
-        except Exception as e:
-            print(f"[BOOLEAN ERROR] not_operation failed: {e}")
-            return docs
+        for term in exclude_terms:
+            exclude_docs = self._get_doc_ids(term)
+            docs = docs - exclude_docs
+        return docs
     
-    def _get_doc_ids(self, term: str) -> Set[str]:
-        """Term ke saare document IDs return karta hai."""
-        try:
-            entry = self.index.get_term_postings(term)
-            if entry:
-                return set(entry.postings.keys())
-            return set()
-        except Exception as e:
-            print(f"[BOOLEAN ERROR] _get_doc_ids failed for term '{term}': {e}")
-            return set()
+    def _get_doc_ids(self, term: str) -> Set[int]:
+        """
+        Term ke saare document IDs return karta hai.
+        
+        BitMap packed doc_ids array se seedha bulk-load hota hai (sorted
+        uint32 - Roaring ke liye ideal input).
+        """
+        entry = self.index.get_term_postings(term)
+        if entry:
+            if BitMap is not None:
+                return BitMap(entry.doc_ids)
+            return set(entry.doc_ids)
+        return self._empty()
 
 
 class SearchEngine:
@@ -307,12 +640,22 @@ class SearchEngine:
         self.scoring = ScoringFactors()
         
         # Cache for frequent queries (simple dict, LRU can be added)
-        self.query_cache: Dict[str, SearchResponse] = {}
+        # LRU: hit pe entry end pe jaati hai, bharne pe sabse purani nikalti hai
+        self.query_cache: "OrderedDict[str, SearchResponse]" = OrderedDict()
         self.cache_max_size = 100
     
+    def invalidate_cache(self):
+        """
+        Query cache khaali karta hai - index badalne (documents add/load) ke baad
+        purane cached responses stale ho jaate hain.
+        """
+        self.query_cache.clear()
+    
     def load_index(self, filepath: Optional[str] = None) -> bool:
         """
         Index load karta hai disk se.
+        Default mein pehle binary index (index.pkl) try hota hai, na mile toh
+        purana JSON index (index.json). '.pkl' path diya toh binary load hoga.
         
         Args:
             filepath: Index file ka path
@@ -321,13 +664,23 @@ class SearchEngine:
             True agar successful
         """
         try:
-            success = self.index.load(filepath)
+            if filepath is None:
+                binary_path = CONFIG.get_storage_path('index.pkl')
+                if binary_path.exists():
+                    success = self.index.load_binary(str(binary_path))
+                else:
+                    success = self.index.load()
+            elif filepath.endswith('.pkl'):
+                success = self.index.load_binary(filepath)
+            else:
+                success = self.index.load(filepath)
             if success:
                 # Boolean retriever ko updated index do
                 self.boolean_retriever = BooleanRetriever(self.index)
+                self.invalidate_cache()
             return success
         except Exception as e:
-            print(f"[ERROR] load_index failed: {e}")
+            logger.exception("load_index failed: %s", e)
             return False
     
     def build_index(self, documents):
@@ -341,8 +694,9 @@ class SearchEngine:
             self.index.clear()
             self.index.add_documents(documents)
             self.boolean_retriever = BooleanRetriever(self.index)
+            self.invalidate_cache()
         except Exception as e:
-            print(f"[ERROR] build_index failed: {e}")
+            logger.exception("build_index failed: %s", e)
     
     def _tokenize_query(self, query: str) -> List[str]:
         """
@@ -354,112 +708,133 @@ class SearchEngine:
         Returns:
             List of processed tokens
         """
-        try:
-            # Same preprocessing jo indexing mein use ki thi
-            tokens = self.preprocessor.preprocess(query)
-            return tokens
-        except Exception as e:
-            print(f"[ERROR] _tokenize_query failed for '{query}': {e}")
-            return []
+        # Same preprocessing jo indexing mein use ki thi
+        tokens = self.preprocessor.preprocess(query)
+        return tokens
     
-    def _retrieve_candidates(self, query_terms: List[str]) -> Set[str]:
+    def _retrieve_candidates(self, query_terms: List[str]) -> Set[int]:
         """
         Initial candidate documents retrieve karta hai.
         HYBRID APPROACH: AND + OR dono results combine karta hai.
         
+        AND ⊆ OR hamesha, isliye union seedha OR hai - sirf OR compute
+        hota hai. AND sirf debug logging on ho tab count ke liye chalta hai.
+        
         Args:
             query_terms: Tokenized query
             
         Returns:
-            Set of candidate document IDs
+            Set of candidate internal document IDs
         """
-        try:
-            if not query_terms:
-                return set()
-            
-            # Step 1: AND operation - exact matches (saare terms)
-            and_candidates = self.boolean_retriever.and_operation(query_terms)
-            
-            # Step 2: OR operation - partial matches (koi bhi term)
-            or_candidates = self.boolean_retriever.or_operation(query_terms)
-            
-            # Step 3: Dono ko combine kar do
-            all_candidates = and_candidates.union(or_candidates)
-            
-            print(f"[DEBUG] AND results: {len(and_candidates)}, OR results: {len(or_candidates)}, Total: {len(all_candidates)}")
-            
-            return all_candidates
-            
-        except Exception as e:
-            print(f"[ERROR] _retrieve_candidates failed: {e}")
+        if not query_terms:
             return set()
+        
+        # OR operation - exact (saare terms) + partial (koi bhi term) matches
+        all_candidates = self.boolean_retriever.or_operation(query_terms)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            and_candidates = self.boolean_retriever.and_operation(query_terms)
+            logger.debug(
+                "AND results: %d, OR results: %d, Total: %d",
+                len(and_candidates), len(all_candidates), len(all_candidates)
+            )
+        
+        return all_candidates
     
     def _rank_documents(
         self, 
-        candidates: Set[str], 
+        candidates: Set[int], 
         query_terms: List[str],
-        scoring_algorithm: str = 'bm25'
-    ) -> List[Tuple[str, float]]:
+        scoring_algorithm: str = 'bm25',
+        top_k: Optional[int] = None
+    ) -> Tuple[List[Tuple[int, float]], int]:
         """
         Candidate documents ko rank karta hai relevance ke hisaab se.
         
+        Sirf top_k best documents ek bounded min-heap mein rakhe jaate hain
+        (O(N log K) time, O(K) memory) - poori list sort nahi hoti. Order wahi
+        hai jo stable full sort deta: score descending, barabar score pe
+        candidates ka iteration order.
+        
         Args:
-            candidates: Document IDs to rank
+            candidates: Internal document IDs to rank
             query_terms: Query terms
             scoring_algorithm: 'bm25' ya 'tfidf'
+            top_k: Kitne top results chahiye (jaise page * per_page; None = saare)
             
         Returns:
-            Sorted list of (doc_id, score) tuples
+            (top_k (doc_id, score) tuples score ke hisaab se sorted,
+             MIN_RELEVANCE_SCORE paar karne wale kul documents)
         """
-        try:
-            scores = []
-            
-            for doc_id in candidates:
-                try:
-                    if scoring_algorithm == 'bm25':
-                        # BM25 scoring (sum of all query terms)
-                        score = sum(
-                            self.bm25_scorer.score_term(term, doc_id, self.index)
-                            for term in query_terms
-                        )
-                    else:
-                        # TF-IDF scoring
-                        score = self.tfidf_scorer.score(query_terms, doc_id, self.index)
-                    
-                    # Minimum threshold check
-                    if score >= CONFIG.searcher.MIN_RELEVANCE_SCORE:
-                        scores.append((doc_id, score))
-                except Exception as e:
-                    print(f"[ERROR] Scoring failed for doc {doc_id}: {e}")
-                    continue
-            
-            # Sort by score descending
-            scores.sort(key=lambda x: x[1], reverse=True)
-            
-            return scores
-        except Exception as e:
-            print(f"[ERROR] _rank_documents failed: {e}")
-            return []
+        if top_k is None:
+            top_k = len(candidates)
+        if top_k <= 0:
+            return [], 0
+        
+        min_score = CONFIG.searcher.MIN_RELEVANCE_SCORE
+        
+        # (score, -seq, doc_id) - heap[0] sabse kamzor result hai. -seq se barabar
+        # score pe pehle aaya candidate aage rehta hai (stable sort jaisa)
+        heap = []
+        total = 0
+        
+        # BM25: saare candidates ke scores ek saath, term-at-a-time. Candidates
+        # saare query terms ki postings ka OR hain, isliye har posting list
+        # poori scan hoti hi hai - accumulate_scores wahi ek pass karta hai
+        bm25_scores = None
+        if scoring_algorithm == 'bm25':
+            bm25_scores = self.bm25_scorer.accumulate_scores(query_terms, self.index)
+        
+        for seq, doc_id in enumerate(candidates):
+            if bm25_scores is not None:
+                # BM25 scoring (sum of all query terms)
+                score = bm25_scores.get(doc_id, 0.0)
+            else:
+                # TF-IDF scoring
+                score = self.tfidf_scorer.score(query_terms, doc_id, self.index)
+            
+            # Minimum threshold check
+            if score < min_score:
+                continue
+            total += 1
+            item = (score, -seq, doc_id)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                if top_k == 1:
+                    # Sirf running best chahiye - heap sift ki zarurat nahi
+                    heap[0] = item
+                else:
+                    heapq.heapreplace(heap, item)
+        
+        # Sirf K items ka sort - score descending (ek item ho toh kuch karna nahi)
+        if len(heap) > 1:
+            heap.sort(reverse=True)
+        
+        return [(doc_id, score) for score, _, doc_id in heap], total
     
     def _create_search_result(
         self, 
-        doc_id: str, 
+        doc_id: int, 
         score: float, 
-        query_terms: List[str]
+        query_terms: List[str],
+        doc: Optional[Document] = None
     ) -> Optional[SearchResult]:
         """
-        Document ID se SearchResult object create karta hai.
+        Internal document ID se SearchResult object create karta hai.
         
         Args:
-            doc_id: Document identifier
+            doc_id: Internal integer document ID (result mein external doc_id jaata hai)
             score: Relevance score
             query_terms: Original query terms
+            doc: Pehle se fetch kiya Document (get_documents batch se); None = yahin fetch
             
         Returns:
             SearchResult object ya None agar document missing ho
         """
         try:
-            doc = self.index.get_document(doc_id)
+            if doc is None:
+                doc = self.index.get_document(doc_id)
             
             if not doc:
                 # Missing document ko silently skip karo, crash nahi
@@ -468,7 +843,7 @@ class SearchEngine:
             # Kaunse terms match hue - guard for missing tokens
             matched_terms = []
             if doc.tokens:
-                doc_tokens_lower = [t.lower() if t else "" for t in doc.tokens if t]
+                doc_tokens_lower = doc.tokens_lower_set
                 matched_terms = [
                     term for term in query_terms 
                     if term in doc_tokens_lower
@@ -476,43 +851,48 @@ class SearchEngine:
             
             # Result object create karte hain
             result = SearchResult(
-                doc_id=doc_id,
-                title=doc.title or doc_id,
+                doc_id=doc.doc_id,
+                title=doc.title or doc.doc_id,
                 score=score,
                 matched_terms=matched_terms,
                 file_path=doc.file_path,
                 file_size=doc.file_size,
-                modified_at=doc.modified_at,
-                content=doc.content  # Snippet generation ke liye
+                modified_at=doc.modified_at
             )
             
-            # Snippet generate karte hain - sirf agar content exist karta hai
-            if result.content:
+            # Snippet seedha document ke content se - result (aur query cache)
+            # mein poora content nahi rakhna, na response JSON mein bhejna.
+            # Yeh sirf current page ke results ke liye chalta hai
+            if doc.content:
                 try:
-                    result.generate_snippet(query_terms)
+                    result.generate_snippet(query_terms, content=doc.content)
                 except Exception as e:
-                    print(f"[ERROR] Snippet generation failed for {doc_id}: {e}")
-            
-            # Detailed scores for debugging - safe sum
-            tf_sum = 0.0
-            for term in query_terms:
-                tf = self.index.get_term_frequency(term, doc_id)
-                if tf:
-                    tf_sum += tf
-            result.tf_score = tf_sum
-            
-            # IDF sum safely - pehle check karo term exists ya nahi
-            idf_sum = 0.0
-            for term in query_terms:
-                entry = self.index.index.get(term)
-                if entry:
-                    idf_sum += entry.idf_score
-            result.idf_score = idf_sum
+                    logger.warning("Snippet generation failed for %s: %s", doc_id, e)
+            
+            # Detailed scores for debugging - sirf DEBUG_SCORES on ho tab
+            if CONFIG.searcher.DEBUG_SCORES:
+                # Safe sum
+                tf_sum = 0.0
+                for term in query_terms:
+                    tf = self.index.get_term_frequency(term, doc_id)
+                    if tf:
+                        tf_sum += tf
+                result.tf_score = tf_sum
+                
+                # IDF sum safely - pehle check karo term exists ya nahi
+                idf_sum = 0.0
+                for term in query_terms:
+                    entry = self.index.index.get(term)
+                    if entry:
+                        idf_sum += entry.idf_score
+                result.idf_score = idf_sum
             
             return result
         except Exception as e:
-            print(f"[ERROR] _create_search_result failed for doc {doc_id}: {e}")
-            traceback.print_exc()
+            logger.error(
+                "_create_search_result failed for doc %s: %s", doc_id, e,
+                exc_info=CONFIG.DEBUG
+            )
             return None
     
     def search(self, query_obj: SearchQuery) -> SearchResponse:
@@ -536,14 +916,6 @@ class SearchEngine:
         start_time = time.time()
         
         try:
-            # Cache key generate karte hain
-            cache_key = f"{query_obj.query}:{query_obj.page}:{query_obj.per_page}"
-            
-            # Cache check (simple implementation)
-            if cache_key in self.query_cache:
-                print(f"[CACHE HIT] Query: '{query_obj.query}'")
-                return self.query_cache[cache_key]
-            
             # Step 1: Query preprocessing
             query_terms = self._tokenize_query(query_obj.query)
             
@@ -559,15 +931,32 @@ class SearchEngine:
                     suggestions=["Kripya koi valid search term enter karein"]
                 )
             
-            print(f"[SEARCH] Query: '{query_obj.query}' -> Terms: {query_terms}")
-            
-            # DEBUG: Check if terms exist in index
-            for term in query_terms:
-                entry = self.index.get_term_postings(term)
-                if entry:
-                    print(f"[DEBUG] Term '{term}' exists with {entry.doc_frequency} docs")
-                else:
-                    print(f"[DEBUG] Term '{term}' NOT FOUND in index")
+            # Cache key tokenized terms se - "Python  Guide" aur "python guide"
+            # jaisi queries ek hi entry share karti hain
+            cache_key = f"{' '.join(query_terms)}:{query_obj.page}:{query_obj.per_page}"
+            
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for query '%s'", query_obj.query)
+                self.query_cache.move_to_end(cache_key)
+                if cached.query != query_obj.query:
+                    # Response mein user ki apni query string dikhni chahiye
+                    cached = cached.model_copy(update={'query': query_obj.query})
+                return cached
+            
+            # Pichli search ke baad documents add hue hon toh IDF abhi update hoga
+            self.index.ensure_idf()
+            
+            logger.debug("Search query '%s' -> terms %s", query_obj.query, query_terms)
+            
+            # DEBUG: Check if terms exist in index (sirf debug logging on ho tab)
+            if logger.isEnabledFor(logging.DEBUG):
+                for term in query_terms:
+                    entry = self.index.get_term_postings(term)
+                    if entry:
+                        logger.debug("Term '%s' exists with %d docs", term, entry.doc_frequency)
+                    else:
+                        logger.debug("Term '%s' NOT FOUND in index", term)
             
             # Step 2: Candidate retrieval - UPDATED HYBRID METHOD
             candidates = self._retrieve_candidates(query_terms)
@@ -582,18 +971,19 @@ class SearchEngine:
                     page=query_obj.page,
                     per_page=query_obj.per_page,
                     total_pages=0,
-                    suggestions=self._generate_suggestions(query_obj.query)
+                    suggestions=self._generate_suggestions(query_obj.query, query_terms)
                 )
             
-            # Step 3: Ranking
-            ranked = self._rank_documents(
+            # Step 3: Ranking - sirf is page tak ke results chahiye
+            ranked, total_results = self._rank_documents(
                 candidates, 
                 query_terms,
-                scoring_algorithm='bm25'
+                scoring_algorithm='bm25',
+                top_k=query_obj.page * query_obj.per_page
             )
             
             # Agar ranking ke baad bhi koi result nahi bacha toh early return
-            if not ranked:
+            if not total_results:
                 search_time = (time.time() - start_time) * 1000
                 return SearchResponse(
                     results=[],
@@ -603,11 +993,10 @@ class SearchEngine:
                     page=query_obj.page,
                     per_page=query_obj.per_page,
                     total_pages=0,
-                    suggestions=self._generate_suggestions(query_obj.query)
+                    suggestions=self._generate_suggestions(query_obj.query, query_terms)
                 )
             
             # Step 4: Pagination
-            total_results = len(ranked)
             total_pages = (total_results + query_obj.per_page - 1) // query_obj.per_page
             
             start_idx = (query_obj.page - 1) * query_obj.per_page
@@ -615,10 +1004,16 @@ class SearchEngine:
             
             page_results = ranked[start_idx:end_idx]
             
-            # Step 5: Result objects create karte hain
+            # Step 5: Result objects create karte hain - page ke saare documents
+            # ek batch mein fetch
+            docs = self.index.get_documents([doc_id for doc_id, _ in page_results])
             results = []
             for doc_id, score in page_results:
-                result = self._create_search_result(doc_id, score, query_terms)
+                doc = docs.get(doc_id)
+                if doc is None:
+                    # Missing document ko skip karo
+                    continue
+                result = self._create_search_result(doc_id, score, query_terms, doc)
                 if result:
                     results.append(result)
             
@@ -633,22 +1028,21 @@ class SearchEngine:
                 page=query_obj.page,
                 per_page=query_obj.per_page,
                 total_pages=total_pages,
-                suggestions=None if results else self._generate_suggestions(query_obj.query)
+                suggestions=None if results else self._generate_suggestions(query_obj.query, query_terms)
             )
             
-            # Cache mein store karte hain
+            # Cache mein store karte hain - bhara ho toh least recently used nikalo
             if len(self.query_cache) >= self.cache_max_size:
-                self.query_cache.clear()  # Simple clear, LRU implementation possible
+                self.query_cache.popitem(last=False)
             self.query_cache[cache_key] = response
             
-            print(f"[RESULTS] Found {total_results} docs in {search_time:.2f}ms")
+            logger.info("Found %d docs in %.2fms", total_results, search_time)
             
             return response
             
         except Exception as e:
             # Last resort error handling
-            print(f"[CRITICAL] Unhandled exception in search: {e}")
-            traceback.print_exc()
+            logger.exception("Unhandled exception in search: %s", e)
             
             # Return empty results instead of crashing
             search_time = (time.time() - start_time) * 1000
@@ -675,14 +1069,35 @@ class SearchEngine:
             List of SearchResult objects
         """
         try:
+            # Validation SearchQuery wali hi (top_k bhi per_page ki limits mein)
             query_obj = SearchQuery(query=query_string, per_page=top_k)
-            response = self.search(query_obj)
-            return response.results
+            
+            # Pagination/total count nahi chahiye, isliye poori ranking ki jagah
+            # sirf top_k BM25 scores (MaxScore pruning ke saath)
+            self.index.ensure_idf()
+            query_terms = self._tokenize_query(query_obj.query)
+            ranked = self.bm25_scorer.top_k_scores(query_terms, self.index, top_k)
+            
+            ranked = [
+                (doc_id, score) for doc_id, score in ranked
+                if score >= CONFIG.searcher.MIN_RELEVANCE_SCORE
+            ]
+            docs = self.index.get_documents([doc_id for doc_id, _ in ranked])
+            
+            results = []
+            for doc_id, score in ranked:
+                doc = docs.get(doc_id)
+                if doc is None:
+                    continue
+                result = self._create_search_result(doc_id, score, query_terms, doc)
+                if result:
+                    results.append(result)
+            return results
         except Exception as e:
-            print(f"[ERROR] quick_search failed: {e}")
+            logger.exception("quick_search failed: %s", e)
             return []
     
-    def _generate_suggestions(self, query: str) -> List[str]:
+    def _generate_suggestions(self, query: str, query_terms: Optional[List[str]] = None) -> List[str]:
         """
         Query suggestions generate karta hai agar koi result nahi mila.
         
@@ -691,43 +1106,38 @@ class SearchEngine:
         
         Args:
             query: Original query
+            query_terms: search() ke already tokenized terms - diye hon toh
+                         query dobara tokenize nahi hoti
             
         Returns:
             List of suggestion strings
         """
-        try:
-            suggestions = []
-            tokens = self._tokenize_query(query)
-            
-            # Har token ke liye index mein similar terms dhoondhte hain
-            for token in tokens:
-                for indexed_term in self.index.index.keys():
-                    # Simple prefix matching
-                    if indexed_term.startswith(token[:3]) and indexed_term != token:
-                        suggestions.append(indexed_term)
-                        if len(suggestions) >= 3:
-                            break
-            
-            return suggestions[:3]  # Max 3 suggestions
-        except Exception as e:
-            print(f"[ERROR] _generate_suggestions failed: {e}")
-            return []
+        suggestions = []
+        tokens = self._tokenize_query(query) if query_terms is None else query_terms
+        
+        # Har token ke liye index mein similar terms dhoondhte hain - simple
+        # prefix matching, sorted vocabulary pe bisect (terms_with_prefix),
+        # poori vocabulary scan nahi hoti
+        for token in tokens:
+            remaining = 3 - len(suggestions)
+            if remaining <= 0:
+                break
+            # +1 kyunki token khud bhi match mein aa sakta hai
+            for indexed_term in self.index.terms_with_prefix(token[:3], limit=remaining + 1):
+                if indexed_term != token:
+                    suggestions.append(indexed_term)
+                    if len(suggestions) >= 3:
+                        break
+        
+        return suggestions[:3]  # Max 3 suggestions
     
     def get_index_stats(self) -> Dict:
         """Index ki statistics return karta hai."""
-        try:
-            return self.index.get_statistics()
-        except Exception as e:
-            print(f"[ERROR] get_index_stats failed: {e}")
-            return {}
+        return self.index.get_statistics()
     
     def get_document_by_id(self, doc_id: str) -> Optional[Document]:
         """Document ID se full document return karta hai."""
-        try:
-            return self.index.get_document(doc_id)
-        except Exception as e:
-            print(f"[ERROR] get_document_by_id failed for {doc_id}: {e}")
-            return None
+        return self.index.get_document(doc_id)
 
 
 # Testing ke liye
@@ -0,0 +1,104 @@
+"""
+Crawler helpers ke tests - duplicate detection (SeenHashes) aur text files
+ka encoding fallback.
+
+Backend directory se chalao:  python -m unittest discover tests
+"""
+
+import unittest
+from unittest import mock
+
+import crawler
+from crawler import SeenHashes, TextFileHandler
+
+
+class _AlwaysHitBloom:
+    """Fake Bloom filter jiska har lookup false positive hai."""
+
+    def __init__(self, expected_items, false_positive_rate):
+        self.expected_items = expected_items
+        self.added = []
+
+    def add(self, item):
+        self.added.append(item)
+
+    def __contains__(self, item):
+        return True
+
+
+class _FakeRbloom:
+    Bloom = _AlwaysHitBloom
+
+
+class SeenHashesTest(unittest.TestCase):
+    def test_exact_store_detects_duplicates(self):
+        with mock.patch.object(crawler, 'rbloom', None):
+            seen = SeenHashes(10, 0.01, max_entries=10)
+            seen.add('a')
+            seen.add('b')
+            seen.add('a')
+        self.assertIn('a', seen)
+        self.assertIn('b', seen)
+        self.assertNotIn('c', seen)
+        self.assertEqual(len(seen), 2)
+
+    def test_exact_store_evicts_least_recently_seen(self):
+        with mock.patch.object(crawler, 'rbloom', None):
+            seen = SeenHashes(10, 0.01, max_entries=2)
+            seen.add('a')
+            seen.add('b')
+            seen.add('a')  # 'a' sabse naya, ab 'b' purana
+            seen.add('c')
+        self.assertIn('a', seen)
+        self.assertNotIn('b', seen)
+        self.assertIn('c', seen)
+
+    def test_bloom_false_positive_is_not_a_duplicate(self):
+        with mock.patch.object(crawler, 'rbloom', _FakeRbloom):
+            seen = SeenHashes(10, 0.01, max_entries=10)
+            seen.add('a')
+            # Bloom har hash pe hit deta hai, par 'x' kabhi add nahi hua
+            self.assertNotIn('x', seen)
+            self.assertIn('a', seen)
+
+    def test_bloom_is_rebuilt_past_expected_items(self):
+        with mock.patch.object(crawler, 'rbloom', _FakeRbloom):
+            seen = SeenHashes(2, 0.01, max_entries=10)
+            first_bloom = seen._bloom
+            with self.assertLogs('crawler', level='WARNING'):
+                for content_hash in ('a', 'b', 'c'):
+                    seen.add(content_hash)
+        self.assertIsNot(seen._bloom, first_bloom)
+        self.assertEqual(seen.expected_items, 4)
+        self.assertEqual(seen._bloom.added, ['a', 'b', 'c'])
+        self.assertEqual(len(seen), 3)
+
+
+class TextEncodingFallbackTest(unittest.TestCase):
+    TEXT = "Привет, мир! Это обычный текстовый документ для проверки кодировки. " * 4
+
+    def test_utf8_is_decoded_strictly(self):
+        text = "naïve café – ünïcode"
+        self.assertEqual(TextFileHandler().decode_with_encoding(text.encode('utf-8')), (text, 'utf-8'))
+
+    def test_latin1_fallback_without_charset_normalizer(self):
+        raw = "café au lait".encode('latin-1')
+        with mock.patch.object(crawler, 'charset_normalizer', None):
+            self.assertEqual(TextFileHandler().decode_with_encoding(raw), ("café au lait", 'latin-1'))
+
+    def test_latin1_fallback_never_fails(self):
+        raw = bytes(range(256))
+        with mock.patch.object(crawler, 'charset_normalizer', None):
+            content, encoding = TextFileHandler().decode_with_encoding(raw)
+        self.assertEqual(encoding, 'latin-1')
+        self.assertEqual(content.encode('latin-1'), raw)
+
+    @unittest.skipIf(crawler.charset_normalizer is None, "charset-normalizer installed nahi hai")
+    def test_charset_normalizer_detects_legacy_encoding(self):
+        content, encoding = TextFileHandler().decode_with_encoding(self.TEXT.encode('cp1251'))
+        self.assertEqual(content, self.TEXT)
+        self.assertNotEqual(encoding, 'utf-8')
+
+
+if __name__ == '__main__':
+    unittest.main()
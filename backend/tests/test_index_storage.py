@@ -0,0 +1,166 @@
+"""
+Binary index (save_binary / load_binary) aur CSR postings ke round-trip tests.
+
+Backend directory se chalao:  python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from array import array
+
+from indexer import InvertedIndex, _MappedIndexEntry
+from models import Document, IndexEntry, SearchQuery
+from searcher import SearchEngine
+
+WORDS = [f"w{i}x" for i in range(40)]
+
+
+def _make_documents(count: int, seed: int, prefix: str = "d"):
+    rng = random.Random(seed)
+    return [
+        Document(
+            doc_id=f"{prefix}{i}",
+            file_path=f"/corpus/{prefix}{i}.txt",
+            content=" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 60)))
+        )
+        for i in range(count)
+    ]
+
+
+def _postings(index: InvertedIndex):
+    """term -> (doc_ids, freqs, har doc ki positions) - plain lists mein."""
+    snapshot = {}
+    for term, entry in index.index.items():
+        doc_ids = list(entry.doc_ids)
+        positions = None
+        if entry.pos_offsets is not None:
+            positions = [list(entry.get_positions(doc_id)) for doc_id in doc_ids]
+        snapshot[term] = (doc_ids, list(entry.freqs), positions)
+    return snapshot
+
+
+def _quiet(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+class BinaryIndexRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "index.pkl")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def _built(self, documents):
+        index = InvertedIndex()
+        _quiet(index.add_documents, documents)
+        return index
+    
+    def test_load_binary_maps_postings_lazily_and_round_trips(self):
+        built = self._built(_make_documents(200, seed=1))
+        self.assertTrue(_quiet(built.save_binary, self.path))
+        
+        loaded = InvertedIndex()
+        self.assertTrue(_quiet(loaded.load_binary, self.path))
+        self.assertTrue(all(isinstance(e, _MappedIndexEntry) for e in loaded.index.values()))
+        
+        self.assertEqual(_postings(loaded), _postings(built))
+        for term, entry in built.index.items():
+            mapped = loaded.index[term]
+            self.assertEqual(mapped.doc_frequency, entry.doc_frequency)
+            self.assertEqual(mapped.max_frequency, entry.max_frequency)
+            self.assertAlmostEqual(mapped.bm25_idf, entry.bm25_idf)
+    
+    def test_resave_after_adding_documents_remaps_live_entries(self):
+        first = _make_documents(150, seed=2)
+        extra = _make_documents(60, seed=3, prefix="e")
+        self.assertTrue(_quiet(self._built(first).save_binary, self.path))
+        
+        live = InvertedIndex()
+        self.assertTrue(_quiet(live.load_binary, self.path))
+        # Kuch entries ke views pehle se bane hon (chalti queries jaisa)
+        for term in WORDS[:10]:
+            entry = live.index.get(term)
+            if entry is not None:
+                entry.doc_ids
+        
+        _quiet(live.add_documents, extra)
+        self.assertTrue(_quiet(live.save_binary, self.path))
+        
+        expected = _postings(self._built(first + extra))
+        # Re-save ke baad live object (naye map pe) aur fresh reload dono sahi
+        self.assertEqual(_postings(live), expected)
+        reloaded = InvertedIndex()
+        self.assertTrue(_quiet(reloaded.load_binary, self.path))
+        self.assertEqual(_postings(reloaded), expected)
+        self.assertFalse(os.path.exists(self.path.replace(".pkl", ".postings.bin.tmp")))
+    
+    def test_search_results_survive_binary_round_trip(self):
+        documents = _make_documents(120, seed=4)
+        engine = _quiet(SearchEngine)
+        _quiet(engine.build_index, documents)
+        self.assertTrue(_quiet(engine.index.save_binary, self.path))
+        
+        reloaded = _quiet(SearchEngine)
+        self.assertTrue(_quiet(reloaded.index.load_binary, self.path))
+        
+        for query in ("w1x w2x", "w7x", "w3x w30x w31x"):
+            before = _quiet(engine.search, SearchQuery(query=query, per_page=10))
+            after = _quiet(reloaded.search, SearchQuery(query=query, per_page=10))
+            self.assertEqual(before.total_results, after.total_results)
+            self.assertEqual(
+                [(r.doc_id, round(r.score, 9)) for r in before.results],
+                [(r.doc_id, round(r.score, 9)) for r in after.results]
+            )
+
+
+class CSRPostingsTest(unittest.TestCase):
+    def test_out_of_order_postings_stay_sorted_with_positions(self):
+        entry = IndexEntry("term")
+        entry.add_postings(5, [1, 4])
+        entry.add_postings(2, [7])
+        entry.add_postings(9, [0, 2, 3])
+        entry.add_postings(2, [8])
+        
+        self.assertEqual(list(entry.doc_ids), [2, 5, 9])
+        self.assertEqual(list(entry.freqs), [2, 2, 3])
+        self.assertEqual(list(entry.get_positions(2)), [7, 8])
+        self.assertEqual(list(entry.get_positions(5)), [1, 4])
+        self.assertEqual(list(entry.get_positions(9)), [0, 2, 3])
+        self.assertEqual(entry.frequency(9), 3)
+        self.assertEqual(entry.frequency(3), 0)
+        self.assertIsNone(entry.get_positions(3))
+        self.assertEqual(entry.doc_frequency, 3)
+        self.assertEqual(entry.max_frequency, 3)
+    
+    def test_frequency_only_postings_gain_positions_later(self):
+        entry = IndexEntry("term")
+        entry.add_posting_freq(1, 3)
+        entry.add_posting_freq(4, 1)
+        self.assertIsNone(entry.pos_offsets)
+        
+        entry.add_postings(2, [5, 6])
+        self.assertEqual(list(entry.doc_ids), [1, 2, 4])
+        self.assertEqual(list(entry.get_positions(1)), [])
+        self.assertEqual(list(entry.get_positions(2)), [5, 6])
+        self.assertEqual(list(entry.pos_offsets), [0, 0, 2, 2])
+    
+    def test_dict_and_pickle_round_trip(self):
+        entry = IndexEntry("term", bm25_idf=1.25)
+        entry.add_postings(3, [2, 9])
+        entry.add_postings(0, [4])
+        
+        for copy in (IndexEntry.from_dict(entry.to_dict()), pickle.loads(pickle.dumps(entry))):
+            self.assertEqual(copy.to_dict(), entry.to_dict())
+            self.assertIsInstance(copy.doc_ids, array)
+            self.assertEqual(copy.doc_frequency, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
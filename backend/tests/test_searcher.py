@@ -0,0 +1,113 @@
+"""
+Searcher ke tests - MaxScore top_k_scores ka result poori BM25 ranking jaisa,
+aur BooleanRetriever.and_operation brute-force intersection jaisa.
+
+Backend directory se chalao:  python -m unittest discover tests
+"""
+
+import contextlib
+import heapq
+import io
+import random
+import unittest
+from unittest import mock
+
+import searcher
+from models import Document
+from searcher import BooleanRetriever, SearchEngine
+
+WORDS = [f"w{i}x" for i in range(15)]
+
+
+def _make_engine(count: int, seed: int) -> SearchEngine:
+    """Skewed vocabulary wale random documents se engine - kuch terms common, kuch rare."""
+    rng = random.Random(seed)
+    documents = [
+        Document(
+            doc_id=f"d{i}",
+            file_path=f"/corpus/d{i}.txt",
+            content=" ".join(
+                rng.choice(WORDS[:rng.randint(1, len(WORDS))])
+                for _ in range(rng.randint(1, 40))
+            )
+        )
+        for i in range(count)
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SearchEngine()
+        engine.build_index(documents)
+    return engine
+
+
+def _reference_top_k(engine: SearchEngine, query_terms, k):
+    """Saare documents score karke top-k (score descending, tie pe chhota ID pehle)."""
+    scores = engine.bm25_scorer.accumulate_scores(query_terms, engine.index)
+    return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+
+class TopKScoresTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = _make_engine(1500, seed=11)
+
+    def test_matches_exhaustive_ranking(self):
+        rng = random.Random(5)
+        scorer = self.engine.bm25_scorer
+        for _ in range(200):
+            query_terms = rng.sample(WORDS, rng.randint(1, 5))
+            k = rng.randint(1, 20)
+            got = scorer.top_k_scores(query_terms, self.engine.index, k)
+            expected = _reference_top_k(self.engine, query_terms, k)
+            self.assertEqual([doc_id for doc_id, _ in got], [doc_id for doc_id, _ in expected])
+            for (_, score), (_, reference) in zip(got, expected):
+                self.assertAlmostEqual(score, reference, places=9)
+
+    def test_k_larger_than_matches_returns_every_match(self):
+        scorer = self.engine.bm25_scorer
+        rare = min(WORDS, key=lambda term: self.engine.index.index[term].doc_frequency)
+        got = scorer.top_k_scores([rare], self.engine.index, 10_000)
+        self.assertEqual(len(got), self.engine.index.index[rare].doc_frequency)
+        self.assertEqual(got, _reference_top_k(self.engine, [rare], 10_000))
+
+    def test_empty_cases(self):
+        scorer = self.engine.bm25_scorer
+        self.assertEqual(scorer.top_k_scores(WORDS[:2], self.engine.index, 0), [])
+        self.assertEqual(scorer.top_k_scores(["missingterm"], self.engine.index, 5), [])
+
+
+class AndOperationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = _make_engine(1500, seed=3)
+        cls.doc_terms = {
+            doc_id: set(doc.tokens)
+            for doc_id, doc in cls.engine.index.get_documents(
+                range(cls.engine.index.metadata.total_documents)
+            ).items()
+        }
+
+    def _expected(self, terms):
+        return {doc_id for doc_id, tokens in self.doc_terms.items() if tokens.issuperset(terms)}
+
+    def _check(self, retriever):
+        rng = random.Random(9)
+        for _ in range(200):
+            terms = rng.sample(WORDS, rng.randint(1, 4))
+            self.assertEqual(set(retriever.and_operation(terms)), self._expected(terms))
+        self.assertEqual(set(retriever.and_operation([])), set())
+        self.assertEqual(set(retriever.and_operation([WORDS[0], "missingterm"])), set())
+
+    def test_set_path_matches_brute_force(self):
+        # Bisect (chhota driver) aur set-intersection dono branches chalti hain
+        with mock.patch.object(searcher, 'BitMap', None):
+            self._check(BooleanRetriever(self.engine.index))
+
+    @unittest.skipIf(searcher.BitMap is None, "pyroaring installed nahi hai")
+    def test_bitmap_path_matches_brute_force(self):
+        retriever = BooleanRetriever(self.engine.index)
+        self.assertIsInstance(retriever.and_operation(WORDS[:2]), searcher.BitMap)
+        self._check(retriever)
+
+
+if __name__ == '__main__':
+    unittest.main()
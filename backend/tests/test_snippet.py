@@ -0,0 +1,58 @@
+"""
+SearchResult snippet window ke tests - naya difference-array scan purane
+brute-force window scan jaisa hi start position deta hai.
+"""
+
+import random
+import unittest
+
+from models import SearchResult, _best_snippet_window
+
+
+def _reference_window(content_lower, query_terms, snippet_length, step=10):
+    """Purana scan: har window slice karke har term dhoondho, pehla best window."""
+    best_pos = 0
+    max_matches = 0
+    for i in range(0, len(content_lower) - snippet_length, step):
+        window = content_lower[i:i + snippet_length]
+        matches = sum(1 for term in query_terms if term.lower() in window)
+        if matches > max_matches:
+            max_matches = matches
+            best_pos = i
+    return best_pos
+
+
+class SnippetWindowTest(unittest.TestCase):
+    def test_matches_reference_scan(self):
+        rng = random.Random(7)
+        alphabet = "ab c"
+        for _ in range(2000):
+            content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 120)))
+            terms = [
+                "".join(rng.choice("abcAB") for _ in range(rng.randint(0, 4)))
+                for _ in range(rng.randint(0, 4))
+            ]
+            length = rng.randint(1, 40)
+            self.assertEqual(
+                _best_snippet_window(content, terms, length),
+                _reference_window(content, terms, length),
+                (content, terms, length)
+            )
+    
+    def test_generate_snippet_centres_on_matches(self):
+        content = ("filler text " * 30) + "python search engine" + (" more filler" * 30)
+        result = SearchResult(doc_id="d", title="t", file_path="/d", score=1.0)
+        result.generate_snippet(["python", "engine"], snippet_length=60, content=content)
+        
+        self.assertIn("python search engine", result.snippet)
+        self.assertTrue(result.snippet.startswith("..."))
+        self.assertTrue(result.snippet.endswith("..."))
+    
+    def test_generate_snippet_without_matches_starts_at_beginning(self):
+        result = SearchResult(doc_id="d", title="t", file_path="/d", score=1.0)
+        result.generate_snippet(["zzz"], snippet_length=10, content="abcdefghijklmnopqrstuvwxyz")
+        self.assertEqual(result.snippet, "abcdefghij...")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+web_search ke in-process TTL cache aur hedged GET ke tests - network calls
+fake client se.
+"""
+
+import json
+import threading
+import unittest
+from unittest import mock
+
+import web_search
+
+
+class _Response:
+    status_code = 200
+    
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+    
+    def json(self):
+        return json.loads(self.content)
+    
+    def close(self):
+        pass
+
+
+DUCK_PAYLOAD = {
+    'Abstract': 'abstract',
+    'Heading': 'heading',
+    'AbstractURL': 'https://example.org',
+    'RelatedTopics': [{'Text': f'topic {i} - more', 'FirstURL': f'u{i}'} for i in range(8)]
+}
+
+
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.urls = []
+        self.payload = DUCK_PAYLOAD
+        
+        def fake_get(url, **kwargs):
+            self.urls.append(url)
+            return _Response(self.payload)
+        
+        patches = [
+            mock.patch.object(web_search._client, 'get', fake_get),
+            mock.patch.object(web_search, 'HTTP_HEDGE_AFTER', None),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        web_search.search_duckduckgo.cache_clear()
+        web_search.search_wikipedia.cache_clear()
+    
+    def test_query_is_normalized_and_args_bound_with_defaults(self):
+        first = web_search.search_duckduckgo("Einstein")
+        same = [
+            web_search.search_duckduckgo("einstein "),
+            web_search.search_duckduckgo("EINSTEIN", 5),
+            web_search.search_duckduckgo(query=" einstein", max_results=5),
+        ]
+        self.assertEqual(len(self.urls), 1)
+        for result in same:
+            self.assertEqual(result, first)
+        
+        fewer = web_search.search_duckduckgo("einstein", max_results=3)
+        self.assertEqual(len(self.urls), 2)
+        self.assertEqual(len(fewer), 4)  # instant answer + 3 topics
+    
+    def test_callers_cannot_mutate_cached_list(self):
+        results = web_search.search_duckduckgo("q")
+        results.clear()
+        self.assertEqual(len(web_search.search_duckduckgo("q")), 6)
+        self.assertEqual(len(self.urls), 1)
+    
+    def test_empty_results_are_not_cached(self):
+        self.payload = {}
+        self.assertEqual(web_search.search_wikipedia("nothing"), None)
+        self.assertEqual(web_search.search_wikipedia("nothing"), None)
+        self.assertEqual(len(self.urls), 2)
+    
+    def test_entries_expire_after_ttl(self):
+        with mock.patch.object(web_search.time, 'monotonic', return_value=1000.0):
+            web_search.search_duckduckgo("q")
+        with mock.patch.object(
+            web_search.time, 'monotonic', return_value=1000.0 + web_search.WEB_CACHE_TTL - 1
+        ):
+            web_search.search_duckduckgo("q")
+        self.assertEqual(len(self.urls), 1)
+        with mock.patch.object(
+            web_search.time, 'monotonic', return_value=1000.0 + web_search.WEB_CACHE_TTL + 1
+        ):
+            web_search.search_duckduckgo("q")
+        self.assertEqual(len(self.urls), 2)
+    
+    def test_unknown_keyword_still_raises(self):
+        with self.assertRaises(TypeError):
+            web_search.search_duckduckgo("q", bogus=1)
+
+
+class _Named:
+    def __init__(self, name):
+        self.name = name
+        self.closed = threading.Event()
+    
+    def close(self):
+        self.closed.set()
+
+
+class HedgedGetTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.primary = None   # callable(url) -> response, primary client pe
+        self.hedge = None     # hedge client pe
+        
+        def primary_get(url, **kwargs):
+            self.calls.append(('primary', threading.current_thread().name))
+            return self.primary()
+        
+        def hedge_get(url, **kwargs):
+            self.calls.append(('hedge', threading.current_thread().name))
+            return self.hedge()
+        
+        patches = [
+            mock.patch.object(web_search._client, 'get', primary_get),
+            mock.patch.object(web_search._hedge_client, 'get', hedge_get),
+            mock.patch.object(web_search, 'HTTP_HEDGE_AFTER', 0.05),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def _slow(self, response, release, error=None):
+        def get():
+            release.wait(5)
+            if error is not None:
+                raise error
+            return response
+        return get
+    
+    def test_fast_primary_sends_no_hedge(self):
+        fast = _Named('fast')
+        self.primary = lambda: fast
+        self.assertIs(web_search._http_get('u'), fast)
+        self.assertEqual([who for who, _ in self.calls], ['primary'])
+    
+    def test_slow_primary_loses_to_hedge_and_is_closed(self):
+        release = threading.Event()
+        slow, fast = _Named('slow'), _Named('fast')
+        self.primary = self._slow(slow, release)
+        self.hedge = lambda: fast
+        
+        self.assertIs(web_search._http_get('u'), fast)
+        self.assertEqual([who for who, _ in self.calls], ['primary', 'hedge'])
+        
+        # Haari hui request ka response aate hi close hona chahiye
+        release.set()
+        self.assertTrue(slow.closed.wait(5))
+        self.assertFalse(fast.closed.is_set())
+    
+    def test_failed_primary_falls_back_to_hedge(self):
+        release = threading.Event()
+        fast = _Named('fast')
+        self.primary = self._slow(None, release, error=ValueError('primary down'))
+        
+        def hedge():
+            release.set()
+            return fast
+        self.hedge = hedge
+        
+        self.assertIs(web_search._http_get('u'), fast)
+    
+    def test_both_failing_raises(self):
+        release = threading.Event()
+        self.primary = self._slow(None, release, error=ValueError('primary down'))
+        
+        def hedge():
+            release.set()
+            raise ValueError('hedge down')
+        self.hedge = hedge
+        
+        with self.assertRaises(ValueError):
+            web_search._http_get('u')
+    
+    def test_full_pool_skips_hedging(self):
+        fast = _Named('fast')
+        self.primary = lambda: fast
+        with mock.patch.object(web_search, '_hedge_inflight', web_search.HTTP_POOL_SIZE):
+            self.assertIs(web_search._http_get('u'), fast)
+        # Pool bhara tha - GET caller ke apne thread mein hi chali
+        self.assertEqual(self.calls, [('primary', threading.current_thread().name)])
+
+
+if __name__ == "__main__":
+    unittest.main()
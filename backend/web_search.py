@@ -1,112 +1,456 @@
+import asyncio
+import atexit
+import functools
+import inspect
+import logging
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import quote_plus
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 
-def search_wikipedia(query: str) -> Optional[Dict]:
-    """Wikipedia se search karke answer fetch karta hai"""
+# httpx optional hai - install ho toh saari calls ek shared httpx.Client se
+# (keep-alive pool, h2 package ho toh HTTP/2), warna shared requests.Session se.
+# Dono surat mein connection reuse hota hai - har call pe naya TCP + TLS
+# handshake nahi
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson optional hai - ho toh response bodies seedha raw bytes se parse hote
+# hain (str decode step ke bina), warna client ka apna .json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pysimdjson optional hai - DuckDuckGo ke bade response se sirf kuch keys
+# chahiye, simdjson ka lazy document baaki fields ke Python objects banata hi nahi
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# brotli optional hai - ho toh 'br' bhi accept karte hain (JSON pe gzip se
+# chhota); requests/httpx dono isi package se br responses decompress karte hain
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Upstream APIs ka timeout (seconds)
+HTTP_TIMEOUT = 5
+
+# Connection pool size aur transient failures (429/5xx, connect errors) pe retries
+HTTP_POOL_SIZE = 20
+HTTP_RETRIES = 2
+
+# Itni der (seconds) mein response na aaye toh wahi request dobara (hedged)
+# bhejte hain aur jo pehle aaye woh lete hain - slow tail cut hoti hai.
+# None/0 = hedging off
+HTTP_HEDGE_AFTER = 0.25
+
+# Shared client ke default headers - compressed JSON maango, responses
+# client khud decompress karta hai
+HTTP_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
+    'User-Agent': 'sophon-search/1.0'
+}
+
+# Same query ke results itni der tak process ke andar cache rehte hain
+WEB_CACHE_SIZE = 1024
+WEB_CACHE_TTL = 600  # seconds
+
+
+def _make_client(retries: int = HTTP_RETRIES):
+    """Module-level HTTP client: httpx.Client (HTTP/2 jahan ho sake) ya requests.Session."""
+    if httpx is None:
+        session = requests.Session()
+        session.headers.update(HTTP_HEADERS)
+        # raise_on_status=False - retries khatam hone pe last response hi milta
+        # hai, callers status_code khud check karte hain
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        return session
+    
+    # httpx transport sirf connect failures retry karta hai (status pe nahi)
+    limits = httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
     try:
-        # Step 1: Search API se relevant page dhoondo
-        search_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query.replace(' ', '+')}&format=json&srlimit=1"
-        search_response = requests.get(search_url, timeout=5)
-        
-        if search_response.status_code != 200:
-            return None
-            
-        search_data = search_response.json()
-        search_results = search_data.get('query', {}).get('search', [])
-        
-        if not search_results:
+        transport = httpx.HTTPTransport(http2=True, limits=limits, retries=retries)
+    except ImportError:
+        # http2=True ke liye h2 package chahiye - na ho toh HTTP/1.1 keep-alive
+        transport = httpx.HTTPTransport(limits=limits, retries=retries)
+    return httpx.Client(timeout=HTTP_TIMEOUT, transport=transport, headers=HTTP_HEADERS)
+
+
+_client = _make_client()
+atexit.register(_client.close)
+
+# Hedge wali doosri request ka client - bina retries. Hedge khud hi retry hai;
+# dono pe retries hon toh ek logical GET 6 upstream requests tak ban jaata
+_hedge_client = _make_client(retries=0)
+atexit.register(_hedge_client.close)
+
+
+def _get_once(url: str, client=None):
+    """Shared client se GET - response pe status_code aur json() dono clients mein same hain."""
+    client = client or _client
+    if httpx is None:
+        return client.get(url, timeout=HTTP_TIMEOUT)
+    return client.get(url)
+
+
+# Upstream hosts jinke connections startup pe hi khol ke pool mein rakhte hain
+PREWARM_URLS = ('https://en.wikipedia.org/', 'https://api.duckduckgo.com/')
+
+# Hedged requests (aur prewarm) ke worker threads - callers khud threads mein hain (search_all,
+# try_search_many), yeh pool sirf upstream GETs chalata hai
+_hedge_pool = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix='web-hedge')
+
+# _hedge_pool mein abhi kitni GETs queued/chal rahi hain - pool bhara ho toh
+# hedging nahi (queue mein wait latency badhata, ghatata nahi)
+_hedge_inflight = 0
+_hedge_lock = threading.Lock()
+
+
+def _release_hedge_slot(_future) -> None:
+    global _hedge_inflight
+    with _hedge_lock:
+        _hedge_inflight -= 1
+
+
+def _submit_hedged(url: str, client):
+    """Pool mein jagah ho toh GET submit karke future, warna None."""
+    global _hedge_inflight
+    with _hedge_lock:
+        if _hedge_inflight >= HTTP_POOL_SIZE:
             return None
-            
-        # Pehla result lo
-        page_title = search_results[0]['title']
-        page_snippet = search_results[0]['snippet']  # HTML snippet
-        
-        # Step 2: Us page ka summary lo
-        summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{page_title.replace(' ', '_')}"
-        summary_response = requests.get(summary_url, timeout=5)
+        _hedge_inflight += 1
+    future = _hedge_pool.submit(_get_once, url, client)
+    future.add_done_callback(_release_hedge_slot)
+    return future
+
+
+def _close_response(future) -> None:
+    """Haari hui hedged request ka response band karo - connection pool mein wapas."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _http_get(url: str):
+    """
+    Hedged GET: HTTP_HEDGE_AFTER tak response na aaye toh doosri identical
+    request (bina retries) bhi bhejte hain, jo pehle successfully aaye woh
+    return. Haari hui request cancel hoti hai, ya chal chuki ho toh uska
+    response aate hi close. Dono fail hon tabhi exception. _hedge_pool bhara
+    ho toh hedging nahi - seedha caller ke thread mein ek GET.
+    """
+    if not HTTP_HEDGE_AFTER:
+        return _get_once(url)
+    
+    first = _submit_hedged(url, _client)
+    if first is None:
+        return _get_once(url)
+    done, _ = wait([first], timeout=HTTP_HEDGE_AFTER)
+    if done:
+        return first.result()
+    
+    second = _submit_hedged(url, _hedge_client)
+    if second is None:
+        return first.result()
+    
+    futures = (first, second)
+    error = None
+    for future in as_completed(futures):
+        try:
+            response = future.result()
+        except Exception as e:
+            error = e
+            continue
+        for other in futures:
+            if other is not future and not other.cancel():
+                other.add_done_callback(_close_response)
+        return response
+    raise error
+
+
+def _head_quietly(url: str) -> None:
+    """Chhoti HEAD request - sirf DNS + TCP + TLS setup ke liye, errors ignore"""
+    try:
+        _client.head(url, timeout=3)
+    except Exception:
+        pass
+
+
+def prewarm() -> None:
+    """
+    Har upstream host pe background mein ek HEAD - DNS, TCP aur TLS handshake
+    startup pe ho jata hai aur connection shared client ke pool mein reh jata
+    hai, toh pehli user query ko warm connection milta hai. Block nahi karta.
+    """
+    for url in PREWARM_URLS:
+        _hedge_pool.submit(_head_quietly, url)
+
+
+# simdjson.Parser thread-safe nahi hai (aur naya parse pichla document invalid
+# kar deta hai) - search_all calls threads mein chalti hain, isliye har thread
+# ka apna parser
+_parsers = threading.local()
+
+# JSON object ke types - simdjson ho toh lazy Object bhi (dict nahi hota)
+_JSON_OBJECTS = (dict,) if simdjson is None else (dict, simdjson.Object)
+
+
+def _lazy_json(response):
+    """
+    Response body ka lazy simdjson document (simdjson na ho toh _json).
+    Document isi thread ke agle parse tak hi valid hai - usse nikli values
+    (str/int) hi aage bhejni hain, document khud nahi.
+    """
+    if simdjson is None:
+        return _json(response)
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    return parser.parse(response.content)
+
+
+def _json(response):
+    """Response body ka JSON - orjson ho toh raw bytes se."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@dataclass(frozen=True, slots=True)
+class WikiResult:
+    """
+    Wikipedia answer record. Slots + frozen - per-result __dict__ nahi, aur
+    cache se bina copy ke share ho sakta hai. API boundary pe FastAPI ise
+    plain JSON object mein serialize karta hai (same keys).
+    """
+    title: str
+    extract: str
+    url: str
+    image: str = ''
+    source: str = 'wikipedia'
+
+
+@dataclass(frozen=True, slots=True)
+class WebResult:
+    """DuckDuckGo result record (instant answer ya related topic)."""
+    title: str
+    snippet: str
+    url: str
+    type: str = 'web_result'
+    source: str = 'duckduckgo'
+
+
+def _ttl_cache(func):
+    """
+    Decorator: (query.strip().lower(), baaki args) -> result, WEB_CACHE_TTL tak
+    LRU cache mein - "Einstein" aur "einstein " ek hi entry share karte hain.
+    Args signature se bind hote hain (defaults samet), toh search_duckduckgo(q),
+    (q, 5) aur (q, max_results=5) ek hi key hain.
+    Sirf non-empty results cache hote hain (error pe bhi None/[] aata hai, woh
+    agli baar dobara try hoga). Records frozen hain, lekin list mutable hai -
+    isliye list results tuple mein rakhte hain aur har hit pe nayi list milti
+    hai. search_all threads se call karta hai, isliye lock.
+    """
+    cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    lock = threading.Lock()
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        query, *rest = bound.arguments.values()
+        key = (query.strip().lower(), *rest)
+        now = time.monotonic()
+        with lock:
+            cached = cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    cache.move_to_end(key)
+                    value = cached[1]
+                    return list(value) if isinstance(value, tuple) else value
+                del cache[key]
         
-        if summary_response.status_code == 200:
-            data = summary_response.json()
-            return {
-                'source': 'wikipedia',
-                'title': data.get('title', page_title),
-                'extract': data.get('extract', page_snippet),
-                'url': data.get('content_urls', {}).get('desktop', {}).get('page', f'https://en.wikipedia.org/wiki/{page_title.replace(" ", "_")}'),
-                'image': data.get('thumbnail', {}).get('source', '')
-            }
-            
-    except Exception as e:
-        print(f"Wikipedia error: {e}")
+        result = func(*bound.args, **bound.kwargs)
+        if result:
+            with lock:
+                value = tuple(result) if isinstance(result, list) else result
+                cache[key] = (now + WEB_CACHE_TTL, value)
+                if len(cache) > WEB_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return result
     
-    return None
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
-def try_search(term: str) -> Optional[Dict]:
-    """Helper function to try a single search term"""
+def _wiki_query_url(term: str) -> str:
+    """
+    MediaWiki generator=search URL - top search hit ka intro extract,
+    thumbnail aur canonical URL ek hi response mein (alag summary call nahi).
+    """
+    return (
+        "https://en.wikipedia.org/w/api.php?action=query&generator=search"
+        f"&gsrsearch={quote_plus(term)}&gsrlimit=1"
+        "&prop=extracts|pageimages|info&exintro=1&explaintext=1"
+        "&piprop=thumbnail&pithumbsize=400&inprop=url"
+        "&format=json&formatversion=2"
+    )
+
+
+def _wiki_lookup(term: str, fallback_url: bool) -> Optional[WikiResult]:
+    """
+    search_wikipedia aur try_search ka shared core - ek MediaWiki call se top
+    hit ka WikiResult. URL response ka canonicalurl hai (title encode nahi
+    karna padta); woh na ho toh fallback_url=True pe pageid wala ?curid= URL,
+    warna ''.
+    """
     try:
-        search_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={term.replace(' ', '+')}&format=json&srlimit=1"
-        response = requests.get(search_url, timeout=5)
+        # Ek hi round trip: search + extract + thumbnail
+        response = _http_get(_wiki_query_url(term))
         
         if response.status_code != 200:
             return None
             
-        data = response.json()
-        results = data.get('query', {}).get('search', [])
+        data = _json(response)
+        # Koi hit na ho toh response mein 'query' key hi nahi hoti
+        query_data = data.get('query')
+        pages = query_data.get('pages') if query_data else None
         
-        if not results:
+        if not pages:
             return None
             
-        page_title = results[0]['title']
-        
-        # Summary fetch karo
-        summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{page_title.replace(' ', '_')}"
-        summary_response = requests.get(summary_url, timeout=5)
-        
-        if summary_response.status_code == 200:
-            data = summary_response.json()
-            return {
-                'source': 'wikipedia',
-                'title': data.get('title', page_title),
-                'extract': data.get('extract', ''),
-                'url': data.get('content_urls', {}).get('desktop', {}).get('page', ''),
-                'image': data.get('thumbnail', {}).get('source', '')
-            }
-    except:
+        # Pehla (aur akela) result lo
+        page = pages[0]
+        page_title = page['title']
+        thumbnail = page.get('thumbnail')
+        url = page.get('canonicalurl')
+        if url is None:
+            url = f"https://en.wikipedia.org/?curid={page['pageid']}" if fallback_url and 'pageid' in page else ''
+        return WikiResult(
+            title=page_title,
+            extract=page.get('extract', ''),
+            url=url,
+            image=thumbnail.get('source', '') if thumbnail else ''
+        )
+            
+    except Exception as e:
+        logger.warning("Wikipedia lookup failed for %r: %s", term, e)
+    
+    return None
+
+
+@_ttl_cache
+def search_wikipedia(query: str) -> Optional[WikiResult]:
+    """Wikipedia se search karke answer fetch karta hai"""
+    return _wiki_lookup(query, fallback_url=True)
+
+
+def try_search(term: str) -> Optional[WikiResult]:
+    """Helper function to try a single search term"""
+    return _wiki_lookup(term, fallback_url=False)
+
+
+def try_search_many(terms: List[str]) -> Optional[WikiResult]:
+    """
+    Kai alternative terms (synonyms, corrections) ek saath try karta hai -
+    latency sab ka sum nahi, jo pehle mile uska time. Pehla non-None result
+    return hota hai; baaki pending calls cancel, chal rahi calls ka wait nahi.
+    """
+    if not terms:
         return None
     
+    executor = ThreadPoolExecutor(max_workers=min(8, len(terms)))
+    try:
+        futures = [executor.submit(try_search, term) for term in terms]
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                return result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
     return None
 
-def search_duckduckgo(query: str, max_results: int = 5) -> List[Dict]:
+@_ttl_cache
+def search_duckduckgo(query: str, max_results: int = 5) -> List[WebResult]:
     """DuckDuckGo se web results fetch karta hai"""
     try:
-        url = f"https://api.duckduckgo.com/?q={query}&format=json&no_html=1&skip_disambig=1"
-        response = requests.get(url, timeout=5)
+        url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
+        response = _http_get(url)
         
         results = []
-        data = response.json()
+        # Lazy document - sirf padhi gayi keys ke Python objects bante hain
+        data = _lazy_json(response)
         
         # Instant answer
         if data.get('Abstract'):
-            results.append({
-                'source': 'duckduckgo',
-                'title': data.get('Heading', ''),
-                'snippet': data.get('Abstract', ''),
-                'url': data.get('AbstractURL', ''),
-                'type': 'instant_answer'
-            })
+            results.append(WebResult(
+                title=data.get('Heading', ''),
+                snippet=data.get('Abstract', ''),
+                url=data.get('AbstractURL', ''),
+                type='instant_answer'
+            ))
         
-        # Related topics
-        for topic in data.get('RelatedTopics', [])[:max_results]:
-            if isinstance(topic, dict) and 'Text' in topic:
-                results.append({
-                    'source': 'duckduckgo',
-                    'title': topic.get('Text', '').split(' - ')[0],
-                    'snippet': topic.get('Text', ''),
-                    'url': topic.get('FirstURL', ''),
-                    'type': 'web_result'
-                })
+        # Related topics - index se pehle max_results hi; simdjson pe har topic
+        # ke sirf Text/FirstURL padhe jaate hain (Icon, Result HTML, nested
+        # Topics groups kabhi Python objects nahi bante)
+        topics = data.get('RelatedTopics') or []
+        for i in range(min(len(topics), max_results)):
+            topic = topics[i]
+            if isinstance(topic, _JSON_OBJECTS) and 'Text' in topic:
+                text = topic['Text']
+                results.append(WebResult(
+                    title=text.split(' - ')[0],
+                    snippet=text,
+                    url=topic.get('FirstURL', '')
+                ))
         
         return results
     except Exception as e:
-        print(f"DuckDuckGo error: {e}")
-        return []
\ No newline at end of file
+        logger.warning("DuckDuckGo search failed for %r: %s", query, e)
+        return []
+
+
+async def search_all(query: str, max_results: int = 5) -> Dict:
+    """
+    Wikipedia aur DuckDuckGo dono ek saath (concurrently) - latency dono ka
+    sum nahi, max hoti hai. Dono functions blocking hain, isliye worker threads
+    mein chalte hain aur event loop free rehta hai.
+    
+    Returns:
+        {'wikipedia': Optional[WikiResult], 'web_results': List[WebResult]}
+    """
+    wiki, web = await asyncio.gather(
+        asyncio.to_thread(search_wikipedia, query),
+        asyncio.to_thread(search_duckduckgo, query, max_results)
+    )
+    return {
+        'wikipedia': wiki,
+        'web_results': web or []
+    }